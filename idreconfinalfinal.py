@@ -6,30 +6,1010 @@ import json
 import base64
 import io
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import bisect
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
+from collections import OrderedDict
 import multiprocessing as mp
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
+from types import MappingProxyType
 import logging
-from fuzzywuzzy import fuzz
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import tempfile
-from pathlib import Path
-import hashlib
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 import traceback
 import os
-import platform
-import subprocess
-import webbrowser
+import hashlib
 import flet as ft
 import re
+import importlib.util
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefer the Rust-based calamine reader for Excel files when it is installed;
+# None lets pandas fall back to its default engine (openpyxl)
+_EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else None
+# Likewise xlsxwriter for writing reports, which is considerably faster than openpyxl
+_EXCEL_WRITER_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else None
+
+# Arrow-backed strings run the .str cleanup in Arrow compute kernels; plain str keeps object dtype
+_STRING_DTYPE = 'string[pyarrow]' if importlib.util.find_spec('pyarrow') else str
+
+# Insurer-specific sheet name mapping
+_SHEET_MAPPING = MappingProxyType({
+    'RELIANCE': 'Sheet1',
+    'SBI': 'Sheet1',
+    'RAHEJA': 'Raw',
+    'TATA': 'Sheet1',
+    'ZUNO': 'Sheet1',
+    'UNITED': 'Sheet1',
+    'DIGIT': 'Sheet1',
+    'SOMPO': 'Sheet1',
+    'MAGMA': 'Sheet1',
+    'SHRIRAM': 'GNRDUMP31MAY2025-GNRDUMP"DDMonthYYYY"',
+    'ROYAL_SUNDARAM': 'Sheet1',
+    'ORIENTAL': 'Sheet1',
+    'NATIONAL': 'SheetName',
+    'LIBERTY': 'Sheet1',
+    'KOTAK': ['Sheet1', 'Sheet3'],  # Can be either Sheet1 or Sheet3
+    'IFFCO': 'Digital',
+    'ICICI': 'Sheet1',
+    'HDFC': 'Sheet1',
+    'FGI': 'Sheet1',  # FGI = Future Generali Insurance
+    'CHOLA': 'Sheet1',
+    'BAJAJ': ['New', 'New Business']  # Bajaj uses "New" sheet, fallback to "New Business"
+})
+
+# Old to New column mappings - for converting old database format to new format
+_OLD_TO_NEW_MAPPINGS = MappingProxyType({
+    'Insurance Company': 'Insurance Company',
+    'PolicyNumber': 'Policy Number',  # Note: space added in new format
+    'Registration Number': 'Registration Number',
+    'Request Id': 'Request Id',
+    'Booked Time Stamp': 'Booked Time Stamp',
+    'Policy Status': 'Policy Status',
+    'Booking Type': 'Booking Type',
+    'Ticket Type': 'Ticket Type',
+    'Policy Source': 'Policy Source',
+    'Policy Sub Source': 'Policy Sub Source',
+    'Assigned to': 'Assigned to',
+    'Payment Pickup Status': 'Payment Pickup Status',
+    'Payment Clearance Status': 'Payment Clearance Status',
+    'Case Type': 'Case Type',
+    'Policy Type': 'Policy Type',
+    'Policy Medium': 'Policy Medium',
+    'Vehicle Sub Usage Type': 'Vehicle Sub Usage Type',
+    'Vehicle Category': 'Vehicle Category',
+    'Vehicle Sub Category': 'Vehicle Sub Category',
+    'Vehicle Name': 'Vehicle Name',
+    'Fuel Type': 'Fuel Type',
+    'Engine Number': 'Engine Number',
+    'Chassis No.': 'Chassis No.',
+    'Gross Weight': 'Gross Weight',
+    'Dealership Type': 'Dealership Type',
+    'GCD Code': 'GCD Code',
+    'Dealer Name': 'Dealer Name',
+    'Dealer City': 'Dealer City',
+    'Payment Mode': 'Payment Mode',
+    'Premium': 'Premium',
+    'Final Od Premium': 'Final Od Premium',
+    'Final TP Premium': 'Final TP Premium',
+    'Previous Policy Number': 'Previous Policy Number',
+    'Policy Start Date': 'Policy Start Date',
+    'Policy End Date': 'Policy End Date',
+    'Policy Tenure': 'Policy Tenure',
+    'CPA Cover Premium': 'CPA Cover Premium',
+    'Customer Name': 'Customer Name',
+    'Broker Name': 'Broker Name',
+    'Created By': 'Created By',
+    'Booked By': 'Booked By',
+    'cKYC Number': 'cKYC Number',
+    'Seating Capacity': 'Seating Capacity',
+    'Business Manager (DSA)': 'Business Manager (DSA)',
+    'Area Manager (DSA)': 'Area Manager (DSA)',
+    'State Head (DSA)': 'State Head (DSA)',
+    'Regional Head (DSA)': 'Regional Head (DSA)',
+    'Zonal Head (DSA)': 'Zonal Head (DSA)',
+    'Senior Relationship Manager (DSA)': 'Senior Relationship Manager (DSA)',
+    'National Head (DSA)': 'National Head (DSA)',
+    'Engine Cubic Capacity': 'Engine Cubic Capacity',
+})
+
+# Column mappings for each insurer
+_COLUMN_MAPPINGS = MappingProxyType({
+    'SHRIRAM': {
+        'policy_number': 'S_POLICYNO',
+        'customer_name': 'S_INSUREDNAME',
+        'policy_start_date': 'S_DOI',
+        'policy_end_date': 'S_DOE',
+        'registration_number': 'S_VEH_REG_NO',
+        'engine_number': 'S_ENGNO',
+        'chassis_number': 'S_CHNO',
+        'total_premium': 'S_NET',
+        'tp_premium': 'S_TP_TOTAL',
+        'previous_policy_number': 'S_PREVIOUS_POL_NO',
+        'broker_name': 'S_SOURCENAME',
+        'broker_code': None,
+        'sum_insured': None,
+        'vehicle_make': 'S_MAKE_DESC',
+        'vehicle_model': 'S_VEH_MODEL',
+        'fuel_type': 'S_VEHFUEL_DESC',
+        'gvw': 'S_GVW',
+        'seating_capacity': 'S_VEH_SC',
+        'ncb_percentage': 'S_NCB_PERCENTAGE',
+        'manufacturing_year': None,
+        'engine_cubic_capacity': 'S_VEH_CC',
+    },
+    'RELIANCE': {
+        'policy_number': 'PolicyNo',
+        'customer_name': 'CustomerName',
+        'policy_start_date': 'PolicyStartDate',
+        'policy_end_date': 'PolicyEndDate',
+        'registration_number': 'VechileNo',
+        'engine_number': 'EngineNo',
+        'chassis_number': 'ChassisNo',
+        'total_premium': 'GrossPremium',
+        'tp_premium': 'TpPremium',
+        'previous_policy_number': 'Previous Policy No',
+        'broker_name': 'IMDName',
+        'broker_code': 'IMDCode',
+        'sum_insured': 'SumInsured',
+        'vehicle_make': 'Make',
+        'vehicle_model': 'Model',
+        'fuel_type': 'FuelType',
+        'gvw': 'GVW',
+        'seating_capacity': 'SeatingCapacity',
+        'ncb_percentage': 'NCB',
+        'manufacturing_year': 'YearOfManufacture',
+        'engine_cubic_capacity': 'CC',
+    },
+    'ROYAL': {
+        'policy_number': 'Policy No',
+        'customer_name': 'Client Full Name',
+        'policy_start_date': 'Inception Date',
+        'policy_end_date': 'Expiry Date',
+        'registration_number': 'Reg No',
+        'engine_number': 'Engine No',
+        'chassis_number': 'Chasis No',
+        'total_premium': 'Client Premium',
+        'tp_premium': 'TP Premium',
+        'previous_policy_number': 'Previous Policy No',
+        'broker_name': 'Agent Name',
+        'broker_code': 'Agent Code',
+        'sum_insured': 'Incremental SI',
+        'vehicle_make': 'Make',
+        'vehicle_model': 'Mfr_Model_GWP',
+        'fuel_type': 'Fuel_Type',
+        'gvw': 'GVW_Ton',
+        'seating_capacity': 'SeatingCapacity',
+        'ncb_percentage': 'NCB_Rate',
+        'manufacturing_year': 'Year of Manufacturing',
+        'engine_cubic_capacity': 'Cubic_Capcity',
+    },
+    'SBI': {
+        'policy_number': ['PolicyNo'],
+        'customer_name': 'CustomerName',
+        'policy_start_date': 'PolicyStartDate',
+        'policy_end_date': 'PolicyEndDate',
+        'registration_number': None,
+        'engine_number': None,
+        'chassis_number': None,
+        'total_premium': ['FinalPremium', 'GWP LACS', 'GWP Lacs','Gross Written Premium'],
+        'tp_premium': None,
+        'previous_policy_number': None,
+        'broker_name': ['IMD name', 'IMDName', 'Channel_Name'],
+        'broker_code': 'IMDCode',
+        'sum_insured': None,
+        'vehicle_make': 'MakeModel',
+        'vehicle_model': ['Product_Name', 'ProductName'],
+        'fuel_type': None,
+        'gvw': None,
+        'seating_capacity': None,
+        'ncb_percentage': None,
+        'manufacturing_year': None,
+        'engine_cubic_capacity': None
+    },
+    'ICICI': {
+        'policy_number': 'POL_NUM_TXT',
+        'customer_name': 'CUSTOMER_NAME',
+        'policy_start_date': 'POL_START_DATE',
+        'policy_end_date': 'POL_END_DATE',
+        'registration_number': 'MOTOR_REGISTRATION_NUM',
+        'engine_number': 'VEH_ENGINENO',
+        'chassis_number': 'VEH_CHASSISNO',
+        'total_premium': 'TOTAL_GROSS_PREMIUM',
+        'tp_premium': 'MOTOR_TP_PREMIUM_AMT',
+        'previous_policy_number': 'XC_PREV_POL_NO',
+        'broker_name': 'AGENT_NAME',
+        'broker_code': 'CHILD_ID',
+        'sum_insured': 'POL_TOT_SUM_INSURED_AMT',
+        'vehicle_make': 'MANUFACTURER_NAME',
+        'vehicle_model': 'MODEL_NAME',
+        'fuel_type': 'XC_FUEL_TYPE',
+        'gvw': 'POL_GVW',
+        'seating_capacity': 'XC_POL_SEATING_CAPACITY',
+        'ncb_percentage': 'XC_POL_NCB_PCT',
+        'manufacturing_year': 'MOTOR_MANUFACTURER_YEAR',
+        'engine_cubic_capacity': 'MOTOR_ENGINE_CC',
+    },
+    'NATIONAL': {
+        'policy_number': ['Policy Number', 'policy No'],
+        'customer_name': 'Customer Name',
+        'policy_start_date': 'Policy Effective Date',
+        'policy_end_date': 'Policy Expiry Date',
+        'registration_number': 'Vehicle Registration Number',
+        'engine_number': None,
+        'chassis_number': None,
+        'total_premium': 'Premium',
+        'tp_premium': None,
+        'previous_policy_number': None,
+        'broker_name': 'POSP Name',
+        'broker_code': 'POSP Code',
+        'sum_insured': None,
+        'vehicle_make': 'Make',
+        'vehicle_model': 'Model',
+        'fuel_type': 'Fuel Type',
+        'gvw': 'Gross Vehicle Weight',
+        'seating_capacity': 'Seating Capacity',
+        'ncb_percentage': 'NCB Percentage',
+        'manufacturing_year': 'Manufacturing Year',
+        'engine_cubic_capacity': 'Engine Cubic Capacity',
+    },
+    'DIGIT': {
+        'policy_number': ['POLICY_NUMBER','Policy_Number'],
+        'customer_name': 'INSURED_PERSON',
+        'policy_start_date': 'RISK_INC_DATE',
+        'policy_end_date': 'RISK_EXP_DATE',
+        'registration_number': 'VEH_REG_NO',
+        'engine_number': 'ENGINE_NO',
+        'chassis_number': 'CHASSIS_NO',
+        'total_premium': 'GROSS_PREMIUM',
+        'tp_premium': 'TP_PREMIUM',
+        'previous_policy_number': 'PREV_POLICY_NO',
+        'broker_name': 'IMD_NAME',
+        'broker_code': None,
+        'sum_insured': 'SUM_INSURED',
+        'vehicle_make': 'VEHICLE_MAKE',
+        'vehicle_model': 'VEHICLE_MODEL',
+        'fuel_type': 'FUEL_TYPE',
+        'gvw': 'VEH_GVW',
+        'seating_capacity': 'VEH_SEATING',
+        'ncb_percentage': 'CURR_NCB',
+        'manufacturing_year': 'VEHICLE_MANF_YEAR',
+        'engine_cubic_capacity': 'VEH_CC',
+    },
+    'MAGMA': {
+        'policy_number': 'PolicyNo',
+        'customer_name': 'CustomerName',
+        'policy_start_date': 'RiskStartDate',
+        'policy_end_date': 'RiskEndDate',
+        'registration_number': 'RegistrationNumber',
+        'engine_number': 'EngineNumber',
+        'chassis_number': 'ChassisNumber',
+        'total_premium': 'PremiumAmount',
+        'tp_premium': None,
+        'previous_policy_number': 'PreviousYearPolicyNumber',
+        'broker_name': 'AgentName',
+        'broker_code': 'AgentCode',
+        'sum_insured': None,
+        'vehicle_make': None,
+        'vehicle_model': 'ProductDesc',
+        'fuel_type': None,
+        'gvw': None,
+        'seating_capacity': None,
+        'ncb_percentage': None,
+        'manufacturing_year': None,
+        'engine_cubic_capacity': None,
+    },
+    'UNIVERSAL': {
+        'policy_number': ['POLICY NO CHAR', 'USGIpos Policy Number','POLICY NO'],
+        'customer_name': 'INSURED NAME',
+        'policy_start_date': 'START DATE',
+        'policy_end_date': 'EXPIRY DATE',
+        'registration_number': 'MTOR Registration No',
+        'engine_number': None,
+        'chassis_number': None,
+        'total_premium': 'GROSS PREMIUM',
+        'tp_premium': 'TOTAL TP PREMIUM',
+        'previous_policy_number': 'Previous Yr Policy',
+        'broker_name': 'INTERMEDIARY',
+        'broker_code': 'INTERMEDIARY CODE',
+        'sum_insured': 'TOTAL SUM INSURED',
+        'vehicle_make': 'MAKE',
+        'vehicle_model': 'MODEL',
+        'fuel_type': None,
+        'gvw': 'Gvw',
+        'seating_capacity': 'Vehicle Seating Capacity',
+        'ncb_percentage': 'NCB',
+        'manufacturing_year': 'YEAR OF MANUFACTURING',
+        'engine_cubic_capacity': None,
+    },
+    'UNITED': {
+        'policy_number': 'Policy Number',
+        'customer_name': 'Insured Name',
+        'policy_start_date': 'Effect Date',
+        'policy_end_date': 'Expiry Date',
+        'registration_number': 'Registration Number',
+        'engine_number': 'Engine Number',
+        'chassis_number': 'Chassis Number',
+        'total_premium': 'company_wise_own_share_premium_total',
+        'tp_premium': 'TP Premium',
+        'previous_policy_number': None,
+        'broker_name': None,
+        'broker_code': 'Agent/Br.Cd',
+        'sum_insured': 'Sum Insured',
+        'vehicle_make': None,
+        'vehicle_model': None,
+        'fuel_type': None,
+        'gvw': 'NUM_GVW',
+        'seating_capacity': None,
+        'ncb_percentage': None,
+        'manufacturing_year': None,
+        'engine_cubic_capacity': None,
+    },
+    'FGI': {
+        'policy_number': 'Policy Number',
+        'customer_name': 'Customer Name',
+        'policy_start_date': 'Transaction',
+        'policy_end_date': 'Policy Expiry Date',
+        'registration_number': 'Registration Number',
+        'engine_number': None,
+        'chassis_number': None,
+        'total_premium': 'Final Premium',
+        'tp_premium': None,
+        'previous_policy_number': None,
+        'broker_name': None,
+        'broker_code': 'Agent Code',
+        'sum_insured': None,
+        'vehicle_make': 'Make',
+        'vehicle_model': 'Model',
+        'fuel_type': 'Fueal Type',
+        'gvw': 'GVW',
+        'seating_capacity': 'Seating Capacity',
+        'ncb_percentage': None,
+        'manufacturing_year': 'Year Of Manufacturing',
+        'engine_cubic_capacity': 'Cubic Capacity',
+    },
+    'SOMPO': {
+        'policy_number': ['NUM_POLCIY_NO', 'POLICY_NO_CHAR', 'ILPOS_POLICY_NUMBER'],
+        'customer_name': 'INSURED_NAME',
+        'policy_start_date': 'START_DATE',
+        'policy_end_date': 'EXPIRY_DATE',
+        'registration_number': 'MOTOR_REGISTRATION_NO',
+        'engine_number': 'ENGINE_NO',
+        'chassis_number': 'CHASSIS_NO',
+        'total_premium': 'GROSS_PREMIUM',
+        'tp_premium': 'TOTAL_TP_PREMIUM',
+        'previous_policy_number': 'PREVIOUS_POLICY_NUMBER',
+        'broker_name': 'INTERMEDIARY',
+        'broker_code': 'INTERMEDIARY_CODE',
+        'sum_insured': 'TOTAL_SI',
+        'vehicle_make': 'MAKE',
+        'vehicle_model': 'MODEL',
+        'fuel_type': 'FUEL_TYPE',
+        'gvw': 'GVW',
+        'seating_capacity': 'VEHICLE_SEATING_CAPACITY',
+        'ncb_percentage': 'NCB_PERCENTAGE',
+        'manufacturing_year': 'YR_OF_MANUFACTURING',
+        'engine_cubic_capacity': 'CUBIC_CAPACITY',
+    },
+    'BAJAJ': {
+        'policy_number': ['PolicyNo','P Policy Number'],
+        'customer_name': ['CustomerName', 'Partner Desc'],
+        'policy_start_date': 'Risk Start Date',
+        'policy_end_date': 'Risk End Date',
+        'registration_number': 'RegistrationNumber',
+        'engine_number': 'EngineNumber',
+        'chassis_number': 'ChassisNumber',
+        'total_premium': ['R Rnwd Gross Prem', 'Gross Premium'],
+        'tp_premium': 'R Rnwd Tp Prem',
+        'previous_policy_number': 'Previous Year Policy Number',
+        'broker_name': 'AgentName',
+        'broker_code': 'AgentCode',
+        'sum_insured': 'R Rnwd Sum Insured',
+        'vehicle_make': None,
+        'vehicle_model': 'Product Desc',
+        'fuel_type': None,
+        'gvw': None,
+        'seating_capacity': None,
+        'ncb_percentage': None,
+        'manufacturing_year': None,
+        'engine_cubic_capacity': None,
+    },
+    'CHOLA': {
+        'policy_number': 'Policy No',
+        'customer_name': 'Customer name',
+        'policy_start_date': 'RSD',
+        'policy_end_date': 'RED',
+        'registration_number': 'Regist_NO',
+        'engine_number': 'Engine No',
+        'chassis_number': 'Chassis No',
+        'total_premium': 'Gross Premium',
+        'tp_premium': 'Third Party liability',
+        'previous_policy_number': 'PREVIOUS_POLICY_NUMBER',
+        'broker_name': 'Agent Name',
+        'broker_code': 'Agent Code',
+        'sum_insured': 'Total IDV',
+        'vehicle_make': 'Make',
+        'vehicle_model': 'Model',
+        'fuel_type': 'Fuel Type',
+        'gvw': 'GROSS_VEHICLE_WEIGHT',
+        'seating_capacity': 'TOTAL_SEATING_CAPACITY',
+        'ncb_percentage': 'NCB_PERCENT',
+        'manufacturing_year': 'MFG Year',
+        'engine_cubic_capacity': 'CUBIC_CAPACITY',
+    },
+    'HDFC': {
+        'policy_number': 'Policy No',
+        'customer_name': 'Customer Name',
+        'policy_start_date': 'Start Date',
+        'policy_end_date': 'End Date',
+        'registration_number': 'POL_MOT_VEH_REGISTRATION_NUM',
+        'engine_number': 'ENGINE NUM',
+        'chassis_number': 'CHASSIS NUM',
+        'total_premium': 'Total GWP',
+        'tp_premium': 'TP',
+        'previous_policy_number': 'Previous Policy No',
+        'broker_name': 'Agent Name',
+        'broker_code': 'Agent Code',
+        'sum_insured': 'Sum Insured',
+        'vehicle_make': 'POL_MOT_MANUFACTURER_NAME',
+        'vehicle_model': 'POL_MOT_MODEL_NAME',
+        'fuel_type': 'POL_FUEL_TYPE',
+        'gvw': 'POL_GROSS_VEH_WT',
+        'seating_capacity': None,
+        'ncb_percentage': 'NCB',
+        'manufacturing_year': 'POL_MOT_MANUFACTURER_YEAR',
+        'engine_cubic_capacity': None,
+    },
+    'IFFCO': {
+        'policy_number': 'P400 policy',
+        'customer_name': ['First Name', 'Last Name'],
+        'policy_start_date': 'Inceptiondate',
+        'policy_end_date': 'Expirydate',
+        'registration_number': 'Registration No',
+        'engine_number': None,
+        'chassis_number': None,
+        'total_premium': 'Total Premium after discount/loading',
+        'tp_premium': 'TP Gross Premium',
+        'previous_policy_number': 'PreviousInsurerPolicy Number',
+        'broker_name': None,
+        'broker_code': 'AgentNo',
+        'sum_insured': 'Total Sum Insured',
+        'vehicle_make': 'Make',
+        'vehicle_model': 'Model',
+        'fuel_type': 'Fuel Type',
+        'gvw': 'GVW',
+        'seating_capacity': 'Carrying Capacity',
+        'ncb_percentage': 'NCB',
+        'manufacturing_year': 'Year',
+        'engine_cubic_capacity': 'Cubic Capacity',
+    },
+    'KOTAK': {
+        'policy_number': 'POLICY NO',
+        'customer_name': 'CUSTOMER NAME',
+        'policy_start_date': 'POLICY INCEPTION DATE',
+        'policy_end_date': 'POLICY EXPIRY DATE',
+        'registration_number': 'Registration Number',
+        'engine_number': 'Engine Number',
+        'chassis_number': 'Chassis Number',
+        'total_premium': 'GWP',
+        'tp_premium': 'ALL OTHER TP COVER PREMIUM',
+        'previous_policy_number': None,
+        'broker_name': 'IMD NAME',
+        'broker_code': 'IMD CODE',
+        'sum_insured': 'SYSTEMIDV',
+        'vehicle_make': 'VehicleMake',
+        'vehicle_model': 'VehicleModel',
+        'fuel_type': 'FuelType',
+        'gvw': 'VehicleWeight',
+        'seating_capacity': None,
+        'ncb_percentage': 'NCB',
+        'manufacturing_year': 'ManufacturerYear',
+        'engine_cubic_capacity': 'VehicleCC',
+    },
+    'RAHEJA': {
+        'policy_number': 'P400 Pol No.',
+        'customer_name': 'CompanyName',
+        'policy_start_date': 'policy_start_date',
+        'policy_end_date': 'Expiry date',
+        'registration_number': 'reg_no',
+        'engine_number': 'engine_no',
+        'chassis_number': 'chasis_no',
+        'total_premium': 'final_premium',
+        'tp_premium': 'TP Premium',
+        'previous_policy_number': None,
+        'broker_name': 'IMD Name',
+        'broker_code': 'IMD Code',
+        'sum_insured': None,
+        'vehicle_make': None,
+        'vehicle_model': 'Sub_Product',
+        'fuel_type': None,
+        'gvw': None,
+        'seating_capacity': None,
+        'ncb_percentage': None,
+        'manufacturing_year': None,
+        'engine_cubic_capacity': None,
+    },
+    'TATA': {
+        'policy_number': 'policy_no',
+        'customer_name': 'clientname',
+        'policy_start_date': 'pol_incept_date',
+        'policy_end_date': 'pol_exp_date',
+        'registration_number': 'registration_no',
+        'engine_number': 'veh_engine_no',
+        'chassis_number': 'veh_chassis_no',
+        'total_premium': 'total_premium',
+        'tp_premium': 'basictp',
+        'previous_policy_number': None,
+        'broker_name': 'producername',
+        'broker_code': 'producer_cd',
+        'sum_insured': 'vehicleidv',
+        'vehicle_make': 'veh_make',
+        'vehicle_model': 'veh_model',
+        'fuel_type': 'fuel_type',
+        'gvw': 'veh_gr_wgt_cnt',
+        'seating_capacity': 'seat_cap_cnt',
+        'ncb_percentage': 'ncb_perctg',
+        'manufacturing_year': 'mfg_year',
+        'engine_cubic_capacity': 'kw_cc_no',
+    },
+    'ZUNO': {
+        'policy_number': 'Policy_Number',
+        'customer_name': 'Policy_Holder_Name',
+        'policy_start_date': 'Policy_Start_Date',
+        'policy_end_date': 'Policy_End_Date',
+        'registration_number': 'Registration No',
+        'engine_number': 'Engine No',
+        'chassis_number': 'chasis No',
+        'total_premium': 'Gross_Premium_Total',
+        'tp_premium': 'Motor TP Premium',
+        'previous_policy_number': 'Previous_Policy_No',
+        'broker_name': 'Intermediary_Name',
+        'broker_code': 'Intermediary_Code',
+        'sum_insured': 'NUM_IDV',
+        'vehicle_make': 'Make Code',
+        'vehicle_model': 'Model Code',
+        'fuel_type': 'Type of Fuel',
+        'gvw': 'GVW',
+        'seating_capacity': 'Capacity Type',
+        'ncb_percentage': 'NCB_Percentage',
+        'manufacturing_year': 'Manufacturing Year',
+        'engine_cubic_capacity': 'Num_PCC CC',
+    },
+    'LIBERTY': {
+        'policy_number': 'Policy No.',
+        'customer_name': 'Insured Name',
+        'policy_start_date': 'Policy Start Date',
+        'policy_end_date': 'Policy End Date',
+        'registration_number': 'Veh Reg No',
+        'engine_number': 'Engine NO',
+        'chassis_number': 'Chassis NO',
+        'total_premium': 'Net Premium',
+        'tp_premium': 'Net TP Premium / War & SRCC',
+        'previous_policy_number': 'Previous Policy No.',
+        'broker_name': 'Agent/ Broker Name',
+        'broker_code': 'Agent/ Broker Code',
+        'sum_insured': 'Sum Insured',
+        'vehicle_make': 'Make Name',
+        'vehicle_model': 'Model Name',
+        'fuel_type': 'Fuel Type',
+        'gvw': None,
+        'seating_capacity': None,
+        'ncb_percentage': 'Current Year NCB (%)',
+        'manufacturing_year': None,
+        'engine_cubic_capacity': 'Cubic Capacity',
+    },
+    'ORIENTAL': {
+        'policy_number': 'POLICY NO',
+        'customer_name': None,
+        'policy_start_date': None,
+        'policy_end_date': None,
+        'registration_number': None,
+        'engine_number': None,
+        'chassis_number': None,
+        'total_premium': 'PREMIUM',
+        'tp_premium': None,
+        'previous_policy_number': None,
+        'broker_name': None,
+        'broker_code': None,
+        'sum_insured': None,
+        'vehicle_make': None,
+        'vehicle_model': None,
+        'fuel_type': None,
+        'gvw': None,
+        'seating_capacity': None,
+        'ncb_percentage': None,
+        'manufacturing_year': None,
+        'engine_cubic_capacity': None,
+    },
+})
+
+# Internal dataset column mapping (new database columns)
+_INTERNAL_COLUMNS = MappingProxyType({
+    'policy_number': 'Policy Number',
+    'customer_name': 'Customer Name',
+    'registration_number': 'Registration Number',
+    'engine_number': 'Engine Number',
+    'chassis_number': 'Chassis No.',
+    'fuel_type': 'Fuel Type',
+    'vehicle_name': 'Vehicle Name',
+    'vehicle_sub_category': 'Vehicle Sub Category',
+    'total_premium': 'Premium',
+    'tp_premium': 'Final TP Premium',
+    'policy_start_date': 'Policy Start Date',
+    'policy_end_date': 'Policy End Date',
+    'previous_policy_number': 'Previous Policy Number',
+    'broker_name': 'Broker Name',
+    'seating_capacity': 'Seating Capacity',
+    'insurance_company': 'Insurance Company',
+    'gvw': 'Gross Weight Category',
+    'engine_cubic_capacity': 'Engine Cubic Capacity',
+    'policy_type': 'Policy Type',
+})
+
+# Filename keywords identifying the insurer of an uploaded MIS file, as
+# (pattern, insurer) pairs in priority order - the first pattern found wins
+_FILENAME_INSURER_PATTERNS = tuple(
+    (pattern, insurer)
+    for insurer, patterns in {
+        'DIGIT': ['DIGIT'], 'LIBERTY': ['LIBERTY'], 'MAGMA': ['MAGMA'], 'NATIONAL': ['NATIONAL'],
+        'UNITED': ['UNITED'], 'SHRIRAM': ['SHRIRAM'], 'ICICI': ['ICICI'], 'IFFCO': ['IFFCO'],
+        'BAJAJ': ['BAJAJ'], 'SBI': ['SBI'], 'RELIANCE': ['RELIANCE'], 'TATA': ['TATA'], 'HDFC': ['HDFC'],
+        'KOTAK': ['KOTAK'], 'ROYAL': ['ROYAL'], 'CHOLA': ['CHOLA'],
+        'FGI': ['FGI'], 'ZUNO': ['ZUNO'], 'UNIVERSAL': ['UNIVERSAL', 'SOMPO'],
+        'NEW_INDIA': ['NEW_INDIA', 'NEWINDIA'], 'ORIENTAL': ['ORIENTAL'], 'RAHEJA': ['RAHEJA']
+    }.items()
+    for pattern in patterns
+)
+
+# One scan finds every pattern occurrence (the lookahead lets matches overlap); the
+# earliest-listed pattern found anywhere in the name wins, as with per-pattern checks
+_RE_FILENAME_INSURER = re.compile('(?=(' + '|'.join(re.escape(pattern) for pattern, _ in _FILENAME_INSURER_PATTERNS) + '))')
+_FILENAME_PATTERN_RANKS = {pattern: (rank, insurer) for rank, (pattern, insurer) in enumerate(_FILENAME_INSURER_PATTERNS)}
+
+def _detect_filename_insurer(filename):
+    """Insurer key for an uploaded MIS file name, or None"""
+    ranked = [_FILENAME_PATTERN_RANKS[match.group(1)] for match in _RE_FILENAME_INSURER.finditer(filename.upper())]
+    return min(ranked)[1] if ranked else None
+
+# Company-name keywords checked before the per-insurer name variations, in priority order
+_COMPANY_INSURER_KEYWORDS = (
+    ('DIGIT', 'DIGIT'), ('LIBERTY', 'LIBERTY'), ('MAGMA', 'MAGMA'), ('NATIONAL', 'NATIONAL'),
+    ('UNITED', 'UNITED'), ('SHRIRAM', 'SHRIRAM'), ('FGI', 'FGI'), ('CHOLA', 'CHOLA'), ('HDFC', 'HDFC'),
+)
+
+# Structured identifiers are compared exactly after normalization; only free-text
+# name fields are fuzzy-scored
+_EXACT_FIELDS = frozenset({'policy_number', 'registration_number', 'engine_number', 'chassis_number'})
+_FUZZY_FIELDS = frozenset({'customer_name', 'broker_name'})
+# Amount fields compared within a one-rupee tolerance
+_NUMERIC_FIELDS = frozenset({'total_premium', 'tp_premium', 'sum_insured'})
+_DATE_FIELDS = frozenset({'policy_start_date', 'policy_end_date'})
+_LPG_VARIATIONS = frozenset({'LPG', 'LIQUID PETROLEUM GAS', 'LIQUID PETROL GAS', 'LIQUID PETROLEUM'})
+
+# Low-cardinality internal/offline columns stored as pandas categoricals after load
+_CATEGORICAL_FIELDS = frozenset({
+    'Insurance Company', 'Policy Status', 'Booking Type', 'Ticket Type', 'Policy Source',
+    'Policy Sub Source', 'Payment Mode', 'Payment Pickup Status', 'Payment Clearance Status',
+    'Case Type', 'Policy Type', 'Policy Medium', 'Fuel Type', 'Vehicle Category',
+    'Vehicle Sub Category', 'Dealership Type',
+})
+
+# Characters stripped from policy/registration numbers before comparison: a regex for
+# the Arrow-backed column path and a translate table for single values
+_RE_CLEAN_CHARS = re.compile(r"[\"'\- ]")
+_CLEAN_TABLE = str.maketrans('', '', "\"'- ")
+# Quotes dropped from free-text values (names) before fuzzy scoring
+_QUOTE_TABLE = str.maketrans('', '', "\"'")
+
+@lru_cache(maxsize=4096, typed=True)
+def _clean_string_cached(value):
+    """Memoized normalization behind InsuranceDataComparator.clean_string (typed so 1 and 1.0 stay distinct)"""
+    return str(value).strip().translate(_CLEAN_TABLE).upper()
+
+# Explicit formats tried in order before falling back to pandas' own inference
+_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%Y%m%d')
+
+@lru_cache(maxsize=16384, typed=True)
+def _standardize_date_cached(date_value):
+    """Memoized parsing behind InsuranceDataComparator.standardize_date; policy dates repeat heavily"""
+    try:
+        for fmt in _DATE_FORMATS:
+            try:
+                return pd.to_datetime(date_value, format=fmt).strftime('%Y-%m-%d')
+            except (ValueError, TypeError):
+                continue
+        return pd.to_datetime(date_value).strftime('%Y-%m-%d')
+    except (ValueError, TypeError):
+        return None
+
+@lru_cache(maxsize=16384, typed=True)
+def _to_datetime_cached(value):
+    """Memoized scalar pd.to_datetime(errors='coerce'); each value infers its own format"""
+    return pd.to_datetime(value, errors='coerce')
+
+@lru_cache(maxsize=None)
+def _compile_filter_pattern(values):
+    """Case-insensitive alternation for a contains/not_contains filter, compiled once per value set"""
+    return re.compile('|'.join(re.escape(str(v)) for v in values), re.IGNORECASE)
+
+def _to_float_array(series):
+    """Coerce a column to a float64 numpy array; unparseable values become NaN"""
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _standardize_dates(values):
+    """Column-wise _standardize_date_cached for non-null values.
+    Strings are parsed one format at a time in a single vectorized call each, in the
+    scalar path's order; a scalar pd.to_datetime runs the same parser, so a value
+    that only parses under a later format gives the same result. Non-strings and
+    strings matching none of the formats take the memoized scalar path.
+    """
+    values = pd.Series(values, dtype=object)
+    standardized = np.full(len(values), None, dtype=object)
+    is_text = np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=len(values))
+    pending = is_text.copy()
+    for fmt in _DATE_FORMATS:
+        if not pending.any():
+            break
+        positions = np.flatnonzero(pending)
+        parsed = pd.to_datetime(values.iloc[positions], format=fmt, errors='coerce')
+        parsed_ok = parsed.notna().to_numpy()
+        standardized[positions[parsed_ok]] = parsed[parsed_ok].dt.strftime('%Y-%m-%d').to_numpy(dtype=object)
+        pending[positions[parsed_ok]] = False
+    for i in np.flatnonzero(pending | ~is_text):
+        standardized[i] = _standardize_date_cached(values.iat[i])
+    return standardized
+
+# Indian digit grouping (lakh/crore): a comma after every second digit counted from the right
+_RE_INDIAN_GROUPING = re.compile(r'(\d)(?=(\d{2})+(?!\d))')
+
+# First token after the first ₹ in a comparison detail such as "Difference: ₹1,234.50"
+_RE_RUPEE_AMOUNT = re.compile(r'₹\s*([^\s₹]+)')
+
+def _parse_amounts(values):
+    """Parse amounts like '1,234.50' to a float64 array plus a validity mask.
+    numpy's str -> float cast follows float() exactly, so only batches holding an
+    unparseable value fall back to parsing one value at a time.
+    """
+    texts = np.char.replace(np.array([str(value) for value in values]), ',', '')
+    try:
+        return texts.astype(np.float64), np.ones(len(texts), dtype=bool)
+    except ValueError:
+        parsed = np.full(len(texts), np.nan)
+        valid = np.zeros(len(texts), dtype=bool)
+        for i, text in enumerate(texts.tolist()):
+            try:
+                parsed[i] = float(text)
+                valid[i] = True
+            except ValueError:
+                pass
+        return parsed, valid
+
+def _numeric_equals_mask(series, values):
+    """Mask of rows numerically equal to any of the values (NaN never matches)"""
+    numeric = _to_float_array(series)
+    if len(values) == 1:
+        return numeric == float(values[0])
+    return np.isin(numeric, [float(v) for v in values if isinstance(v, (int, float))])
+
+def _contains_mask(series, values):
+    """Boolean mask of rows whose text contains any of the filter values (case-insensitive)"""
+    pattern = _compile_filter_pattern(tuple(values))
+    text = series.astype(str).astype(_STRING_DTYPE)
+    if _STRING_DTYPE is str:
+        return text.str.contains(pattern, na=False)
+    # Arrow-backed strings evaluate the pattern string with RE2 in C++
+    return text.str.contains(pattern.pattern, case=False, na=False)
+
+@lru_cache(maxsize=32)
+def _normalized_columns(columns):
+    """(normalized, original) pairs for partial column-name matching, in column order.
+    Only the first column per normalized name is kept; a later duplicate could never
+    match before it.
+    """
+    normalized = {}
+    for col in columns:
+        normalized.setdefault(str(col).lower().replace(' ', '').replace('_', ''), col)
+    return tuple(normalized.items())
+
+# Fallbacks for insurer names that are not mapping keys, checked in order; ROYAL and
+# SUNDARAM may appear in either order ('CHOLA' also covers 'CHOLAMANDALAM')
+_SHEET_KEY_PATTERNS = (
+    (re.compile(r'^(?=.*ROYAL)(?=.*SUNDARAM)', re.S), 'ROYAL_SUNDARAM'),
+    (re.compile(r'FUTURE|GENERALI'), 'FGI'),
+    (re.compile(r'CHOLA'), 'CHOLA'),
+)
+
+@lru_cache(maxsize=64)
+def _sheet_name_for_insurer(insurer_upper):
+    """Resolve the expected sheet for an upper-cased insurer name. _SHEET_MAPPING is
+    immutable, so the answer for a given name never changes.
+    """
+    if insurer_upper in _SHEET_MAPPING:
+        sheet_name = _SHEET_MAPPING[insurer_upper]
+        return sheet_name[0] if isinstance(sheet_name, list) else sheet_name
+    for pattern, sheet_key in _SHEET_KEY_PATTERNS:
+        if pattern.search(insurer_upper):
+            return _SHEET_MAPPING.get(sheet_key, 'Sheet1')
+    return 'Sheet1'
+
+def _read_excel(filepath):
+    """Read a workbook's first sheet with the preferred engine, retrying with pandas'
+    default engine for files calamine rejects.
+    """
+    if _EXCEL_ENGINE is None:
+        return pd.read_excel(filepath)
+    try:
+        return pd.read_excel(filepath, engine=_EXCEL_ENGINE)
+    except Exception as e:
+        logger.warning(f"{_EXCEL_ENGINE} could not read {filepath} ({e}); retrying with the default engine")
+        return pd.read_excel(filepath)
+
+@lru_cache(maxsize=1)
+def _read_mis_workbook(filepath, mtime_ns, expected_sheet, sheet_options):
+    """Parse an MIS workbook's expected sheet, falling back to the insurer's sheet options,
+    common sheet names and finally the first sheet. Only the most recent parse is kept
+    (keyed on path and mtime), so re-adding an unchanged file skips the parse without
+    holding every uploaded workbook in memory.
+    """
+    # Open the workbook once: the sheet list comes from its metadata, so a missing
+    # expected sheet falls through to the fallbacks without a second open and parse
+    with pd.ExcelFile(filepath, engine=_EXCEL_ENGINE) as excel_file:
+        available_sheets = excel_file.sheet_names
+        if expected_sheet in available_sheets:
+            try:
+                return excel_file.parse(sheet_name=expected_sheet)
+            except Exception as e:
+                logger.warning(f"Could not read expected sheet '{expected_sheet}': {e}")
+        else:
+            logger.warning(f"Could not read expected sheet '{expected_sheet}': not in workbook")
+        logger.info(f"Available sheets: {available_sheets}")
+        for sheet in sheet_options:
+            if sheet in available_sheets:
+                return excel_file.parse(sheet_name=sheet)
+        common_sheets = ['Sheet1', 'Data', 'Raw', 'Digital', 'New', 'New Business']
+        for sheet in common_sheets:
+            if sheet in available_sheets:
+                return excel_file.parse(sheet_name=sheet)
+        return excel_file.parse(sheet_name=0)
+
+def _arrow_nulls_to_nan(df):
+    """Missing text comes back from Arrow as None; pandas' own parsers produce NaN"""
+    object_cols = df.columns[df.dtypes == object]
+    if len(object_cols):
+        df[object_cols] = df[object_cols].where(df[object_cols].notna(), np.nan)
+    return df
+
+_PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# The strings pd.read_csv treats as missing by default
+_CSV_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                  '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+def _read_csv(filepath, encoding='utf-8', encoding_errors='strict'):
+    """Read an uploaded CSV with Arrow's multi-threaded parser, returning what
+    pd.read_csv(low_memory=False, on_bad_lines='skip') would. Files Arrow cannot take
+    as-is (rows with the wrong number of fields, undecodable bytes, blank or repeated
+    headers, integers too long for a double) go through pandas instead; pandas pads short
+    rows where Arrow would drop them.
+    """
+    def read_with_pandas():
+        return pd.read_csv(filepath, low_memory=False, on_bad_lines='skip', encoding=encoding, encoding_errors=encoding_errors)
+
+    if not _PYARROW_AVAILABLE:
+        return read_with_pandas()
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    read_options = pa_csv.ReadOptions(encoding=encoding)
+    # No invalid_row_handler: a malformed row raises ArrowInvalid and the file is re-read by pandas
+    parse_options = pa_csv.ParseOptions()
+    convert_kwargs = {'null_values': _CSV_NA_VALUES, 'strings_can_be_null': True}
+    try:
+        table = pa_csv.read_csv(filepath, read_options=read_options, parse_options=parse_options,
+                                convert_options=pa_csv.ConvertOptions(**convert_kwargs))
+        names = table.column_names
+        undecoded = any(pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type) for field in table.schema)
+        if undecoded or '' in names or len(set(names)) != len(names):
+            return read_with_pandas()
+        # Arrow turns integers past int64 (e.g. 20-digit policy numbers) into inexact doubles;
+        # pandas keeps them as uint64 or as the original text
+        for column in table.columns:
+            if pa.types.is_floating(column.type) and (pc.max(pc.abs(column)).as_py() or 0) >= 2 ** 53:
+                return read_with_pandas()
+        # pandas leaves date-like text as strings; Arrow would parse it, so re-read those as text
+        temporal = {field.name: pa.string() for field in table.schema
+                    if pa.types.is_timestamp(field.type) or pa.types.is_date(field.type) or pa.types.is_time(field.type)}
+        if temporal:
+            table = pa_csv.read_csv(filepath, read_options=read_options, parse_options=parse_options,
+                                    convert_options=pa_csv.ConvertOptions(column_types=temporal, **convert_kwargs))
+    except (pa.ArrowException, UnicodeError) as e:
+        logger.info(f"Arrow could not parse {filepath} ({e}); using the pandas parser")
+        return read_with_pandas()
+    return _arrow_nulls_to_nan(table.to_pandas())
+
+# Parsed uploads can be kept as Feather files keyed on path, size and mtime, so reloading an
+# unchanged Excel/CSV file (even in a later session) skips the parse; needs pyarrow. The files
+# hold customer data unencrypted, so the cache is off unless IDRECON_CACHE_DIR names a folder
+# for it, and entries past IDRECON_CACHE_MAX_MB (oldest first) or a week old are deleted
+_SOURCE_CACHE_DIR = os.environ.get('IDRECON_CACHE_DIR') or None
+_SOURCE_CACHE_MAX_BYTES = int(float(os.environ.get('IDRECON_CACHE_MAX_MB', 512)) * 1024 * 1024)
+_SOURCE_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+_FEATHER_AVAILABLE = _PYARROW_AVAILABLE
+
+def _evict_source_cache():
+    """Delete cache entries older than the age limit, then the least recently used ones
+    until the rest fit in the size limit"""
+    now = time.time()
+    entries = []
+    with os.scandir(_SOURCE_CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.feather'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total_size = 0
+    for mtime, size, path in sorted(entries, reverse=True):
+        total_size += size
+        if total_size > _SOURCE_CACHE_MAX_BYTES or now - mtime > _SOURCE_CACHE_MAX_AGE_SECONDS:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.info(f"Could not evict {path}: {e}")
+
+def _read_cached_source(filepath, variant, read):
+    """Return read() for filepath through the on-disk Feather cache, when one is configured.
+    variant keeps reads of the same file with different options apart; frames Arrow cannot
+    store (e.g. a column mixing numbers and text) are simply not cached.
+    """
+    if not _FEATHER_AVAILABLE or not _SOURCE_CACHE_DIR:
+        return read()
+    stat = os.stat(filepath)
+    key = f"{variant}|{os.path.abspath(filepath)}|{stat.st_size}|{stat.st_mtime_ns}"
+    cache_path = os.path.join(_SOURCE_CACHE_DIR, hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '.feather')
+    if os.path.exists(cache_path):
+        try:
+            df = _arrow_nulls_to_nan(pd.read_feather(cache_path))
+            # Refresh the mtime so eviction drops the least recently used entries first
+            os.utime(cache_path)
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache for {filepath}: {e}")
+    df = read()
+    temp_path = cache_path + '.tmp'
+    try:
+        os.makedirs(_SOURCE_CACHE_DIR, exist_ok=True)
+        df.to_feather(temp_path, compression='lz4')
+        os.replace(temp_path, cache_path)
+        _evict_source_cache()
+    except Exception as e:
+        logger.info(f"Not caching {filepath}: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return df
+
+def _downcast_integer_columns(df):
+    """Store int64 columns as int32 when their values fit. Narrower types are not used:
+    elementwise arithmetic on int8/int16 wraps around silently"""
+    int32 = np.iinfo(np.int32)
+    for col in df.columns[(df.dtypes == np.int64).to_numpy()]:
+        values = df[col]
+        if values.empty or (values.min() >= int32.min and values.max() <= int32.max):
+            df[col] = values.astype(np.int32)
+    return df
+
+def _concat_result_frames(frames):
+    """Concatenate partial result frames, skipping empty ones"""
+    frames = [frame for frame in frames if not frame.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+# Column order of the per-field comparison rows (mirrors ComparisonResult)
+_RESULT_COLUMNS = ('Policy Number', 'Request Id', 'Field', 'Match Status', 'Match Score',
+                   'Internal Value', 'MIS Value', 'Details')
+
 @dataclass
 class ComparisonResult:
     """Data class for comparison results"""
@@ -60,627 +1040,29 @@ class InsuranceDataComparator:
         # Initialize ML mapper
         self.ml_mapper = MLColumnMapper()
 
-        # Cache for performance
-        self._cache = {}
-        self._cache_size = 1000
+        # Bounded LRU of alias resolutions keyed by (insurer, dataframe columns)
+        self._resolve_cache = OrderedDict()
+        self._resolve_cache_size = 1024
+        # Threads used by rapidfuzz for each batch of name comparisons
+        self.fuzzy_workers = min(4, os.cpu_count() or 1)
+
+        # Thread pool for parallel processing is created lazily (see `executor`)
 
-        # Thread pool for parallel processing
-        self.executor = ThreadPoolExecutor(max_workers=mp.cpu_count())
-        
         # Dictionary to hold mappings resolved at runtime (e.g., after coalescing columns)
         self.resolved_mappings = {}
-
-        # Insurer-specific sheet name mapping
-        self.sheet_mapping = {
-            'RELIANCE': 'Sheet1',
-            'SBI': 'Sheet1',
-            'RAHEJA': 'Raw',
-            'TATA': 'Sheet1',
-            'ZUNO': 'Sheet1',
-            'UNITED': 'Sheet1',
-            'DIGIT': 'Sheet1',
-            'SOMPO': 'Sheet1',
-            'MAGMA': 'Sheet1',
-            'SHRIRAM': 'GNRDUMP31MAY2025-GNRDUMP"DDMonthYYYY"',
-            'ROYAL_SUNDARAM': 'Sheet1',
-            'ORIENTAL': 'Sheet1',
-            'NATIONAL': 'SheetName',
-            'LIBERTY': 'Sheet1',
-            'KOTAK': ['Sheet1', 'Sheet3'],  # Can be either Sheet1 or Sheet3
-            'IFFCO': 'Digital',
-            'ICICI': 'Sheet1',
-            'HDFC': 'Sheet1',
-            'FGI': 'Sheet1',  # FGI = Future Generali Insurance
-            'CHOLA': 'Sheet1',
-            'BAJAJ': ['New', 'New Business']  # Bajaj uses "New" sheet, fallback to "New Business"
-        }
-
-        # Old to New column mappings - for converting old database format to new format
-        self.old_to_new_mappings = {
-            'Insurance Company': 'Insurance Company',
-            'PolicyNumber': 'Policy Number',  # Note: space added in new format
-            'Registration Number': 'Registration Number',
-            'Request Id': 'Request Id',
-            'Booked Time Stamp': 'Booked Time Stamp',
-            'Policy Status': 'Policy Status',
-            'Booking Type': 'Booking Type',
-            'Ticket Type': 'Ticket Type',
-            'Policy Source': 'Policy Source',
-            'Policy Sub Source': 'Policy Sub Source',
-            'Assigned to': 'Assigned to',
-            'Payment Pickup Status': 'Payment Pickup Status',
-            'Payment Clearance Status': 'Payment Clearance Status',
-            'Case Type': 'Case Type',
-            'Policy Type': 'Policy Type',
-            'Policy Medium': 'Policy Medium',
-            'Vehicle Sub Usage Type': 'Vehicle Sub Usage Type',
-            'Vehicle Category': 'Vehicle Category',
-            'Vehicle Sub Category': 'Vehicle Sub Category',
-            'Vehicle Name': 'Vehicle Name',
-            'Fuel Type': 'Fuel Type',
-            'Engine Number': 'Engine Number',
-            'Chassis No.': 'Chassis No.',
-            'Gross Weight': 'Gross Weight',
-            'Dealership Type': 'Dealership Type',
-            'GCD Code': 'GCD Code',
-            'Dealer Name': 'Dealer Name',
-            'Dealer City': 'Dealer City',
-            'Payment Mode': 'Payment Mode',
-            'Premium': 'Premium',
-            'Final Od Premium': 'Final Od Premium',
-            'Final TP Premium': 'Final TP Premium',
-            'Previous Policy Number': 'Previous Policy Number',
-            'Policy Start Date': 'Policy Start Date',
-            'Policy End Date': 'Policy End Date',
-            'Policy Tenure': 'Policy Tenure',
-            'CPA Cover Premium': 'CPA Cover Premium',
-            'Customer Name': 'Customer Name',
-            'Broker Name': 'Broker Name',
-            'Created By': 'Created By',
-            'Booked By': 'Booked By',
-            'cKYC Number': 'cKYC Number',
-            'Seating Capacity': 'Seating Capacity',
-            'Business Manager (DSA)': 'Business Manager (DSA)',
-            'Area Manager (DSA)': 'Area Manager (DSA)',
-            'State Head (DSA)': 'State Head (DSA)',
-            'Regional Head (DSA)': 'Regional Head (DSA)',
-            'Zonal Head (DSA)': 'Zonal Head (DSA)',
-            'Senior Relationship Manager (DSA)': 'Senior Relationship Manager (DSA)',
-            'National Head (DSA)': 'National Head (DSA)',
-            'Engine Cubic Capacity': 'Engine Cubic Capacity',
-        }
-        # Column mappings for each insurer
-        self.column_mappings = {
-            'SHRIRAM': {
-                'policy_number': 'S_POLICYNO',
-                'customer_name': 'S_INSUREDNAME',
-                'policy_start_date': 'S_DOI',
-                'policy_end_date': 'S_DOE',
-                'registration_number': 'S_VEH_REG_NO',
-                'engine_number': 'S_ENGNO',
-                'chassis_number': 'S_CHNO',
-                'total_premium': 'S_NET',
-                'tp_premium': 'S_TP_TOTAL',
-                'previous_policy_number': 'S_PREVIOUS_POL_NO',
-                'broker_name': 'S_SOURCENAME',
-                'broker_code': None,
-                'sum_insured': None,
-                'vehicle_make': 'S_MAKE_DESC',
-                'vehicle_model': 'S_VEH_MODEL',
-                'fuel_type': 'S_VEHFUEL_DESC',
-                'gvw': 'S_GVW',
-                'seating_capacity': 'S_VEH_SC',
-                'ncb_percentage': 'S_NCB_PERCENTAGE',
-                'manufacturing_year': None,
-                'engine_cubic_capacity': 'S_VEH_CC',
-            },
-            'RELIANCE': {
-                'policy_number': 'PolicyNo',
-                'customer_name': 'CustomerName',
-                'policy_start_date': 'PolicyStartDate',
-                'policy_end_date': 'PolicyEndDate',
-                'registration_number': 'VechileNo',
-                'engine_number': 'EngineNo',
-                'chassis_number': 'ChassisNo',
-                'total_premium': 'GrossPremium',
-                'tp_premium': 'TpPremium',
-                'previous_policy_number': 'Previous Policy No',
-                'broker_name': 'IMDName',
-                'broker_code': 'IMDCode',
-                'sum_insured': 'SumInsured',
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'FuelType',
-                'gvw': 'GVW',
-                'seating_capacity': 'SeatingCapacity',
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'YearOfManufacture',
-                'engine_cubic_capacity': 'CC',
-            },
-            'ROYAL': {
-                'policy_number': 'Policy No',
-                'customer_name': 'Client Full Name',
-                'policy_start_date': 'Inception Date',
-                'policy_end_date': 'Expiry Date',
-                'registration_number': 'Reg No',
-                'engine_number': 'Engine No',
-                'chassis_number': 'Chasis No',
-                'total_premium': 'Client Premium',
-                'tp_premium': 'TP Premium',
-                'previous_policy_number': 'Previous Policy No',
-                'broker_name': 'Agent Name',
-                'broker_code': 'Agent Code',
-                'sum_insured': 'Incremental SI',
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Mfr_Model_GWP',
-                'fuel_type': 'Fuel_Type',
-                'gvw': 'GVW_Ton',
-                'seating_capacity': 'SeatingCapacity',
-                'ncb_percentage': 'NCB_Rate',
-                'manufacturing_year': 'Year of Manufacturing',
-                'engine_cubic_capacity': 'Cubic_Capcity',
-            },
-            'SBI': {
-                'policy_number': ['PolicyNo'],
-                'customer_name': 'CustomerName',
-                'policy_start_date': 'PolicyStartDate',
-                'policy_end_date': 'PolicyEndDate',
-                'registration_number': None,
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': ['FinalPremium', 'GWP LACS', 'GWP Lacs','Gross Written Premium'],
-                'tp_premium': None,
-                'previous_policy_number': None,
-                'broker_name': ['IMD name', 'IMDName', 'Channel_Name'],
-                'broker_code': 'IMDCode',
-                'sum_insured': None,
-                'vehicle_make': 'MakeModel',
-                'vehicle_model': ['Product_Name', 'ProductName'],
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None
-            },
-            'ICICI': {
-                'policy_number': 'POL_NUM_TXT',
-                'customer_name': 'CUSTOMER_NAME',
-                'policy_start_date': 'POL_START_DATE',
-                'policy_end_date': 'POL_END_DATE',
-                'registration_number': 'MOTOR_REGISTRATION_NUM',
-                'engine_number': 'VEH_ENGINENO',
-                'chassis_number': 'VEH_CHASSISNO',
-                'total_premium': 'TOTAL_GROSS_PREMIUM',
-                'tp_premium': 'MOTOR_TP_PREMIUM_AMT',
-                'previous_policy_number': 'XC_PREV_POL_NO',
-                'broker_name': 'AGENT_NAME',
-                'broker_code': 'CHILD_ID',
-                'sum_insured': 'POL_TOT_SUM_INSURED_AMT',
-                'vehicle_make': 'MANUFACTURER_NAME',
-                'vehicle_model': 'MODEL_NAME',
-                'fuel_type': 'XC_FUEL_TYPE',
-                'gvw': 'POL_GVW',
-                'seating_capacity': 'XC_POL_SEATING_CAPACITY',
-                'ncb_percentage': 'XC_POL_NCB_PCT',
-                'manufacturing_year': 'MOTOR_MANUFACTURER_YEAR',
-                'engine_cubic_capacity': 'MOTOR_ENGINE_CC',
-            },
-            'NATIONAL': {
-                'policy_number': ['Policy Number', 'policy No'],
-                'customer_name': 'Customer Name',
-                'policy_start_date': 'Policy Effective Date',
-                'policy_end_date': 'Policy Expiry Date',
-                'registration_number': 'Vehicle Registration Number',
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'Premium',
-                'tp_premium': None,
-                'previous_policy_number': None,
-                'broker_name': 'POSP Name',
-                'broker_code': 'POSP Code',
-                'sum_insured': None,
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'Fuel Type',
-                'gvw': 'Gross Vehicle Weight',
-                'seating_capacity': 'Seating Capacity',
-                'ncb_percentage': 'NCB Percentage',
-                'manufacturing_year': 'Manufacturing Year',
-                'engine_cubic_capacity': 'Engine Cubic Capacity',
-            },
-            'DIGIT': {
-                'policy_number': ['POLICY_NUMBER','Policy_Number'],
-                'customer_name': 'INSURED_PERSON',
-                'policy_start_date': 'RISK_INC_DATE',
-                'policy_end_date': 'RISK_EXP_DATE',
-                'registration_number': 'VEH_REG_NO',
-                'engine_number': 'ENGINE_NO',
-                'chassis_number': 'CHASSIS_NO',
-                'total_premium': 'GROSS_PREMIUM',
-                'tp_premium': 'TP_PREMIUM',
-                'previous_policy_number': 'PREV_POLICY_NO',
-                'broker_name': 'IMD_NAME',
-                'broker_code': None,
-                'sum_insured': 'SUM_INSURED',
-                'vehicle_make': 'VEHICLE_MAKE',
-                'vehicle_model': 'VEHICLE_MODEL',
-                'fuel_type': 'FUEL_TYPE',
-                'gvw': 'VEH_GVW',
-                'seating_capacity': 'VEH_SEATING',
-                'ncb_percentage': 'CURR_NCB',
-                'manufacturing_year': 'VEHICLE_MANF_YEAR',
-                'engine_cubic_capacity': 'VEH_CC',
-            },
-            'MAGMA': {
-                'policy_number': 'PolicyNo',
-                'customer_name': 'CustomerName',
-                'policy_start_date': 'RiskStartDate',
-                'policy_end_date': 'RiskEndDate',
-                'registration_number': 'RegistrationNumber',
-                'engine_number': 'EngineNumber',
-                'chassis_number': 'ChassisNumber',
-                'total_premium': 'PremiumAmount',
-                'tp_premium': None,
-                'previous_policy_number': 'PreviousYearPolicyNumber',
-                'broker_name': 'AgentName',
-                'broker_code': 'AgentCode',
-                'sum_insured': None,
-                'vehicle_make': None,
-                'vehicle_model': 'ProductDesc',
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-            'UNIVERSAL': {
-                'policy_number': ['POLICY NO CHAR', 'USGIpos Policy Number','POLICY NO'],
-                'customer_name': 'INSURED NAME',
-                'policy_start_date': 'START DATE',
-                'policy_end_date': 'EXPIRY DATE',
-                'registration_number': 'MTOR Registration No',
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'GROSS PREMIUM',
-                'tp_premium': 'TOTAL TP PREMIUM',
-                'previous_policy_number': 'Previous Yr Policy',
-                'broker_name': 'INTERMEDIARY',
-                'broker_code': 'INTERMEDIARY CODE',
-                'sum_insured': 'TOTAL SUM INSURED',
-                'vehicle_make': 'MAKE',
-                'vehicle_model': 'MODEL',
-                'fuel_type': None,
-                'gvw': 'Gvw',
-                'seating_capacity': 'Vehicle Seating Capacity',
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'YEAR OF MANUFACTURING',
-                'engine_cubic_capacity': None,
-            },
-            'UNITED': {
-                'policy_number': 'Policy Number',
-                'customer_name': 'Insured Name',
-                'policy_start_date': 'Effect Date',
-                'policy_end_date': 'Expiry Date',
-                'registration_number': 'Registration Number',
-                'engine_number': 'Engine Number',
-                'chassis_number': 'Chassis Number',
-                'total_premium': 'company_wise_own_share_premium_total',
-                'tp_premium': 'TP Premium',
-                'previous_policy_number': None,
-                'broker_name': None,
-                'broker_code': 'Agent/Br.Cd',
-                'sum_insured': 'Sum Insured',
-                'vehicle_make': None,
-                'vehicle_model': None,
-                'fuel_type': None,
-                'gvw': 'NUM_GVW',
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-            'FGI': {
-                'policy_number': 'Policy Number',
-                'customer_name': 'Customer Name',
-                'policy_start_date': 'Transaction',
-                'policy_end_date': 'Policy Expiry Date',
-                'registration_number': 'Registration Number',
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'Final Premium',
-                'tp_premium': None,
-                'previous_policy_number': None,
-                'broker_name': None,
-                'broker_code': 'Agent Code',
-                'sum_insured': None,
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'Fueal Type',
-                'gvw': 'GVW',
-                'seating_capacity': 'Seating Capacity',
-                'ncb_percentage': None,
-                'manufacturing_year': 'Year Of Manufacturing',
-                'engine_cubic_capacity': 'Cubic Capacity',
-            },
-            'SOMPO': {
-                'policy_number': ['NUM_POLCIY_NO', 'POLICY_NO_CHAR', 'ILPOS_POLICY_NUMBER'],
-                'customer_name': 'INSURED_NAME',
-                'policy_start_date': 'START_DATE',
-                'policy_end_date': 'EXPIRY_DATE',
-                'registration_number': 'MOTOR_REGISTRATION_NO',
-                'engine_number': 'ENGINE_NO',
-                'chassis_number': 'CHASSIS_NO',
-                'total_premium': 'GROSS_PREMIUM',
-                'tp_premium': 'TOTAL_TP_PREMIUM',
-                'previous_policy_number': 'PREVIOUS_POLICY_NUMBER',
-                'broker_name': 'INTERMEDIARY',
-                'broker_code': 'INTERMEDIARY_CODE',
-                'sum_insured': 'TOTAL_SI',
-                'vehicle_make': 'MAKE',
-                'vehicle_model': 'MODEL',
-                'fuel_type': 'FUEL_TYPE',
-                'gvw': 'GVW',
-                'seating_capacity': 'VEHICLE_SEATING_CAPACITY',
-                'ncb_percentage': 'NCB_PERCENTAGE',
-                'manufacturing_year': 'YR_OF_MANUFACTURING',
-                'engine_cubic_capacity': 'CUBIC_CAPACITY',
-            },
-            'BAJAJ': {
-                'policy_number': ['PolicyNo','P Policy Number'],
-                'customer_name': ['CustomerName', 'Partner Desc'],
-                'policy_start_date': 'Risk Start Date',
-                'policy_end_date': 'Risk End Date',
-                'registration_number': 'RegistrationNumber',
-                'engine_number': 'EngineNumber',
-                'chassis_number': 'ChassisNumber',
-                'total_premium': ['R Rnwd Gross Prem', 'Gross Premium'],
-                'tp_premium': 'R Rnwd Tp Prem',
-                'previous_policy_number': 'Previous Year Policy Number',
-                'broker_name': 'AgentName',
-                'broker_code': 'AgentCode',
-                'sum_insured': 'R Rnwd Sum Insured',
-                'vehicle_make': None,
-                'vehicle_model': 'Product Desc',
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-            'CHOLA': {
-                'policy_number': 'Policy No',
-                'customer_name': 'Customer name',
-                'policy_start_date': 'RSD',
-                'policy_end_date': 'RED',
-                'registration_number': 'Regist_NO',
-                'engine_number': 'Engine No',
-                'chassis_number': 'Chassis No',
-                'total_premium': 'Gross Premium',
-                'tp_premium': 'Third Party liability',
-                'previous_policy_number': 'PREVIOUS_POLICY_NUMBER',
-                'broker_name': 'Agent Name',
-                'broker_code': 'Agent Code',
-                'sum_insured': 'Total IDV',
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'Fuel Type',
-                'gvw': 'GROSS_VEHICLE_WEIGHT',
-                'seating_capacity': 'TOTAL_SEATING_CAPACITY',
-                'ncb_percentage': 'NCB_PERCENT',
-                'manufacturing_year': 'MFG Year',
-                'engine_cubic_capacity': 'CUBIC_CAPACITY',
-            },
-            'HDFC': {
-                'policy_number': 'Policy No',
-                'customer_name': 'Customer Name',
-                'policy_start_date': 'Start Date',
-                'policy_end_date': 'End Date',
-                'registration_number': 'POL_MOT_VEH_REGISTRATION_NUM',
-                'engine_number': 'ENGINE NUM',
-                'chassis_number': 'CHASSIS NUM',
-                'total_premium': 'Total GWP',
-                'tp_premium': 'TP',
-                'previous_policy_number': 'Previous Policy No',
-                'broker_name': 'Agent Name',
-                'broker_code': 'Agent Code',
-                'sum_insured': 'Sum Insured',
-                'vehicle_make': 'POL_MOT_MANUFACTURER_NAME',
-                'vehicle_model': 'POL_MOT_MODEL_NAME',
-                'fuel_type': 'POL_FUEL_TYPE',
-                'gvw': 'POL_GROSS_VEH_WT',
-                'seating_capacity': None,
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'POL_MOT_MANUFACTURER_YEAR',
-                'engine_cubic_capacity': None,
-            },
-            'IFFCO': {
-                'policy_number': 'P400 policy',
-                'customer_name': ['First Name', 'Last Name'],
-                'policy_start_date': 'Inceptiondate',
-                'policy_end_date': 'Expirydate',
-                'registration_number': 'Registration No',
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'Total Premium after discount/loading',
-                'tp_premium': 'TP Gross Premium',
-                'previous_policy_number': 'PreviousInsurerPolicy Number',
-                'broker_name': None,
-                'broker_code': 'AgentNo',
-                'sum_insured': 'Total Sum Insured',
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'Fuel Type',
-                'gvw': 'GVW',
-                'seating_capacity': 'Carrying Capacity',
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'Year',
-                'engine_cubic_capacity': 'Cubic Capacity',
-            },
-            'KOTAK': {
-                'policy_number': 'POLICY NO',
-                'customer_name': 'CUSTOMER NAME',
-                'policy_start_date': 'POLICY INCEPTION DATE',
-                'policy_end_date': 'POLICY EXPIRY DATE',
-                'registration_number': 'Registration Number',
-                'engine_number': 'Engine Number',
-                'chassis_number': 'Chassis Number',
-                'total_premium': 'GWP',
-                'tp_premium': 'ALL OTHER TP COVER PREMIUM',
-                'previous_policy_number': None,
-                'broker_name': 'IMD NAME',
-                'broker_code': 'IMD CODE',
-                'sum_insured': 'SYSTEMIDV',
-                'vehicle_make': 'VehicleMake',
-                'vehicle_model': 'VehicleModel',
-                'fuel_type': 'FuelType',
-                'gvw': 'VehicleWeight',
-                'seating_capacity': None,
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'ManufacturerYear',
-                'engine_cubic_capacity': 'VehicleCC',
-            },
-            'RAHEJA': {
-                'policy_number': 'P400 Pol No.',
-                'customer_name': 'CompanyName',
-                'policy_start_date': 'policy_start_date',
-                'policy_end_date': 'Expiry date',
-                'registration_number': 'reg_no',
-                'engine_number': 'engine_no',
-                'chassis_number': 'chasis_no',
-                'total_premium': 'final_premium',
-                'tp_premium': 'TP Premium',
-                'previous_policy_number': None,
-                'broker_name': 'IMD Name',
-                'broker_code': 'IMD Code',
-                'sum_insured': None,
-                'vehicle_make': None,
-                'vehicle_model': 'Sub_Product',
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-            'TATA': {
-                'policy_number': 'policy_no',
-                'customer_name': 'clientname',
-                'policy_start_date': 'pol_incept_date',
-                'policy_end_date': 'pol_exp_date',
-                'registration_number': 'registration_no',
-                'engine_number': 'veh_engine_no',
-                'chassis_number': 'veh_chassis_no',
-                'total_premium': 'total_premium',
-                'tp_premium': 'basictp',
-                'previous_policy_number': None,
-                'broker_name': 'producername',
-                'broker_code': 'producer_cd',
-                'sum_insured': 'vehicleidv',
-                'vehicle_make': 'veh_make',
-                'vehicle_model': 'veh_model',
-                'fuel_type': 'fuel_type',
-                'gvw': 'veh_gr_wgt_cnt',
-                'seating_capacity': 'seat_cap_cnt',
-                'ncb_percentage': 'ncb_perctg',
-                'manufacturing_year': 'mfg_year',
-                'engine_cubic_capacity': 'kw_cc_no',
-            },
-            'ZUNO': {
-                'policy_number': 'Policy_Number',
-                'customer_name': 'Policy_Holder_Name',
-                'policy_start_date': 'Policy_Start_Date',
-                'policy_end_date': 'Policy_End_Date',
-                'registration_number': 'Registration No',
-                'engine_number': 'Engine No',
-                'chassis_number': 'chasis No',
-                'total_premium': 'Gross_Premium_Total',
-                'tp_premium': 'Motor TP Premium',
-                'previous_policy_number': 'Previous_Policy_No',
-                'broker_name': 'Intermediary_Name',
-                'broker_code': 'Intermediary_Code',
-                'sum_insured': 'NUM_IDV',
-                'vehicle_make': 'Make Code',
-                'vehicle_model': 'Model Code',
-                'fuel_type': 'Type of Fuel',
-                'gvw': 'GVW',
-                'seating_capacity': 'Capacity Type',
-                'ncb_percentage': 'NCB_Percentage',
-                'manufacturing_year': 'Manufacturing Year',
-                'engine_cubic_capacity': 'Num_PCC CC',
-            },
-            'LIBERTY': {
-                'policy_number': 'Policy No.',
-                'customer_name': 'Insured Name',
-                'policy_start_date': 'Policy Start Date',
-                'policy_end_date': 'Policy End Date',
-                'registration_number': 'Veh Reg No',
-                'engine_number': 'Engine NO',
-                'chassis_number': 'Chassis NO',
-                'total_premium': 'Net Premium',
-                'tp_premium': 'Net TP Premium / War & SRCC',
-                'previous_policy_number': 'Previous Policy No.',
-                'broker_name': 'Agent/ Broker Name',
-                'broker_code': 'Agent/ Broker Code',
-                'sum_insured': 'Sum Insured',
-                'vehicle_make': 'Make Name',
-                'vehicle_model': 'Model Name',
-                'fuel_type': 'Fuel Type',
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': 'Current Year NCB (%)',
-                'manufacturing_year': None,
-                'engine_cubic_capacity': 'Cubic Capacity',
-            },
-            'ORIENTAL': {
-                'policy_number': 'POLICY NO',
-                'customer_name': None,
-                'policy_start_date': None,
-                'policy_end_date': None,
-                'registration_number': None,
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'PREMIUM',
-                'tp_premium': None,
-                'previous_policy_number': None,
-                'broker_name': None,
-                'broker_code': None,
-                'sum_insured': None,
-                'vehicle_make': None,
-                'vehicle_model': None,
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-        }
-
-        # Internal dataset column mapping (new database columns)
-        self.internal_columns = {
-            'policy_number': 'Policy Number',
-            'customer_name': 'Customer Name',
-            'registration_number': 'Registration Number',
-            'engine_number': 'Engine Number',
-            'chassis_number': 'Chassis No.',
-            'fuel_type': 'Fuel Type',
-            'vehicle_name': 'Vehicle Name',
-            'vehicle_sub_category': 'Vehicle Sub Category',
-            'total_premium': 'Premium',
-            'tp_premium': 'Final TP Premium',
-            'policy_start_date': 'Policy Start Date',
-            'policy_end_date': 'Policy End Date',
-            'previous_policy_number': 'Previous Policy Number',
-            'broker_name': 'Broker Name',
-            'seating_capacity': 'Seating Capacity',
-            'insurance_company': 'Insurance Company',
-            'gvw': 'Gross Weight Category',
-            'engine_cubic_capacity': 'Engine Cubic Capacity',
-            'policy_type': 'Policy Type',
-        }
+        # Reverse alias -> field index, built lazily from column_mappings
+        self._reverse_mappings = None
+        # (internal schema, MIS mapping) -> comparable fields, reused across batches and runs (LRU)
+        self._comparable_fields_cache = OrderedDict()
+        self._comparable_fields_cache_size = 256
+
+        # Static configuration: read-only module-level mappings shared by every instance
+        self.sheet_mapping = _SHEET_MAPPING
+        self.old_to_new_mappings = _OLD_TO_NEW_MAPPINGS
+        self.internal_columns = _INTERNAL_COLUMNS
+        # Column mappings are the exception: the mapping manager edits them in place,
+        # so each instance gets its own copy
+        self.column_mappings = {insurer: dict(fields) for insurer, fields in _COLUMN_MAPPINGS.items()}
         # Add insurer-specific filter configurations
         self.insurer_filters = {
             'CHOLA': [
@@ -990,6 +1372,29 @@ class InsuranceDataComparator:
                 'description': 'New Business and Renewal only (No Cancellation/Endorsement)'
             }
         }
+        # Filter condition -> mask builder used by apply_insurer_filters
+        self._filter_dispatch = {
+            'equals': self._mask_equals,
+            'not_equals': self._mask_not_equals,
+            'in': self._mask_in,
+            'not_in': self._mask_not_in,
+            'contains': self._mask_contains,
+            'not_contains': self._mask_not_contains,
+            'not_null': self._mask_not_null,
+            'positive': self._mask_positive,
+            'not_older_than_issue': self._mask_not_older_than_issue,
+            'current_month_only': self._mask_current_month_only,
+        }
+
+        # Field type -> comparator for non-null value pairs; anything unlisted compares as text
+        self._field_comparators = {
+            **dict.fromkeys(_FUZZY_FIELDS, self._cmp_fuzzy),
+            **dict.fromkeys(_EXACT_FIELDS, self._cmp_exact_clean),
+            **dict.fromkeys(_DATE_FIELDS, self._cmp_date),
+            **dict.fromkeys(_NUMERIC_FIELDS, self._cmp_numeric),
+            'fuel_type': self._cmp_fuel,
+        }
+
         # Insurer name map for company detection
         self.insurer_name_map = {
             'BAJAJ': ['Bajaj Allianz', 'Bajaj Allianz General Insurance', 'Bajaj Allianz General Insurance Company Limited', 'Bajaj'],
@@ -1014,6 +1419,18 @@ class InsuranceDataComparator:
             'ZUNO': ['Zuno General Insurance', 'Zuno Insurance', 'Zuno'],
             'UNIVERSAL': ['Universal Sompo','Sompo', 'Universal Sompo General Insurance', 'Universal Sompo General Insurance Company Limited']
         }
+        # Every (keyword, insurer) pair the scan tries, upper-cased once and in priority order, plus one
+        # alternation over all of them so names containing none are rejected in a single regex pass
+        self._insurer_keywords = _COMPANY_INSURER_KEYWORDS + tuple(
+            (variation.upper(), insurer)
+            for insurer, variations in self.insurer_name_map.items() for variation in variations
+        )
+        self._insurer_keyword_re = re.compile('|'.join(re.escape(keyword) for keyword, _ in self._insurer_keywords))
+        # Alias -> insurer, resolved through the scan itself so lookups keep its precedence
+        self._insurer_reverse_map = {
+            alias.strip().upper(): self._scan_insurer_name(alias.strip().upper())
+            for aliases in self.insurer_name_map.values() for alias in aliases
+        }
     
     def preprocess_mis_df(self, insurer: str, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -1027,10 +1444,11 @@ class InsuranceDataComparator:
             return df
 
         resolved_mapping = original_mapping.copy()
+        existing_by_field = self._resolve_mapping(df.columns, insurer)
 
         for field, mapped_cols in original_mapping.items():
             if isinstance(mapped_cols, list):
-                existing_cols = [col for col in mapped_cols if col in df.columns]
+                existing_cols = existing_by_field.get(field, [])
                 
                 if not existing_cols:
                     resolved_mapping[field] = None
@@ -1039,7 +1457,11 @@ class InsuranceDataComparator:
                 new_col_name = f"__generated_{field}"
 
                 if field == 'customer_name':
-                    df[new_col_name] = df[existing_cols].fillna('').astype(str).agg(' '.join, axis=1).str.strip()
+                    parts = df[existing_cols].fillna('').astype(str)
+                    combined = parts.iloc[:, 0]
+                    if parts.shape[1] > 1:
+                        combined = combined.str.cat([parts.iloc[:, i] for i in range(1, parts.shape[1])], sep=' ')
+                    df[new_col_name] = combined.str.strip()
                     logger.info(f"Concatenated {existing_cols} into '{new_col_name}' for {insurer}.")
                 
                 else:
@@ -1047,9 +1469,11 @@ class InsuranceDataComparator:
                         resolved_mapping[field] = existing_cols[0]
                         continue
                     
-                    series = df[existing_cols[0]].copy()
+                    # Column-wise fillna keeps each column's dtype; bfill(axis=1) would transpose
+                    # a mixed-dtype sub-frame to object first
+                    series = df[existing_cols[0]]
                     for col in existing_cols[1:]:
-                        series.fillna(df[col], inplace=True)
+                        series = series.fillna(df[col])
                     df[new_col_name] = series
                     logger.info(f"Coalesced {existing_cols} into '{new_col_name}' for {insurer}.")
 
@@ -1058,6 +1482,79 @@ class InsuranceDataComparator:
         self.resolved_mappings[insurer] = resolved_mapping
         return df
 
+    @cached_property
+    def executor(self):
+        """Thread pool for parallel processing, created on first use and capped to avoid oversubscription"""
+        return ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix='recon')
+
+    def close(self):
+        """Shut down the thread pool if it was ever created"""
+        executor = self.__dict__.pop('executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def _build_reverse_index(self):
+        """Builds {insurer: {alias.casefold(): (field, alias_rank)}} from the current column mappings."""
+        reverse_index = {}
+        for insurer, mapping in self.column_mappings.items():
+            insurer_index = {}
+            for field, mapped_cols in (mapping or {}).items():
+                candidates = mapped_cols if isinstance(mapped_cols, list) else [mapped_cols]
+                for rank, alias in enumerate(candidates):
+                    if alias:
+                        insurer_index.setdefault(str(alias).casefold(), (field, rank))
+            reverse_index[insurer] = insurer_index
+        return reverse_index
+
+    def invalidate_mappings(self):
+        """Drops runtime-resolved mappings and the alias index after column mappings are edited."""
+        self.resolved_mappings.clear()
+        self._reverse_mappings = None
+        self._resolve_cache.clear()
+        self._comparable_fields_cache.clear()
+
+    def _resolve_mapping(self, df_cols, insurer):
+        """
+        Resolves every mapped field of an insurer against the dataframe columns
+        in a single pass. Returns {field: [existing columns in alias order]}.
+        """
+        cache_key = (insurer, tuple(df_cols))
+        cached = self._resolve_cache.get(cache_key)
+        if cached is not None:
+            self._resolve_cache.move_to_end(cache_key)
+            return cached
+
+        if self._reverse_mappings is None:
+            self._reverse_mappings = self._build_reverse_index()
+        alias_index = self._reverse_mappings.get(insurer, {})
+
+        found = {field: [] for field in (self.column_mappings.get(insurer) or {})}
+        for col in df_cols:
+            hit = alias_index.get(str(col).casefold())
+            if hit:
+                field, rank = hit
+                found[field].append((rank, col))
+        resolved = {field: [col for _, col in sorted(matches, key=lambda m: m[0])] for field, matches in found.items()}
+
+        self._resolve_cache[cache_key] = resolved
+        if len(self._resolve_cache) > self._resolve_cache_size:
+            self._resolve_cache.popitem(last=False)
+        return resolved
+
+    def _resolve_policy_col(self, columns, insurer):
+        """First configured policy-number column present in columns (cached per schema), or None"""
+        policy_col = self.column_mappings.get(insurer, {}).get('policy_number')
+        if isinstance(policy_col, list):
+            existing_cols = self._resolve_mapping(columns, insurer).get('policy_number', [])
+            return existing_cols[0] if existing_cols else None
+        return policy_col if policy_col and policy_col in columns else None
+
     def convert_old_to_new_format(self, df):
         """Convert old database format to new database format"""
         if 'PolicyNumber' in df.columns and 'Policy Number' not in df.columns:
@@ -1067,31 +1564,25 @@ class InsuranceDataComparator:
             logger.info(f"Converted {len(rename_dict)} columns from old to new format")
         return df
 
+    def convert_categorical_columns(self, df):
+        """Store known low-cardinality columns as category dtype to cut memory and speed up comparisons"""
+        for col in _CATEGORICAL_FIELDS.intersection(df.columns):
+            if df[col].dtype == object and df[col].nunique() <= len(df) // 2:
+                df[col] = df[col].astype('category')
+        return df
+
     def count_endorsement_cancellation_instances(self, df, insurer):
         """Count endorsement/cancellation records as non-unique policies from MIS data"""
         logger.info(f"=== COUNTING ENDORSEMENT/CANCELLATION FOR {insurer} ===")
         
         # Get policy number column with proper resolution
-        policy_col = self.column_mappings.get(insurer, {}).get('policy_number')
+        configured_col = self.column_mappings.get(insurer, {}).get('policy_number')
+        policy_col = self._resolve_policy_col(df.columns, insurer)
         
-        # Handle case where policy_number is a list of possible column names
-        if isinstance(policy_col, list):
-            # Find the first column that actually exists in the MIS data
-            found_col = None
-            for col_option in policy_col:
-                if col_option in df.columns:
-                    found_col = col_option
-                    break
-            
-            if found_col:
-                policy_col = found_col
-                logger.info(f"Resolved policy column for {insurer}: {found_col}")
-            else:
-                logger.warning(f"Policy number column (tried {policy_col}) not found in MIS data for {insurer}")
-                return 0
-        elif not policy_col or policy_col not in df.columns:
-            logger.warning(f"Policy number column '{policy_col}' not found for {insurer}")
+        if policy_col is None:
+            logger.warning(f"Policy number column (tried {configured_col}) not found in MIS data for {insurer}")
             return 0
+        logger.info(f"Resolved policy column for {insurer}: {policy_col}")
         
         # Count total records and unique policies
         total_records = len(df)
@@ -1133,25 +1624,37 @@ class InsuranceDataComparator:
             logger.warning(f"Cancellation column '{column_name}' not found for {insurer}")
             return 0
 
-        series = df[column_name].astype(str).str.strip()
-        # Compare case-insensitively
+        # Compare case-insensitively; normalize the few distinct categories rather than every row
         cancel_set_upper = {str(v).strip().upper() for v in cancel_values}
-        count = series.str.upper().isin(cancel_set_upper).sum()
+        categorical = df[column_name].astype('category')
+        categories_upper = categorical.cat.categories.astype(str).str.strip().str.upper()
+        matching_codes = np.flatnonzero(categories_upper.isin(cancel_set_upper))
+        count = np.isin(categorical.cat.codes.to_numpy(), matching_codes).sum()
         logger.info(f"Cancellation count for {insurer} using {column_name}: {int(count)}")
         return int(count)
 
     def apply_insurer_filters(self, df, insurer):
-        """Apply insurer-specific filters to the dataframe"""
+        """Apply insurer-specific filters to the dataframe.
+        Each filter contributes a row mask; the frame is sliced once after all filters.
+        """
         if insurer not in self.insurer_filters:
             return df, None
         
         original_count = len(df)
-        filtered_df = df.copy()
+        keep = np.ones(original_count, dtype=bool)
+        remaining = original_count
         filter_descriptions = []
         filters = self.insurer_filters[insurer]
+        parsed_dates = {}
         
         if not isinstance(filters, list):
             filters = [filters]
+
+        def dates_of(col):
+            # Each date column is parsed at most once per call, however many filters use it
+            if col not in parsed_dates:
+                parsed_dates[col] = pd.to_datetime(df[col], errors='coerce', cache=True)
+            return parsed_dates[col]
         
         for filter_config in filters:
             field = filter_config['field']
@@ -1159,75 +1662,28 @@ class InsuranceDataComparator:
             values = filter_config['values']
             
             # Skip if field doesn't exist in the dataframe
-            if field not in filtered_df.columns:
+            if field not in df.columns:
                 logger.warning(f"Filter field '{field}' not found in {insurer} dataset")
                 continue
             
-            initial_count = len(filtered_df)
+            # Nothing left to filter: record the filter without evaluating it
+            if remaining == 0:
+                filter_descriptions.append(f"{filter_config['description']} (no records removed)")
+                continue
+            
+            handler = self._filter_dispatch.get(condition)
+            if handler is None:
+                logger.warning(f"Unknown filter condition '{condition}' for {insurer}")
+                continue
             
             try:
-                if condition == 'equals':
-                    if any(isinstance(v, (int, float)) for v in values):
-                        filtered_df = filtered_df[pd.to_numeric(filtered_df[field], errors='coerce').isin(values)]
-                    else:
-                        filtered_df = filtered_df[filtered_df[field].isin(values)]
-                
-                elif condition == 'not_equals':
-                    if any(isinstance(v, (int, float)) for v in values):
-                        filtered_df = filtered_df[~pd.to_numeric(filtered_df[field], errors='coerce').isin(values)]
-                    else:
-                        filtered_df = filtered_df[~filtered_df[field].isin(values)]
-                
-                elif condition == 'in':
-                    filtered_df = filtered_df[filtered_df[field].isin(values)]
-                
-                elif condition == 'not_in':
-                    filtered_df = filtered_df[~filtered_df[field].isin(values)]
-                
-                elif condition == 'contains':
-                    mask = filtered_df[field].astype(str).str.contains('|'.join(values), case=False, na=False)
-                    filtered_df = filtered_df[mask]
-                
-                elif condition == 'not_contains':
-                    mask = filtered_df[field].astype(str).str.contains('|'.join(values), case=False, na=False)
-                    filtered_df = filtered_df[~mask]
-                
-                elif condition == 'not_null':
-                    filtered_df = filtered_df[filtered_df[field].notna()]
+                mask = handler(df, field, values, dates_of, insurer)
                 
-                elif condition == 'positive':
-                    numeric_field = pd.to_numeric(filtered_df[field], errors='coerce')
-                    filtered_df = filtered_df[numeric_field > 0]
+                if mask is not None:
+                    keep &= np.asarray(mask, dtype=bool)
                 
-                elif condition == 'not_older_than_issue':
-                    # This requires comparing Effect Date with Issue Date
-                    # Assuming there's an Issue Date column - adjust as needed
-                    issue_date_col = 'Issue Date'  # Adjust column name as needed
-                    if issue_date_col in filtered_df.columns:
-                        effect_date = pd.to_datetime(filtered_df[field], errors='coerce')
-                        issue_date = pd.to_datetime(filtered_df[issue_date_col], errors='coerce')
-                        filtered_df = filtered_df[effect_date >= issue_date]
-                    else:
-                        logger.warning(f"Issue Date column not found for date comparison filter in {insurer}")
-                
-                elif condition == 'current_month_only':
-                    # Keep only records from the current month
-                    try:
-                        from datetime import datetime
-                        current_month = datetime.now().month
-                        current_year = datetime.now().year
-                        
-                        date_col = pd.to_datetime(filtered_df[field], errors='coerce')
-                        mask = (date_col.dt.month == current_month) & (date_col.dt.year == current_year)
-                        filtered_df = filtered_df[mask]
-                    except Exception as date_error:
-                        logger.warning(f"Error applying current_month_only filter on {field}: {date_error}")
-                
-                else:
-                    logger.warning(f"Unknown filter condition '{condition}' for {insurer}")
-                    continue
-                
-                records_removed = initial_count - len(filtered_df)
+                records_removed = remaining - int(keep.sum())
+                remaining -= records_removed
                 if records_removed > 0:
                     filter_descriptions.append(f"{filter_config['description']} (removed {records_removed:,} records)")
                 else:
@@ -1237,6 +1693,7 @@ class InsuranceDataComparator:
                 logger.error(f"Error applying filter {condition} on field {field} for {insurer}: {str(e)}")
                 continue
 
+        filtered_df = df[keep]
         filtered_count = len(filtered_df)
         filtered_out_count = original_count - filtered_count
         
@@ -1248,66 +1705,121 @@ class InsuranceDataComparator:
             'filters_applied': filter_descriptions
         }
 
+    # Filter mask builders: each returns a boolean row mask, or None to leave rows untouched
+    def _mask_equals(self, df, field, values, dates_of, insurer):
+        if any(isinstance(v, (int, float)) for v in values):
+            return _numeric_equals_mask(df[field], values)
+        return df[field].isin(values)
+
+    def _mask_not_equals(self, df, field, values, dates_of, insurer):
+        return ~self._mask_equals(df, field, values, dates_of)
+
+    def _mask_in(self, df, field, values, dates_of, insurer):
+        return df[field].isin(values)
+
+    def _mask_not_in(self, df, field, values, dates_of, insurer):
+        return ~df[field].isin(values)
+
+    def _mask_contains(self, df, field, values, dates_of, insurer):
+        return _contains_mask(df[field], values)
+
+    def _mask_not_contains(self, df, field, values, dates_of, insurer):
+        return ~_contains_mask(df[field], values)
+
+    def _mask_not_null(self, df, field, values, dates_of, insurer):
+        return df[field].notna()
+
+    def _mask_positive(self, df, field, values, dates_of, insurer):
+        return _to_float_array(df[field]) > 0.0
+
+    def _mask_not_older_than_issue(self, df, field, values, dates_of, insurer):
+        # This requires comparing Effect Date with Issue Date
+        # Assuming there's an Issue Date column - adjust as needed
+        issue_date_col = 'Issue Date'  # Adjust column name as needed
+        if issue_date_col not in df.columns:
+            logger.warning(f"Issue Date column not found for date comparison filter in {insurer}")
+            return None
+        return dates_of(field) >= dates_of(issue_date_col)
+
+    def _mask_current_month_only(self, df, field, values, dates_of, insurer):
+        # Keep only records from the current month
+        try:
+            from datetime import datetime
+            current_month = np.datetime64(datetime.now(), 'M')
+            month_start = current_month.astype('datetime64[ns]')
+            next_month_start = (current_month + 1).astype('datetime64[ns]')
+            
+            date_col = dates_of(field)
+            if date_col.dt.tz is not None:
+                date_col = date_col.dt.tz_localize(None)
+            # One range check on the datetime64 values; NaT compares False
+            dates = date_col.to_numpy()
+            return (dates >= month_start) & (dates < next_month_start)
+        except Exception as date_error:
+            logger.warning(f"Error applying current_month_only filter on {field}: {date_error}")
+            return None
+
     def process_endorsements_cancellations(self, records, insurer, record_type):
         """Process endorsements and cancellations with numbering and maintain same format"""
         if not records:
             return []
         
-        processed_records = []
+        # Get policy number column for this insurer, preferring one the records actually carry
+        policy_col = self._resolve_policy_col(records[0].keys(), insurer)
+        if policy_col is None:
+            policy_col = self.column_mappings.get(insurer, {}).get('policy_number')
+            if isinstance(policy_col, list):
+                policy_col = policy_col[0] if policy_col else None
         
-        # Get policy number column for this insurer
-        policy_col = self.column_mappings.get(insurer, {}).get('policy_number')
-        if isinstance(policy_col, list):
-            policy_col = policy_col[0] if policy_col else None
+        # Records come from one MIS frame, so they share keys; sort by date if available,
+        # otherwise by order in original data
+        date_col = next((col for col in ['policy_start_date', 'policy_end_date', 'start_date', 'end_date', 'transaction_date']
+                         if col in records[0]), None)
+        
+        # Group by policy number (first-seen order) and number endorsements/cancellations sequentially
+        frame = pd.DataFrame({'policy': [record.get(policy_col, 'Unknown') for record in records]})
+        frame['group'] = frame.groupby('policy', sort=False, dropna=False).ngroup()
+        sort_keys = ['group']
+        if date_col:
+            try:
+                # Parsed one value at a time: a single list parse would infer one format from the
+                # first date and turn dates in any other format into NaT
+                frame['date'] = pd.to_datetime([_to_datetime_cached(record.get(date_col, '1900-01-01')) for record in records])
+                sort_keys.append('date')
+            except:
+                pass
+        frame = frame.sort_values(sort_keys, kind='stable')
+        sequence = frame.groupby('group', sort=False).cumcount() + 1
+        policy_text = frame['policy'].astype(str)
+        suffix = sequence.map('{:03d}'.format)
         
-        # Group by policy number to number endorsements/cancellations sequentially
-        policy_groups = {}
-        for record in records:
-            policy_num = record.get(policy_col, 'Unknown')
-            if policy_num not in policy_groups:
-                policy_groups[policy_num] = []
-            policy_groups[policy_num].append(record)
+        if record_type == 'endorsement':
+            label, prefix = 'Endorsement', 'END'
+        else:  # cancellation
+            label, prefix = 'Cancellation', 'CANCEL'
+        numbers = prefix + '-' + policy_text + '-' + suffix
+        descriptions = f"{label} #" + sequence.astype(str) + ' for Policy ' + policy_text
+        request_ids = f"REQ-{insurer}-" + policy_text + '-' + suffix
+        processing_date = datetime.now().strftime('%Y-%m-%d')
         
-        # Process each policy group
-        for policy_num, group_records in policy_groups.items():
-            # Sort by date if available, otherwise by order in original data
-            date_col = None
-            for col in ['policy_start_date', 'policy_end_date', 'start_date', 'end_date', 'transaction_date']:
-                if col in group_records[0]:
-                    date_col = col
-                    break
+        processed_records = []
+        for position, number, seq, description, request_id in zip(
+                frame.index, numbers, sequence, descriptions, request_ids):
+            processed_record = records[position].copy()
+            processed_record['Record_Type'] = label
+            processed_record[f'{label}_Number'] = number
+            processed_record[f'{label}_Sequence'] = int(seq)
+            processed_record['Description'] = description
             
-            if date_col:
-                try:
-                    group_records.sort(key=lambda x: pd.to_datetime(x.get(date_col, '1900-01-01'), errors='coerce'))
-                except:
-                    pass
+            # Ensure Request ID and Policy Number follow same format
+            if 'Request Id' not in processed_record:
+                processed_record['Request Id'] = request_id
             
-            # Number the records sequentially
-            for idx, record in enumerate(group_records, 1):
-                processed_record = record.copy()
-                
-                # Add numbering information
-                if record_type == 'endorsement':
-                    processed_record['Record_Type'] = 'Endorsement'
-                    processed_record['Endorsement_Number'] = f"END-{policy_num}-{idx:03d}"
-                    processed_record['Endorsement_Sequence'] = idx
-                    processed_record['Description'] = f"Endorsement #{idx} for Policy {policy_num}"
-                else:  # cancellation
-                    processed_record['Record_Type'] = 'Cancellation'
-                    processed_record['Cancellation_Number'] = f"CANCEL-{policy_num}-{idx:03d}"
-                    processed_record['Cancellation_Sequence'] = idx
-                    processed_record['Description'] = f"Cancellation #{idx} for Policy {policy_num}"
-                
-                # Ensure Request ID and Policy Number follow same format
-                if 'Request Id' not in processed_record:
-                    processed_record['Request Id'] = f"REQ-{insurer}-{policy_num}-{idx:03d}"
-                
-                # Add insurer information
-                processed_record['Insurer'] = insurer
-                processed_record['Processing_Date'] = datetime.now().strftime('%Y-%m-%d')
-                
-                processed_records.append(processed_record)
+            # Add insurer information
+            processed_record['Insurer'] = insurer
+            processed_record['Processing_Date'] = processing_date
+            
+            processed_records.append(processed_record)
         
         logger.info(f"Processed {len(processed_records)} {record_type} records for {insurer}")
         return processed_records
@@ -1318,33 +1830,35 @@ class InsuranceDataComparator:
         """Clean string for comparison - removes quotes, spaces, and converts to upper"""
         if pd.isna(value):
             return ''
-        return str(value).strip().replace('"', '').replace("'", '').upper().replace('-', '').replace(' ', '')
+        return _clean_string_cached(value)
+
+    def clean_string_series(self, series):
+        """Vectorized clean_string for a whole column; each distinct value is cleaned once"""
+        # Factorize the str form (so 1, 1.0 and True stay distinct) and broadcast the cleaned uniques back
+        codes, uniques = pd.factorize(series.astype(str))
+        # Pattern string rather than the compiled regex so Arrow does not fall back to per-object replace
+        cleaned_uniques = pd.Series(uniques, dtype=object).astype(_STRING_DTYPE).str.strip().str.replace(_RE_CLEAN_CHARS.pattern, '', regex=True).str.upper()
+        cleaned = pd.Series(cleaned_uniques.array.take(codes), index=series.index, name=series.name)
+        return cleaned.where(series.notna(), '')
 
     def clean_for_comparison(self, value):
         """Clean value for comparison while preserving readability"""
         if pd.isna(value):
             return ''
-        return str(value).strip().replace('"', '').replace("'", '')
+        return str(value).strip().translate(_QUOTE_TABLE)
 
     def fuzzy_match_score(self, str1, str2, threshold=80):
         """Calculate fuzzy match score between two strings"""
         if pd.isna(str1) or pd.isna(str2):
             return 0
-        return fuzz.ratio(str(str1).upper(), str(str2).upper())
+        # Normalized Indel similarity is fuzz.ratio / 100; round to keep fuzzywuzzy's integer scores
+        return round(Indel.normalized_similarity(str(str1).upper(), str(str2).upper()) * 100)
 
     def standardize_date(self, date_value):
         """Standardize date formats"""
         if pd.isna(date_value):
             return None
-        try:
-            for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%Y%m%d']:
-                try:
-                    return pd.to_datetime(date_value, format=fmt).strftime('%Y-%m-%d')
-                except (ValueError, TypeError):
-                    continue
-            return pd.to_datetime(date_value).strftime('%Y-%m-%d')
-        except (ValueError, TypeError):
-            return None
+        return _standardize_date_cached(date_value)
 
     def handle_offline_duplicates(self, offline_df):
         """
@@ -1366,23 +1880,17 @@ class InsuranceDataComparator:
             logger.warning("Required columns 'Policy Number' or 'Status' not found in offline data")
             return offline_df
         
-        # Define status priority (lower number = higher priority)
-        status_priority = {
-            'booked': 1,
-            'case lost': 2, 
-            'report pendency': 3,
-            'ticket closed duplicate': 4
-        }
+        # Statuses in priority order (earlier = higher priority)
+        status_order = ['booked', 'case lost', 'report pendency', 'ticket closed duplicate']
         
-        # Standardize status values for comparison
+        # Standardize status values and read the priority straight off the categorical codes
         offline_df = offline_df.copy()
-        offline_df['Status_Clean'] = offline_df['Status'].astype(str).str.strip().str.lower()
-        
-        # Add priority column
-        offline_df['Status_Priority'] = offline_df['Status_Clean'].map(status_priority)
+        status_clean = offline_df['Status'].astype(_STRING_DTYPE).str.strip().str.lower()
+        # Widen the int8 codes first so the 999 sentinel does not wrap
+        status_codes = pd.Categorical(status_clean, categories=status_order).codes.astype(np.int16)
         
-        # For unmapped statuses, assign lowest priority
-        offline_df['Status_Priority'] = offline_df['Status_Priority'].fillna(999)
+        # Priority 1-4 by position; unmapped statuses (code -1) get the lowest priority
+        offline_df['Status_Priority'] = np.where(status_codes < 0, 999, status_codes + 1)
         
         # Clean policy numbers for grouping
         offline_df['Policy_Clean'] = offline_df['Policy Number'].astype(str).str.strip().str.upper()
@@ -1395,10 +1903,10 @@ class InsuranceDataComparator:
         offline_df_sorted = offline_df.sort_values(['Policy_Clean', 'Status_Priority', 'Row_Index'])
         
         # Keep first record for each policy (highest priority)
-        deduplicated_df = offline_df_sorted.groupby('Policy_Clean').first().reset_index()
+        deduplicated_df = offline_df_sorted.drop_duplicates(subset='Policy_Clean', keep='first', ignore_index=True)
         
         # Remove helper columns
-        deduplicated_df = deduplicated_df.drop(['Status_Clean', 'Status_Priority', 'Policy_Clean', 'Row_Index'], axis=1)
+        deduplicated_df = deduplicated_df.drop(['Status_Priority', 'Policy_Clean', 'Row_Index'], axis=1)
         
         # Log duplicate handling summary
         original_count = len(offline_df)
@@ -1420,67 +1928,83 @@ class InsuranceDataComparator:
             return True, 100, "Both null"
         if pd.isna(internal_value) or pd.isna(mis_value):
             return False, 0, "One value is null"
+        return self._comparator_for(field_type)(internal_value, mis_value)
 
-        if field_type in ['customer_name', 'broker_name']:
-            clean_internal = self.clean_for_comparison(internal_value)
-            clean_mis = self.clean_for_comparison(mis_value)
-            score = self.fuzzy_match_score(clean_internal, clean_mis)
-            return score >= 80, score, f"Fuzzy match score: {score}%"
-        elif field_type in ['registration_number', 'engine_number', 'chassis_number', 'policy_number']:
-            clean_internal = self.clean_string(internal_value)
-            clean_mis = self.clean_string(mis_value)
-            match = clean_internal == clean_mis
-            return match, 100 if match else 0, "Exact match" if match else "No match"
-        elif field_type in ['policy_start_date', 'policy_end_date']:
-            date_internal = self.standardize_date(internal_value)
-            date_mis = self.standardize_date(mis_value)
-            match = date_internal is not None and date_internal == date_mis
-            return match, 100 if match else 0, "Date match" if match else "Date mismatch"
-        elif field_type in ['total_premium', 'tp_premium', 'sum_insured']:
-            try:
-                val_internal = float(str(internal_value).replace(',', ''))
-                val_mis = float(str(mis_value).replace(',', ''))
-                diff = abs(val_internal - val_mis)
-                match = diff <= 1.0
-                score = 100 if match else max(0, 100 - (diff / val_internal * 100)) if val_internal != 0 else 0
-                return match, score, f"Difference: ₹{diff:.2f}"
-            except (ValueError, TypeError):
-                return False, 0, "Invalid numeric values"
-        elif field_type == 'fuel_type':
-            clean_internal = self.clean_for_comparison(internal_value).upper()
-            clean_mis = self.clean_for_comparison(mis_value).upper()
-            lpg_variations = ['LPG', 'LIQUID PETROLEUM GAS', 'LIQUID PETROL GAS', 'LIQUID PETROLEUM']
-            if (clean_internal in lpg_variations and clean_mis in lpg_variations):
-                return True, 100, "LPG match"
-            match = clean_internal == clean_mis
-            return match, 100 if match else 0, "Exact match" if match else "No match"
-        else:
-            clean_internal = self.clean_for_comparison(internal_value).upper()
-            clean_mis = self.clean_for_comparison(mis_value).upper()
-            match = clean_internal == clean_mis
-            return match, 100 if match else 0, "Exact match" if match else "No match"
+    def _comparator_for(self, field_type):
+        """Comparator used for a field type; resolve once per field, not per value pair"""
+        return self._field_comparators.get(field_type, self._cmp_default)
+
+    def _cmp_fuzzy(self, internal_value, mis_value):
+        clean_internal = self.clean_for_comparison(internal_value)
+        clean_mis = self.clean_for_comparison(mis_value)
+        score = self.fuzzy_match_score(clean_internal, clean_mis)
+        return score >= 80, score, f"Fuzzy match score: {score}%"
+
+    def _cmp_exact_clean(self, internal_value, mis_value):
+        match = self.clean_string(internal_value) == self.clean_string(mis_value)
+        return match, 100 if match else 0, "Exact match" if match else "No match"
+
+    def _cmp_date(self, internal_value, mis_value):
+        date_internal = self.standardize_date(internal_value)
+        date_mis = self.standardize_date(mis_value)
+        match = date_internal is not None and date_internal == date_mis
+        return match, 100 if match else 0, "Date match" if match else "Date mismatch"
+
+    def _cmp_numeric(self, internal_value, mis_value):
+        try:
+            val_internal = float(str(internal_value).replace(',', ''))
+            val_mis = float(str(mis_value).replace(',', ''))
+            diff = abs(val_internal - val_mis)
+            match = diff <= 1.0
+            score = 100 if match else max(0, 100 - (diff / val_internal * 100)) if val_internal != 0 else 0
+            return match, score, f"Difference: ₹{diff:.2f}"
+        except (ValueError, TypeError):
+            return False, 0, "Invalid numeric values"
+
+    def _cmp_fuel(self, internal_value, mis_value):
+        clean_internal = self.clean_for_comparison(internal_value).upper()
+        clean_mis = self.clean_for_comparison(mis_value).upper()
+        if clean_internal in _LPG_VARIATIONS and clean_mis in _LPG_VARIATIONS:
+            return True, 100, "LPG match"
+        match = clean_internal == clean_mis
+        return match, 100 if match else 0, "Exact match" if match else "No match"
+
+    def _cmp_default(self, internal_value, mis_value):
+        match = self.clean_for_comparison(internal_value).upper() == self.clean_for_comparison(mis_value).upper()
+        return match, 100 if match else 0, "Exact match" if match else "No match"
 
     def get_insurer_from_company_name(self, company_name):
         """Identify insurer from company name"""
         if pd.isna(company_name):
             return None
         company_upper = str(company_name).upper()
-        exact_mappings = {
-            'DIGIT': 'DIGIT', 'LIBERTY': 'LIBERTY', 'MAGMA': 'MAGMA',
-            'NATIONAL': 'NATIONAL', 'UNITED': 'UNITED', 'SHRIRAM': 'SHRIRAM', 'FGI':'FGI','CHOLA':'CHOLA','HDFC':'HDFC',
-        }
-        for key, value in exact_mappings.items():
-            if key in company_upper:
-                return value
-        for insurer, variations in self.insurer_name_map.items():
-            for variation in variations:
-                if variation.upper() in company_upper:
-                    return insurer
-        return None
+        # Known aliases resolve with one hash lookup; anything else falls back to the substring scan
+        insurer = self._insurer_reverse_map.get(company_upper.strip())
+        if insurer is not None:
+            return insurer
+        return self._scan_insurer_name(company_upper)
+
+    def detect_insurer_series(self, company_names):
+        """Column-wise get_insurer_from_company_name: each distinct company name is resolved once
+        and the results are broadcast back with a single take over the factorized codes
+        """
+        codes, uniques = pd.factorize(company_names)
+        # Missing names factorize to -1, which picks the trailing None
+        resolved = np.array([self.get_insurer_from_company_name(name) for name in uniques] + [None], dtype=object)
+        return pd.Series(resolved[codes], index=company_names.index, name=company_names.name)
+
+    def _scan_insurer_name(self, company_upper):
+        """Substring scan over the insurer keywords and name variations (first match wins)"""
+        # The alternation only says whether any keyword occurs; which one wins is decided by
+        # priority order, not position in the name, so the ordered scan still picks the insurer
+        if not self._insurer_keyword_re.search(company_upper):
+            return None
+        return next((insurer for keyword, insurer in self._insurer_keywords if keyword in company_upper), None)
 
     def compare_datasets_async(self, internal_df, mis_df, insurer, selected_fields=None, progress_callback=None):
         """Compare datasets with two-way reconciliation and async progress updates"""
         results = []
+        record_frames = []
         
         # Merge current configured mappings with any runtime-resolved overrides
         base_mapping = self.column_mappings.get(insurer, {}) or {}
@@ -1518,7 +2042,7 @@ class InsuranceDataComparator:
         
         insurance_col = self.internal_columns['insurance_company']
         if insurance_col in internal_df.columns and 'Detected_Insurer' not in internal_df.columns:
-            internal_df['Detected_Insurer'] = internal_df[insurance_col].apply(self.get_insurer_from_company_name)
+            internal_df['Detected_Insurer'] = self.detect_insurer_series(internal_df[insurance_col])
         
         internal_insurer_df = internal_df[internal_df['Detected_Insurer'] == insurer].copy()
 
@@ -1562,47 +2086,14 @@ class InsuranceDataComparator:
                 'Details': f"MIS records: {filter_summary['original_count']:,} → {filter_summary['filtered_count']:,}"
             })
             
-            # Add processed endorsements to results
-            for endorsement in processed_endorsements:
-                policy_col = insurer_mapping.get('policy_number')
-                if isinstance(policy_col, list):
-                    policy_col = policy_col[0] if policy_col else None
-                
-                if policy_col and policy_col in endorsement:
-                    results.append({
-                        'Policy Number': endorsement[policy_col],
-                        'Request Id': endorsement.get('Request Id', 'N/A'),
-                        'Field': 'Endorsement Record',
-                        'Match Status': 'Endorsement',
-                        'Match Score': 100,
-                        'Internal Value': endorsement.get('Description', 'Endorsement Record'),
-                        'MIS Value': f"Endorsement #{endorsement.get('Endorsement_Sequence', 'N/A')}",
-                        'Details': f"Endorsement Number: {endorsement.get('Endorsement_Number', 'N/A')} | Insurer: {insurer}",
-                        'Record_Type': 'Endorsement',
-                        'Endorsement_Number': endorsement.get('Endorsement_Number', 'N/A'),
-                        'Endorsement_Sequence': endorsement.get('Endorsement_Sequence', 'N/A')
-                    })
-            
-            # Add processed cancellations to results
-            for cancellation in processed_cancellations:
-                policy_col = insurer_mapping.get('policy_number')
-                if isinstance(policy_col, list):
-                    policy_col = policy_col[0] if policy_col else None
-                
-                if policy_col and policy_col in cancellation:
-                    results.append({
-                        'Policy Number': cancellation[policy_col],
-                        'Request Id': cancellation.get('Request Id', 'N/A'),
-                        'Field': 'Cancellation Record',
-                        'Match Status': 'Cancellation',
-                        'Match Score': 100,
-                        'Internal Value': cancellation.get('Description', 'Cancellation Record'),
-                        'MIS Value': f"Cancellation #{cancellation.get('Cancellation_Sequence', 'N/A')}",
-                        'Details': f"Cancellation Number: {cancellation.get('Cancellation_Number', 'N/A')} | Insurer: {insurer}",
-                        'Record_Type': 'Cancellation',
-                        'Cancellation_Number': cancellation.get('Cancellation_Number', 'N/A'),
-                        'Cancellation_Sequence': cancellation.get('Cancellation_Sequence', 'N/A')
-                    })
+            # Add processed endorsements and cancellations to results, one frame per record type
+            record_policy_col = insurer_mapping.get('policy_number')
+            if isinstance(record_policy_col, list):
+                record_policy_col = record_policy_col[0] if record_policy_col else None
+            record_frames = [
+                self._record_result_frame(processed_endorsements, record_policy_col, 'Endorsement', insurer),
+                self._record_result_frame(processed_cancellations, record_policy_col, 'Cancellation', insurer),
+            ]
 
         mis_policy_col = insurer_mapping.get('policy_number')
         
@@ -1634,33 +2125,45 @@ class InsuranceDataComparator:
                 logger.error(f"Policy number column (tried {original_list}) not found in MIS data for {insurer}")
                 logger.error(f"Available columns: {list(mis_df_filtered.columns)}")
                 if progress_callback: progress_callback(1.0, f"Error: None of the policy columns {original_list} found in MIS file.")
-                return pd.DataFrame(results), {}
+                return _concat_result_frames([pd.DataFrame(results), *record_frames]), {}
         elif not mis_policy_col or mis_policy_col not in mis_df_filtered.columns:
             possible_cols = self.column_mappings.get(insurer, {}).get('policy_number', 'N/A')
             logger.error(f"Policy number column (tried {possible_cols}) not found in MIS data for {insurer}")
             if progress_callback: progress_callback(1.0, f"Error: Policy column for {insurer} not found in MIS file.")
-            return pd.DataFrame(results), {}
-
-        # Use sets for efficient tracking of matched policies
-        mis_df_filtered['cleaned_policy'] = mis_df_filtered[mis_policy_col].apply(self.clean_string)
-        internal_insurer_df['cleaned_policy'] = internal_insurer_df[self.internal_columns['policy_number']].apply(self.clean_string)
-        
-        matched_mis_policies_cleaned = set()
-        
-        mis_lookup_cleaned = {row['cleaned_policy']: row for _, row in mis_df_filtered.iterrows() if row['cleaned_policy']}
+            return _concat_result_frames([pd.DataFrame(results), *record_frames]), {}
+
+        mis_df_filtered['cleaned_policy'] = self.clean_string_series(mis_df_filtered[mis_policy_col])
+        internal_insurer_df['cleaned_policy'] = self.clean_string_series(internal_insurer_df[self.internal_columns['policy_number']])
+
+        # Index the distinct cleaned MIS policies (the last row wins for duplicates, as before) and
+        # resolve every internal policy to a MIS row position with one hash-table probe (-1 = not
+        # found); cells are then read from per-column arrays, so no MIS row is boxed into a Series
+        mis_cleaned = mis_df_filtered['cleaned_policy']
+        mis_last_rows = (~mis_cleaned.duplicated(keep='last') & (mis_cleaned != '')).to_numpy()
+        mis_policy_index = pd.Index(mis_cleaned.to_numpy(dtype=object)[mis_last_rows])
+        mis_policy_rows = np.flatnonzero(mis_last_rows)
+        internal_lookup = mis_policy_index.get_indexer(internal_insurer_df['cleaned_policy'].to_numpy(dtype=object))
+        # A trailing -1 lets the not-found code (-1) index straight through
+        internal_mis_positions = np.append(mis_policy_rows, -1)[internal_lookup]
+        mapped_mis_cols = {mis_policy_col}
+        for mapped in insurer_mapping.values():
+            mapped_mis_cols.update(mapped if isinstance(mapped, list) else [mapped])
+        mis_arrays = {col: mis_df_filtered[col].to_numpy(dtype=object)
+                      for col in mis_df_filtered.columns if col in mapped_mis_cols}
 
         processed = 0
         batch_size = 500
+        comparison_columns = {name: [] for name in _RESULT_COLUMNS}
         
         for start_idx in range(0, total_policies, batch_size):
             end_idx = min(start_idx + batch_size, total_policies)
             batch_df = internal_insurer_df.iloc[start_idx:end_idx]
             
-            batch_results, batch_matched_policies = self._process_batch_optimized(
-                batch_df, mis_lookup_cleaned, insurer_mapping
+            batch_columns = self._process_batch_optimized(
+                batch_df, internal_mis_positions[start_idx:end_idx], mis_arrays, insurer_mapping
             )
-            results.extend(batch_results)
-            matched_mis_policies_cleaned.update(batch_matched_policies)
+            for name, values in batch_columns.items():
+                comparison_columns[name].extend(values)
 
             processed = end_idx
             if progress_callback:
@@ -1670,9 +2173,6 @@ class InsuranceDataComparator:
         # Reverse check for MIS policies not in internal data
         if progress_callback: progress_callback(0.9, "Performing reverse check...")
         
-        all_mis_policies_cleaned = set(mis_df_filtered['cleaned_policy'].unique())
-        not_found_in_internal_policies = all_mis_policies_cleaned - matched_mis_policies_cleaned
-
         mis_premium_col = insurer_mapping.get('total_premium')
         
         # Handle case where total_premium is a list of possible column names
@@ -1695,31 +2195,43 @@ class InsuranceDataComparator:
                 logger.warning(f"Premium column (tried {insurer_mapping.get('total_premium')}) not found in MIS data for {insurer}")
                 mis_premium_col = None
         
-        for policy in not_found_in_internal_policies:
-            if not policy: continue
-            mis_row = mis_lookup_cleaned.get(policy)
-            if mis_row is not None:
-                results.append({
-                    'Policy Number': mis_row[mis_policy_col],
-                    'Request Id': 'N/A',
-                    'Field': 'Policy Number',
-                    'Match Status': 'Not Found in Internal',
-                    'Match Score': 0,
-                    'Internal Value': 'Not Found in Internal Data',
-                    'MIS Value': mis_row[mis_policy_col],
-                    'Details': 'Policy exists in MIS but not in internal data',
-                    'MIS Premium': pd.to_numeric(mis_row.get(mis_premium_col), errors='coerce') if mis_premium_col else 0
-                })
-
-        if progress_callback: progress_callback(1.0, f"Completed: {len(results):,} comparisons")
+        # Distinct MIS policies that no internal policy resolved to, in MIS row order
+        unmatched = np.ones(len(mis_policy_index), dtype=bool)
+        unmatched[internal_lookup[internal_lookup >= 0]] = False
+        unmatched_rows = mis_policy_rows[unmatched]
+        unmatched_policies = mis_arrays[mis_policy_col][unmatched_rows]
+        # A mapped premium column the MIS file doesn't have gives NaN premiums, as a missing cell does
+        if not mis_premium_col:
+            unmatched_premiums = 0
+        elif mis_premium_col in mis_arrays:
+            unmatched_premiums = pd.to_numeric(mis_arrays[mis_premium_col][unmatched_rows], errors='coerce')
+        else:
+            unmatched_premiums = np.nan
+        reverse_df = pd.DataFrame({
+            'Policy Number': unmatched_policies,
+            'Request Id': 'N/A',
+            'Field': 'Policy Number',
+            'Match Status': 'Not Found in Internal',
+            'Match Score': 0,
+            'Internal Value': 'Not Found in Internal Data',
+            'MIS Value': unmatched_policies,
+            'Details': 'Policy exists in MIS but not in internal data',
+            'MIS Premium': unmatched_premiums
+        })
+
+        # Stitch the filter info and endorsement/cancellation rows ahead of the comparison columns,
+        # which become a single frame rather than one per batch, and the reverse-check rows
+        results_df = _concat_result_frames([pd.DataFrame(results), *record_frames, pd.DataFrame(comparison_columns), reverse_df])
+
+        if progress_callback: progress_callback(1.0, f"Completed: {len(results_df):,} comparisons")
         
         # Calculate how many MIS policies were found in internal database
-        results_df = pd.DataFrame(results)
         if not results_df.empty:
             # Count unique MIS policies that have any match (Match or Mismatch, not "Not Found in Internal")
-            found_in_internal_count = len(results_df[
-                results_df['Match Status'].isin(['Match', 'Mismatch'])
-            ]['Policy Number'].unique())
+            # Select just the one column instead of filtering the whole frame first
+            found_in_internal_count = results_df.loc[
+                results_df['Match Status'].isin(['Match', 'Mismatch']).to_numpy(), 'Policy Number'
+            ].nunique(dropna=False)
         else:
             found_in_internal_count = 0
         
@@ -1733,59 +2245,187 @@ class InsuranceDataComparator:
             "found_in_internal_count": found_in_internal_count
         }
 
-    def _process_batch_optimized(self, batch_df, mis_lookup_cleaned, resolved_mapping):
-        """Process a batch of data with corrected 'Not Found' status."""
-        batch_results = []
-        batch_matched_policies = set()
+    def _record_result_frame(self, records, policy_col, label, insurer):
+        """Result rows for processed endorsement or cancellation records, built column-wise.
+        The records come from process_endorsements_cancellations and share one set of keys.
+        """
+        if not records or not policy_col or policy_col not in records[0]:
+            return pd.DataFrame()
+        frame = pd.DataFrame.from_records(records)
+        numbers = frame[f'{label}_Number']
+        sequences = frame[f'{label}_Sequence']
+        return pd.DataFrame({
+            'Policy Number': frame[policy_col],
+            'Request Id': frame['Request Id'],
+            'Field': f'{label} Record',
+            'Match Status': label,
+            'Match Score': 100,
+            'Internal Value': frame['Description'],
+            'MIS Value': f'{label} #' + sequences.astype(str),
+            'Details': f'{label} Number: ' + numbers.astype(str) + f' | Insurer: {insurer}',
+            'Record_Type': label,
+            f'{label}_Number': numbers,
+            f'{label}_Sequence': sequences,
+        })
+
+    def _process_batch_optimized(self, batch_df, mis_positions, mis_arrays, resolved_mapping):
+        """Process a batch of data with corrected 'Not Found' status.
+        mis_positions holds each batch row's matching MIS row position, or -1 when not found.
+        Results are accumulated and returned column-wise (a dict of lists keyed by _RESULT_COLUMNS).
+        """
+        columns = {name: [] for name in _RESULT_COLUMNS}
+        fuzzy_pending = []
+        exact_pending = []
+        numeric_pending = []
+        date_pending = []
         internal_policy_col = self.internal_columns['policy_number']
 
-        for _, internal_row in batch_df.iterrows():
-            policy_number = internal_row.get(internal_policy_col)
+        def add_result(policy_number, request_id, field, status, score, internal_value, mis_value, details):
+            for name, value in zip(_RESULT_COLUMNS, (policy_number, request_id, field, status, score, internal_value, mis_value, details)):
+                columns[name].append(value)
+
+        if batch_df.empty or internal_policy_col not in batch_df.columns:
+            return columns
+
+        # The schema is fixed within a batch, so resolve the comparable fields once and
+        # read plain column arrays instead of boxing every row into a Series
+        # Comparators (or the batch-scored queue) are likewise resolved per field, not per row
+        all_fields_to_compare = self._comparable_fields_for(batch_df, resolved_mapping)
+        deferred_by_field = {
+            **dict.fromkeys(_FUZZY_FIELDS, fuzzy_pending),
+            **dict.fromkeys(_EXACT_FIELDS, exact_pending),
+            **dict.fromkeys(_NUMERIC_FIELDS, numeric_pending),
+            **dict.fromkeys(_DATE_FIELDS, date_pending),
+        }
+        compare_plan = [
+            (field.replace('_', ' ').title(), batch_df[internal_col_name].to_numpy(dtype=object),
+             mis_arrays.get(resolved_mapping.get(field)) if isinstance(resolved_mapping.get(field), str) else None,
+             deferred_by_field.get(field), self._comparator_for(field))
+            for field, internal_col_name in all_fields_to_compare.items()
+            if field != 'policy_number' and resolved_mapping.get(field) and internal_col_name in batch_df.columns
+        ]
+        policy_numbers = batch_df[internal_policy_col].to_numpy(dtype=object)
+        request_ids = batch_df['Request Id'].to_numpy(dtype=object) if 'Request Id' in batch_df.columns else None
+        mis_row_positions = mis_positions.tolist()
+
+        for i, policy_number in enumerate(policy_numbers):
             if pd.isna(policy_number):
                 continue
 
-            request_id = internal_row.get('Request Id', 'N/A')
-            cleaned_policy = internal_row['cleaned_policy']
-
-            mis_row = mis_lookup_cleaned.get(cleaned_policy)
-
-            if mis_row is None:
-                batch_results.append({
-                    'Policy Number': policy_number,
-                    'Request Id': request_id,
-                    'Field': 'Policy Number',
-                    'Match Status': 'Not Found in MIS',
-                    'Match Score': 0,
-                    'Internal Value': policy_number,
-                    'MIS Value': 'Not Found in MIS',
-                    'Details': 'Policy from internal data not found in MIS data'
-                })
+            request_id = request_ids[i] if request_ids is not None else 'N/A'
+            mis_pos = mis_row_positions[i]
+
+            if mis_pos < 0:
+                add_result(policy_number, request_id, 'Policy Number', 'Not Found in MIS', 0,
+                           policy_number, 'Not Found in MIS', 'Policy from internal data not found in MIS data')
                 continue
-            
-            batch_matched_policies.add(cleaned_policy)
-            # Get all fields to compare (both predefined internal columns and dynamically mapped fields)
-            all_fields_to_compare = self.get_all_comparable_fields(resolved_mapping, internal_row)
-            
-            for field, internal_col_name in all_fields_to_compare.items():
-                mis_col = resolved_mapping.get(field)
-                if mis_col and internal_col_name in internal_row.index:
-                    if field == 'policy_number':
-                        continue
-                    internal_value = internal_row[internal_col_name]
-                    mis_value = mis_row.get(mis_col)
-                    match, score, details = self.compare_values(internal_value, mis_value, field)
-                    batch_results.append({
-                        'Policy Number': policy_number,
-                        'Request Id': request_id,
-                        'Field': field.replace('_', ' ').title(),
-                        'Match Status': 'Match' if match else 'Mismatch',
-                        'Match Score': score,
-                        'Internal Value': internal_value,
-                        'MIS Value': mis_value,
-                        'Details': details
-                    })
-        return batch_results, batch_matched_policies
+
+            for field_label, internal_values, mis_values, deferred, comparator in compare_plan:
+                internal_value = internal_values[i]
+                mis_value = mis_values[mis_pos] if mis_values is not None else None
+                internal_null, mis_null = pd.isna(internal_value), pd.isna(mis_value)
+                if internal_null or mis_null:
+                    match, score, details = (True, 100, "Both null") if internal_null and mis_null else (False, 0, "One value is null")
+                elif deferred is not None:
+                    # Name, identifier, amount and date fields are scored together for the whole batch below
+                    deferred.append((len(columns['Policy Number']), internal_value, mis_value))
+                    match, score, details = False, 0, ''
+                else:
+                    match, score, details = comparator(internal_value, mis_value)
+                add_result(policy_number, request_id, field_label,
+                           'Match' if match else 'Mismatch', score, internal_value, mis_value, details)
+
+        if fuzzy_pending:
+            self._score_fuzzy_batch(columns, fuzzy_pending)
+        if exact_pending:
+            self._score_exact_batch(columns, exact_pending)
+        if numeric_pending:
+            self._score_numeric_batch(columns, numeric_pending)
+        if date_pending:
+            self._score_date_batch(columns, date_pending)
+        return columns
+
+    def _score_date_batch(self, columns, date_pending):
+        """Compare deferred policy dates after standardizing both sides column-wise"""
+        internal_dates = _standardize_dates([value for _, value, _ in date_pending])
+        mis_dates = _standardize_dates([value for _, _, value in date_pending])
+        for (result_index, _, _), date_internal, date_mis in zip(date_pending, internal_dates, mis_dates):
+            match = date_internal is not None and date_internal == date_mis
+            columns['Match Status'][result_index] = 'Match' if match else 'Mismatch'
+            columns['Match Score'][result_index] = 100 if match else 0
+            columns['Details'][result_index] = "Date match" if match else "Date mismatch"
+
+    def _score_numeric_batch(self, columns, numeric_pending):
+        """Compare deferred amount fields with vectorized parsing and tolerance checks"""
+        internal_amounts, internal_valid = _parse_amounts([value for _, value, _ in numeric_pending])
+        mis_amounts, mis_valid = _parse_amounts([value for _, _, value in numeric_pending])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diffs = np.abs(internal_amounts - mis_amounts)
+            raw_scores = 100 - (diffs / internal_amounts * 100)
+        rows = zip(numeric_pending, (internal_valid & mis_valid).tolist(), internal_amounts.tolist(),
+                   diffs.tolist(), (diffs <= 1.0).tolist(), raw_scores.tolist())
+        for (result_index, _, _), valid, internal_amount, diff, match, raw_score in rows:
+            if not valid:
+                match, score, details = False, 0, "Invalid numeric values"
+            else:
+                # Same typing as compare_values: int 100/0, otherwise max(0, raw_score)
+                score = 100 if match else max(0, raw_score) if internal_amount != 0 else 0
+                details = f"Difference: ₹{diff:.2f}"
+            columns['Match Status'][result_index] = 'Match' if match else 'Mismatch'
+            columns['Match Score'][result_index] = score
+            columns['Details'][result_index] = details
+
+    def _score_exact_batch(self, columns, exact_pending):
+        """Compare deferred identifier fields with one vectorized equality over the cleaned values"""
+        internal_clean = self.clean_string_series(pd.Series([value for _, value, _ in exact_pending], dtype=object))
+        mis_clean = self.clean_string_series(pd.Series([value for _, _, value in exact_pending], dtype=object))
+        matches = internal_clean.to_numpy() == mis_clean.to_numpy()
+        for (result_index, _, _), match in zip(exact_pending, matches.tolist()):
+            columns['Match Status'][result_index] = 'Match' if match else 'Mismatch'
+            columns['Match Score'][result_index] = 100 if match else 0
+            columns['Details'][result_index] = "Exact match" if match else "No match"
+
+    def _score_fuzzy_batch(self, columns, fuzzy_pending):
+        """Score deferred name comparisons pairwise in one multi-threaded rapidfuzz call.
+        Repeated name pairs (broker names especially) are scored once, and identical
+        names short-circuit to 100 without calling the scorer.
+        """
+        pair_keys = [(self.clean_for_comparison(internal_value).upper(), self.clean_for_comparison(mis_value).upper())
+                     for _, internal_value, mis_value in fuzzy_pending]
+        unique_pairs = list(dict.fromkeys(pair_keys))
+        pair_scores = {pair: 100 for pair in unique_pairs if pair[0] == pair[1]}
+        residual_pairs = [pair for pair in unique_pairs if pair[0] != pair[1]]
+        if residual_pairs:
+            if hasattr(process, 'cpdist'):
+                # Bounded so each batch doesn't spawn a thread per core on top of the comparator's pool
+                scores = process.cpdist([a for a, _ in residual_pairs], [b for _, b in residual_pairs],
+                                        scorer=Indel.normalized_similarity, dtype=np.float64,
+                                        workers=self.fuzzy_workers)
+            else:
+                # rapidfuzz < 3.6 has no cpdist; score the pairs one at a time
+                scores = [Indel.normalized_similarity(a, b) for a, b in residual_pairs]
+            pair_scores.update((pair, round(float(score) * 100)) for pair, score in zip(residual_pairs, scores))
+        for (result_index, _, _), pair in zip(fuzzy_pending, pair_keys):
+            score = pair_scores[pair]
+            columns['Match Status'][result_index] = 'Match' if score >= 80 else 'Mismatch'
+            columns['Match Score'][result_index] = score
+            columns['Details'][result_index] = f"Fuzzy match score: {score}%"
     
+    def _comparable_fields_for(self, batch_df, resolved_mapping):
+        """get_all_comparable_fields memoized on the batch's columns and the mapping contents"""
+        mapping_key = tuple((field, tuple(col) if isinstance(col, list) else col) for field, col in resolved_mapping.items())
+        cache_key = (tuple(batch_df.columns), mapping_key)
+        comparable_fields = self._comparable_fields_cache.get(cache_key)
+        if comparable_fields is not None:
+            self._comparable_fields_cache.move_to_end(cache_key)
+            return comparable_fields
+        # Only the row's index (the column names) is consulted, so an empty row stands in for a real one
+        comparable_fields = self.get_all_comparable_fields(resolved_mapping, pd.Series(index=batch_df.columns, dtype=object))
+        self._comparable_fields_cache[cache_key] = comparable_fields
+        if len(self._comparable_fields_cache) > self._comparable_fields_cache_size:
+            self._comparable_fields_cache.popitem(last=False)
+        return comparable_fields
+
     def get_all_comparable_fields(self, resolved_mapping, internal_row):
         """Get all fields that can be compared (predefined + dynamically mapped).
         Ensures each field maps to an actual column in the internal row, with fallback matching.
@@ -1866,8 +2506,7 @@ class InsuranceDataComparator:
         
         # If no exact match, try partial matching
         field_lower = field.lower().replace('_', '')
-        for col in internal_row.index:
-            col_lower = str(col).lower().replace(' ', '').replace('_', '')
+        for col_lower, col in _normalized_columns(tuple(internal_row.index)):
             if field_lower in col_lower or col_lower in field_lower:
                 logger.info(f"Found partial match for {field}: {col}")
                 return col
@@ -1876,40 +2515,22 @@ class InsuranceDataComparator:
     
     def get_sheet_name_for_insurer(self, insurer: str) -> Optional[str]:
         """Get the sheet name for a specific insurer"""
-        insurer_upper = insurer.upper()
-        if insurer_upper in self.sheet_mapping:
-            sheet_name = self.sheet_mapping[insurer_upper]
-            return sheet_name[0] if isinstance(sheet_name, list) else sheet_name
-        if 'ROYAL' in insurer_upper and 'SUNDARAM' in insurer_upper:
-            return self.sheet_mapping.get('ROYAL_SUNDARAM', 'Sheet1')
-        if 'FUTURE' in insurer_upper or 'GENERALI' in insurer_upper:
-            return self.sheet_mapping.get('FGI', 'Sheet1')
-        if 'CHOLAMANDALAM' in insurer_upper or 'CHOLA' in insurer_upper:
-            return self.sheet_mapping.get('CHOLA', 'Sheet1')
-        return 'Sheet1'
+        return _sheet_name_for_insurer(insurer.upper())
 
     def read_excel_with_sheet_detection(self, filepath: str, insurer: str) -> Optional[pd.DataFrame]:
         """Read Excel file with specific sheet detection for insurer"""
         try:
             expected_sheet = self.get_sheet_name_for_insurer(insurer)
             logger.info(f"Attempting to read {insurer} file: {filepath} with expected sheet: {expected_sheet}")
-            try:
-                return pd.read_excel(filepath, sheet_name=expected_sheet)
-            except Exception as e:
-                logger.warning(f"Could not read expected sheet '{expected_sheet}': {e}")
-                excel_file = pd.ExcelFile(filepath)
-                available_sheets = excel_file.sheet_names
-                logger.info(f"Available sheets: {available_sheets}")
-                sheet_options = self.sheet_mapping.get(insurer.upper(), [])
-                if isinstance(sheet_options, list):
-                    for sheet in sheet_options:
-                        if sheet in available_sheets:
-                            return pd.read_excel(filepath, sheet_name=sheet)
-                common_sheets = ['Sheet1', 'Data', 'Raw', 'Digital', 'New', 'New Business']
-                for sheet in common_sheets:
-                    if sheet in available_sheets:
-                        return pd.read_excel(filepath, sheet_name=sheet)
-                return pd.read_excel(filepath, sheet_name=0)
+            sheet_options = self.sheet_mapping.get(insurer.upper(), [])
+            sheet_options = tuple(sheet_options) if isinstance(sheet_options, list) else ()
+            # Keyed on the modification time so an edited file is read again; callers
+            # mutate the frame, so they get a copy of the memoized parse (a lazy one
+            # under copy-on-write)
+            mtime_ns = os.stat(filepath).st_mtime_ns
+            return _read_cached_source(
+                filepath, f"mis|{expected_sheet}|{sheet_options}",
+                lambda: _read_mis_workbook(filepath, mtime_ns, expected_sheet, sheet_options).copy())
         except Exception as e:
             logger.error(f"Error reading Excel file {filepath}: {e}")
             return None
@@ -1929,6 +2550,16 @@ class InsuranceDataComparator:
 
 class DashboardView:
     """Dashboard view integrated into the main app"""
+    # Status text colours in the detail table
+    _TABLE_STATUS_COLORS = {
+        'Match': ft.Colors.GREEN_700,
+        'Mismatch': ft.Colors.ORANGE_700,
+        'Not Found in Internal': ft.Colors.RED_700,
+        'Not Found in MIS': ft.Colors.PURPLE_700,
+        'Endorsement': ft.Colors.BLUE_700,
+        'Cancellation': ft.Colors.RED_800
+    }
+
     def __init__(self, page: ft.Page, main_app):
         self.page = page
         self.main_app = main_app
@@ -1936,6 +2567,9 @@ class DashboardView:
         self.filtered_df = None
         self.datatable_page_number = 1
         self.rows_per_page = 50
+        # Policy search refilters once typing pauses for this long instead of on every keystroke
+        self.search_debounce_seconds = 0.25
+        self._search_task = None
         # UI Control References
         self.kpi_cards = None
         self.status_filter = None
@@ -1944,18 +2578,28 @@ class DashboardView:
         self.bar_chart = None
         self.pie_chart = None
         self.data_table = None
+        # Detail-table rows allocated once per layout and refilled on every refresh
+        self._row_pool = []
         self.pagination_controls = None
         self.dashboard_content = None
 
     def build_dashboard(self, results_df):
         """Build the dashboard with the results data"""
-        self.df = results_df.copy()
+        # With copy-on-write (enabled in main) this shares results_df's columns, and the
+        # reassignments below only materialize the columns they replace
+        copy_on_write = int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
+        self.df = results_df if copy_on_write else results_df.copy()
         # Clean the data
         self.df = self.df[self.df['Policy Number'] != 'FILTER_INFO'] if 'Policy Number' in self.df.columns else self.df
         self.df['Match Score'] = pd.to_numeric(self.df['Match Score'], errors='coerce')
-        self.df['Internal Value'] = self.df['Internal Value'].astype(str)
-        self.df['MIS Value'] = self.df['MIS Value'].astype(str)
-        self.filtered_df = self.df.copy()
+        # Arrow-backed after the str conversion, so missing values still display as 'nan'
+        self.df['Internal Value'] = self.df['Internal Value'].astype(str).astype(_STRING_DTYPE)
+        self.df['MIS Value'] = self.df['MIS Value'].astype(str).astype(_STRING_DTYPE)
+        # A handful of distinct values each: filters and counts then work on integer codes
+        self.df['Match Status'] = self.df['Match Status'].astype('category')
+        self.df['Field'] = self.df['Field'].astype('category')
+        # The views only read filtered_df, so the unfiltered state can share self.df
+        self.filtered_df = self.df
         return self._create_dashboard_layout()
 
     def _create_dashboard_layout(self):
@@ -1978,7 +2622,7 @@ class DashboardView:
         )
         self.policy_search = ft.TextField(
             label="Search by Policy Number",
-            on_change=self.apply_filters,
+            on_change=self.on_policy_search_change,
             prefix_icon=ft.Icons.SEARCH,
             width=250
         )
@@ -2006,6 +2650,7 @@ class DashboardView:
             horizontal_lines=ft.border.BorderSide(1, ft.Colors.GREY_200),
             heading_row_color=ft.Colors.GREY_50,
         )
+        self._row_pool = [self._create_table_row() for _ in range(self.rows_per_page)]
         self.pagination_controls = ft.Row(alignment=ft.MainAxisAlignment.CENTER)
         self.dashboard_content = ft.Column([
             ft.Row([
@@ -2046,53 +2691,70 @@ class DashboardView:
         self.update_all_visuals()
         return self.dashboard_content
 
+    def on_policy_search_change(self, e):
+        """Debounce the policy search: each keystroke cancels the pending search task on the
+        page's event loop and schedules a new one, so only the last one ever filters
+        """
+        if self._search_task is not None:
+            self._search_task.cancel()
+        self._search_task = self.page.run_task(self._debounced_search, e)
+
+    async def _debounced_search(self, e):
+        await asyncio.sleep(self.search_debounce_seconds)
+        self.apply_filters(e)
+
     def apply_filters(self, e):
         """Apply filters to the data"""
-        self.filtered_df = self.df.copy()
+        # Combine the active filters into one mask and slice once; no filters means no copy at all
+        mask = np.ones(len(self.df), dtype=bool)
         if self.status_filter.value:
-            self.filtered_df = self.filtered_df[self.filtered_df['Match Status'] == self.status_filter.value]
+            mask &= self.df['Match Status'].eq(self.status_filter.value).to_numpy()
         if self.field_filter.value:
-            self.filtered_df = self.filtered_df[self.filtered_df['Field'] == self.field_filter.value]
+            mask &= self.df['Field'].eq(self.field_filter.value).to_numpy()
         if self.policy_search.value:
-            self.filtered_df = self.filtered_df[
-                self.filtered_df['Policy Number'].str.contains(
-                    self.policy_search.value, case=False, na=False
-                )
-            ]
+            mask &= self.df['Policy Number'].str.contains(
+                self.policy_search.value, case=False, na=False
+            ).to_numpy(dtype=bool)
+        self.filtered_df = self.df[mask] if not mask.all() else self.df
         self.datatable_page_number = 1
         self.update_all_visuals()
 
     def update_all_visuals(self):
         """Update all dashboard components"""
-        self.update_kpis()
-        self.update_charts()
+        # Scan the status column once per refresh and share the results with the KPIs and charts
+        status = self.filtered_df['Match Status']
+        # Categorical value_counts also lists unused categories, so drop the zero counts
+        status_counts = status.value_counts()
+        status_counts = status_counts[status_counts > 0]
+        is_mismatch = status.eq('Mismatch').to_numpy()
+        mismatch_field_counts = self.filtered_df['Field'][is_mismatch].value_counts()
+        mismatch_field_counts = mismatch_field_counts[mismatch_field_counts > 0]
+        self.update_kpis(status_counts, is_mismatch)
+        self.update_charts(status_counts, mismatch_field_counts)
         self.update_datatable()
         self.page.update()
 
-    def update_kpis(self):
-        """Update KPI cards"""
+    def update_kpis(self, status_counts, is_mismatch):
+        """Update KPI cards from the per-refresh status counts and mismatch mask"""
         total_records = len(self.filtered_df)
-        mismatches = len(self.filtered_df[self.filtered_df['Match Status'] == 'Mismatch'])
-        matches = len(self.filtered_df[self.filtered_df['Match Status'] == 'Match'])
-        not_found_internal = len(self.filtered_df[self.filtered_df['Match Status'] == 'Not Found in Internal'])
-        not_found_mis = len(self.filtered_df[self.filtered_df['Match Status'] == 'Not Found in MIS'])
+        mismatches = int(status_counts.get('Mismatch', 0))
+        matches = int(status_counts.get('Match', 0))
+        not_found_internal = int(status_counts.get('Not Found in Internal', 0))
+        not_found_mis = int(status_counts.get('Not Found in MIS', 0))
         
         match_rate = (matches / total_records * 100) if total_records > 0 else 0
         
         premium_mismatches = self.filtered_df[
-            (self.filtered_df['Match Status'] == 'Mismatch') &
-            (self.filtered_df['Field'].isin(['Total Premium', 'Tp Premium', 'Final Tp Premium']))
+            is_mismatch &
+            self.filtered_df['Field'].isin(['Total Premium', 'Tp Premium', 'Final Tp Premium']).to_numpy()
         ]
         total_mismatch_value = 0
         if not premium_mismatches.empty:
-            for _, row in premium_mismatches.iterrows():
-                details = row['Details']
-                if isinstance(details, str) and '₹' in details:
-                    try:
-                        amount_str = details.split('₹')[1].split()[0].replace(',', '')
-                        total_mismatch_value += float(amount_str)
-                    except:
-                        pass
+            # Pull the amount after the first ₹ out of every "Difference: ₹..." detail in one pass
+            amount_texts = premium_mismatches['Details'].str.extract(_RE_RUPEE_AMOUNT, expand=False).dropna()
+            if not amount_texts.empty:
+                amounts, valid = _parse_amounts(amount_texts.tolist())
+                total_mismatch_value = float(amounts[valid].sum())
         # Helper function to format large numbers compactly
         def format_number(num):
             if num >= 1_000_000:
@@ -2162,37 +2824,36 @@ class DashboardView:
             height=85
         )
 
-    def update_charts(self):
+    def update_charts(self, status_counts, mismatch_field_counts):
         """Update the bar and pie charts"""
         # Bar Chart
-        mismatch_data = self.filtered_df[self.filtered_df['Match Status'] == 'Mismatch']
-        if not mismatch_data.empty:
-            field_counts = mismatch_data['Field'].value_counts().head(10)
+        if not mismatch_field_counts.empty:
+            field_counts = mismatch_field_counts.head(10)
             bar_content = ft.Column([
                 ft.Text("Top Mismatched Fields", size=16, weight=ft.FontWeight.BOLD),
                 ft.Divider(),
             ])
-            max_count = field_counts.max() if not field_counts.empty else 1
-            for field, count in field_counts.items():
-                bar_width = (count / max_count) * 300 if max_count > 0 else 0
-                bar_content.controls.append(
-                    ft.Row([
-                        ft.Text(field[:20], width=120, size=12),
-                        ft.Container(
-                            bgcolor=ft.Colors.ORANGE_400,
-                            width=bar_width,
-                            height=20,
-                            border_radius=5
-                        ),
-                        ft.Text(str(count), size=12)
-                    ])
-                )
+            counts = field_counts.to_numpy()
+            max_count = counts.max()
+            bar_widths = (counts / max_count) * 300 if max_count > 0 else np.zeros(len(counts))
+            bar_content.controls.extend(
+                ft.Row([
+                    ft.Text(field[:20], width=120, size=12),
+                    ft.Container(
+                        bgcolor=ft.Colors.ORANGE_400,
+                        width=bar_width,
+                        height=20,
+                        border_radius=5
+                    ),
+                    ft.Text(str(count), size=12)
+                ])
+                for field, count, bar_width in zip(field_counts.index, counts, bar_widths)
+            )
             self.bar_chart.content = bar_content
         else:
             self.bar_chart.content = ft.Text("No mismatches to display", size=14, color=ft.Colors.GREY_600)
         
         # Pie Chart
-        status_counts = self.filtered_df['Match Status'].value_counts()
         pie_content = ft.Column([
             ft.Text("Match Status Distribution", size=16, weight=ft.FontWeight.BOLD),
             ft.Divider(),
@@ -2205,22 +2866,34 @@ class DashboardView:
             'Endorsement': ft.Colors.BLUE_400,
             'Cancellation': ft.Colors.RED_600
         }
-        total = status_counts.sum()
-        for status, count in status_counts.items():
-            percentage = (count / total * 100) if total > 0 else 0
-            pie_content.controls.append(
-                ft.Row([
-                    ft.Container(
-                        bgcolor=Colors.get(status, ft.Colors.GREY_400),
-                        width=20,
-                        height=20,
-                        border_radius=5
-                    ),
-                    ft.Text(f"{status}: {count:,} ({percentage:.1f}%)", size=12)
-                ])
-            )
+        counts = status_counts.to_numpy()
+        total = counts.sum()
+        percentages = (counts / total * 100) if total > 0 else np.zeros(len(counts))
+        pie_content.controls.extend(
+            ft.Row([
+                ft.Container(
+                    bgcolor=Colors.get(status, ft.Colors.GREY_400),
+                    width=20,
+                    height=20,
+                    border_radius=5
+                ),
+                ft.Text(f"{status}: {count:,} ({percentage:.1f}%)", size=12)
+            ])
+            for status, count, percentage in zip(status_counts.index, counts, percentages)
+        )
         self.pie_chart.content = pie_content
 
+    def _create_table_row(self):
+        """Blank detail-table row; update_datatable fills in the cell values."""
+        return ft.DataRow(cells=[
+            ft.DataCell(ft.Text("", size=11)),
+            ft.DataCell(ft.Text("", size=11)),
+            ft.DataCell(ft.Text("", size=11)),
+            ft.DataCell(ft.Text("", size=11, weight=ft.FontWeight.BOLD)),
+            ft.DataCell(ft.Text("", size=11)),
+            ft.DataCell(ft.Text("", size=11)),
+        ])
+
     def update_datatable(self, e=None, direction=0):
         """Update the data table with pagination"""
         if e:
@@ -2239,29 +2912,26 @@ class DashboardView:
             ft.DataColumn(ft.Text("Internal", size=12)),
             ft.DataColumn(ft.Text("MIS", size=12)),
         ]
-        self.data_table.rows = []
-        for _, row in page_df.iterrows():
-            status_color = {
-                'Match': ft.Colors.GREEN_700,
-                'Mismatch': ft.Colors.ORANGE_700,
-                'Not Found in Internal': ft.Colors.RED_700,
-                'Not Found in MIS': ft.Colors.PURPLE_700,
-                'Endorsement': ft.Colors.BLUE_700,
-                'Cancellation': ft.Colors.RED_800
-            }.get(row['Match Status'], ft.Colors.BLACK)
-
-            self.data_table.rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(row['Policy Number'])[:20], size=11)),
-                        ft.DataCell(ft.Text(str(row.get('Request Id', ''))[:20], size=11)),
-                        ft.DataCell(ft.Text(row['Field'], size=11)),
-                        ft.DataCell(ft.Text(row['Match Status'], size=11, color=status_color, weight=ft.FontWeight.BOLD)),
-                        ft.DataCell(ft.Text(str(row['Internal Value'])[:30], size=11, tooltip=str(row['Internal Value']))),
-                        ft.DataCell(ft.Text(str(row['MIS Value'])[:30], size=11, tooltip=str(row['MIS Value']))),
-                    ]
-                )
-            )
+        # Walk plain column arrays for the page rather than boxing each row into a Series
+        request_ids = page_df['Request Id'].to_numpy(dtype=object) if 'Request Id' in page_df.columns else [''] * len(page_df)
+        internal_values = page_df['Internal Value'].to_numpy(dtype=object)
+        mis_values = page_df['MIS Value'].to_numpy(dtype=object)
+        page_rows = zip(page_df['Policy Number'].to_numpy(dtype=object), request_ids,
+                        page_df['Field'].to_numpy(dtype=object), page_df['Match Status'].to_numpy(dtype=object),
+                        internal_values, page_df['Internal Value'].str.slice(0, 30).to_numpy(dtype=object),
+                        mis_values, page_df['MIS Value'].str.slice(0, 30).to_numpy(dtype=object))
+        # Refill the pooled rows in place instead of allocating fresh widgets per refresh
+        for row, values in zip(self._row_pool, page_rows):
+            policy_number, request_id, field, status, internal_value, internal_display, mis_value, mis_display = values
+            policy_text, request_text, field_text, status_text, internal_text, mis_text = (cell.content for cell in row.cells)
+            policy_text.value = str(policy_number)[:20]
+            request_text.value = str(request_id)[:20]
+            field_text.value = field
+            status_text.value = status
+            status_text.color = self._TABLE_STATUS_COLORS.get(status, ft.Colors.BLACK)
+            internal_text.value, internal_text.tooltip = internal_display, internal_value
+            mis_text.value, mis_text.tooltip = mis_display, mis_value
+        self.data_table.rows = self._row_pool[:len(page_df)]
         self.pagination_controls.controls = [
             ft.IconButton(icon=ft.Icons.ARROW_BACK, on_click=lambda e: self.update_datatable(e, -1), disabled=(self.datatable_page_number == 1)),
             ft.Text(f"Page {self.datatable_page_number} of {total_pages}"),
@@ -2289,7 +2959,7 @@ class InsurerWiseReportView:
                 return f"₹ {integer_part}" 
             last_three = integer_part[-3:]
             other_digits = integer_part[:-3]
-            formatted_other = re.sub(r'(\d)(?=(\d{2})+(?!\d))', r'\1,', other_digits)
+            formatted_other = _RE_INDIAN_GROUPING.sub(r'\1,', other_digits)
             return f"₹ {formatted_other},{last_three}"
 
         # Define styles
@@ -2301,9 +2971,10 @@ class InsurerWiseReportView:
         col_ratios = {"insurer": 4, "nop": 2, "premium": 3}
 
         def create_cell(text, expand_ratio, bgcolor=None, is_numeric=False, is_bold=False, is_cr=False, full_value=None):
-            final_style = numeric_cell_style.copy() if (is_numeric or is_cr) else cell_style.copy()
+            # The style dicts are only unpacked into ft.Text, so they are shared unless bolded
+            final_style = numeric_cell_style if (is_numeric or is_cr) else cell_style
             if is_bold:
-                final_style['weight'] = ft.FontWeight.BOLD
+                final_style = {**final_style, 'weight': ft.FontWeight.BOLD}
             
             tooltip = str(full_value) if full_value is not None else str(text)
             formatted_text = str(text)
@@ -2364,29 +3035,31 @@ class InsurerWiseReportView:
         )
         
         # Data Rows
-        data_rows = []
-        for _, row in self.summary_df.iterrows():
-            data_rows.append(ft.Row(
-                controls=[
-                    create_cell(row['Insurer'], col_ratios["insurer"]),
-                    create_cell(str(row['Booked NOP']), col_ratios["nop"], is_numeric=True),
-                    create_cell(row['Booked Premium (Cr)'], col_ratios["premium"], is_cr=True, full_value=row['Booked Premium']),
-                    create_cell(str(row['Unbooked NOP']), col_ratios["nop"], is_numeric=True),
-                    create_cell(row['Unbooked Premium (Cr)'], col_ratios["premium"], is_cr=True, full_value=row['Unbooked Premium']),
-                    create_cell(str(row['Pending NOP']), col_ratios["nop"], is_numeric=True),
-                    create_cell(row['Pending Premium (Cr)'], col_ratios["premium"], is_cr=True, full_value=row['Pending Premium']),
-                    create_cell(str(row['Total NOP']), col_ratios["nop"], is_numeric=True),
-                    create_cell(row['Total Premium (Cr)'], col_ratios["premium"], is_cr=True, full_value=row['Total Premium']),
+        # Read plain column arrays rather than boxing every summary row into a Series
+        row_columns = ['Insurer'] + [f"{segment} {suffix}" for segment in ('Booked', 'Unbooked', 'Pending', 'Total')
+                                     for suffix in ('NOP', 'Premium (Cr)', 'Premium')]
+        data_rows = [
+            ft.Row(
+                controls=[create_cell(values[0], col_ratios["insurer"])] + [
+                    cell
+                    for nop, premium_cr, premium in zip(values[1::3], values[2::3], values[3::3])
+                    for cell in (create_cell(str(nop), col_ratios["nop"], is_numeric=True),
+                                 create_cell(premium_cr, col_ratios["premium"], is_cr=True, full_value=premium))
                 ], spacing=1
-            ))
+            )
+            for values in zip(*(self.summary_df[col].to_numpy() for col in row_columns))
+        ]
 
         # Total Row - Calculate totals properly
+        # Counts and premiums are summed as separate blocks so the NOP totals stay integers
+        # (a single mixed-dtype sum would upcast them to float and break the cell formatting)
+        nop_cols = ['Booked NOP', 'Unbooked NOP', 'Pending NOP', 'Total NOP']
+        premium_cols = ['Booked Premium', 'Unbooked Premium', 'Pending Premium', 'Total Premium',
+                        'Booked Premium (Cr)', 'Unbooked Premium (Cr)', 'Pending Premium (Cr)', 'Total Premium (Cr)']
         total_row_data = {}
-        for col in ['Booked NOP', 'Unbooked NOP', 'Pending NOP', 'Total NOP', 
-                   'Booked Premium', 'Unbooked Premium', 'Pending Premium', 'Total Premium',
-                   'Booked Premium (Cr)', 'Unbooked Premium (Cr)', 'Pending Premium (Cr)', 'Total Premium (Cr)']:
-            if col in self.summary_df.columns:
-                total_row_data[col] = self.summary_df[col].sum()
+        for block in (nop_cols, premium_cols):
+            present = [col for col in block if col in self.summary_df.columns]
+            total_row_data.update(self.summary_df[present].sum().to_dict())
         
         # Verify total calculation
         calculated_total_nop = total_row_data.get('Booked NOP', 0) + total_row_data.get('Unbooked NOP', 0) + total_row_data.get('Pending NOP', 0)
@@ -2450,6 +3123,8 @@ class InsuranceValidationApp:
         self.page.padding = 0
         
         self.internal_df = None
+        # (date column, parsed dates, sort order, sorted dates) for the date filter
+        self._internal_date_cache = None
         self.mis_dfs = {}
         # ### FIX ###: Initialized self.offline_df here.
         self.offline_df = None
@@ -2462,6 +3137,12 @@ class InsuranceValidationApp:
         
         self.progress_ring = None
         self.progress_text = None
+        # Progress ticks redraw the page at most this often (seconds); see update_progress
+        self.progress_update_interval = 1 / 15
+        self._last_progress_update = 0.0
+        # Uploads and comparisons all replace the loaded frames, the insurer dropdown and the
+        # progress bar, so their worker threads run one at a time (see _start_data_thread)
+        self._data_lock = threading.Lock()
         self.results_container = None
         self.main_container = None
         
@@ -2594,35 +3275,82 @@ class InsuranceValidationApp:
             padding=20, border_radius=10, bgcolor=ft.Colors.WHITE, border=ft.border.all(1, ft.Colors.GREY_300)
         )
 
+    def _read_uploaded_files(self, files, read_file, on_progress=None):
+        """Run read_file for every uploaded file on the comparator's thread pool (the
+        parsers release the GIL for much of their work). Returns (result, error) pairs in
+        upload order; on_progress(done, total, file) is called as each read finishes.
+        """
+        futures = {self.comparator.executor.submit(read_file, file): idx for idx, file in enumerate(files)}
+        results = [None] * len(files)
+        for done, future in enumerate(as_completed(futures), start=1):
+            idx = futures[future]
+            error = future.exception()
+            results[idx] = (None, error) if error is not None else (future.result(), None)
+            if on_progress is not None:
+                on_progress(done, len(files), files[idx])
+        return results
+
+    def update_progress(self, force=False):
+        """page.update() for progress ticks, skipped if the last one was under
+        progress_update_interval ago; callers flush the final state with page.update()
+        """
+        now = time.monotonic()
+        if force or now - self._last_progress_update >= self.progress_update_interval:
+            self._last_progress_update = now
+            self.page.update()
+
+    def _report_file_progress(self, done, total, file):
+        """Progress callback for _read_uploaded_files driving the shared progress bar"""
+        self.progress_text.value = f"Loaded {file.name} ({done}/{total})"
+        self.progress_bar.value = done / total
+        self.update_progress()
+
+    def _start_data_thread(self, target, *args):
+        """Run target on a daemon thread once any earlier upload or comparison has finished"""
+        def run_serialized():
+            with self._data_lock:
+                target(*args)
+        threading.Thread(target=run_serialized, daemon=True).start()
+
     def handle_internal_file(self, e: ft.FilePickerResultEvent):
-        """Handle internal file upload (multiple files)"""
+        """Handle internal file upload (multiple files); parsing runs off the UI thread"""
         if not e.files: return
+        self._start_data_thread(self.handle_internal_file_thread, e.files)
+
+    def handle_internal_file_thread(self, files):
+        """Load the uploaded internal files in a separate thread"""
         self.internal_file_info.controls.clear()
         dfs = []
-        total_files = len(e.files)
         self.progress_bar.visible = True
         self.progress_bar.value = 0
         self.progress_text.value = "Loading internal files..."
         self.progress_text.visible = True
         self.page.update()
-        for idx, file in enumerate(e.files):
+
+        def read_file(file):
+            return _read_cached_source(
+                file.path, 'internal',
+                lambda: _read_csv(file.path) if file.name.endswith('.csv') else _read_excel(file.path))
+
+        loaded = self._read_uploaded_files(files, read_file, self._report_file_progress)
+        for file, (df, error) in zip(files, loaded):
             try:
-                self.progress_text.value = f"Loading {file.name}..."
-                self.page.update()
-                df = pd.read_csv(file.path, low_memory=False, on_bad_lines='skip') if file.name.endswith('.csv') else pd.read_excel(file.path)
-                df.columns = df.columns.str.strip()
+                if error is not None:
+                    raise error
+                df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
                 df = self.comparator.convert_old_to_new_format(df)
                 self.internal_file_info.controls.append(ft.Text(f"✓ Loaded: {file.name} ({len(df):,} rows)", color=ft.Colors.GREEN_700))
                 dfs.append(df)
             except Exception as ex:
                 self.internal_file_info.controls.append(ft.Text(f"❌ Error loading {file.name}: {ex}", color=ft.Colors.RED_700))
                 logger.error(f"Error loading {file.name}: {traceback.format_exc()}")
-            self.progress_bar.value = (idx + 1) / total_files
-            self.page.update()
+        self.page.update()
         if dfs:
             self.progress_text.value = "Merging files..."
             self.page.update()
             self.internal_df = pd.concat(dfs, ignore_index=True, sort=False)
+            self._internal_date_cache = None
+            self.internal_df = self.comparator.convert_categorical_columns(_downcast_integer_columns(self.internal_df))
             self.internal_file_info.controls.append(ft.Text(f"Total records: {len(self.internal_df):,}", weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700))
         self.progress_bar.visible = False
         self.progress_text.visible = False
@@ -2632,23 +3360,31 @@ class InsuranceValidationApp:
     # ### FIX 2: ADD THE MISSING FILE HANDLER ###
     # This entire method was missing, causing the 'offline_df' variable to never be set.
     def handle_offline_file(self, e: ft.FilePickerResultEvent):
-        """Handle 'Offline Punching Data' file upload."""
+        """Handle 'Offline Punching Data' file upload; parsing runs off the UI thread"""
         if not e.files: return
+        self._start_data_thread(self.handle_offline_file_thread, e.files)
+
+    def handle_offline_file_thread(self, files):
+        """Load the uploaded offline files in a separate thread"""
         self.offline_file_info.controls.clear()
         dfs = []
-        total_files = len(e.files)
         self.progress_bar.visible = True
         self.progress_bar.value = 0
         self.progress_text.value = "Loading offline files..."
         self.progress_text.visible = True
         self.page.update()
-        
-        for idx, file in enumerate(e.files):
+
+        def read_file(file):
+            return _read_cached_source(
+                file.path, 'offline',
+                lambda: _read_csv(file.path, encoding='latin1') if file.name.endswith('.csv') else _read_excel(file.path))
+
+        loaded = self._read_uploaded_files(files, read_file, self._report_file_progress)
+        for file, (df, error) in zip(files, loaded):
             try:
-                self.progress_text.value = f"Loading {file.name}..."
-                self.page.update()
-                df = pd.read_csv(file.path, low_memory=False, on_bad_lines='skip', encoding='latin1') if file.name.endswith('.csv') else pd.read_excel(file.path)
-                df.columns = df.columns.str.strip()
+                if error is not None:
+                    raise error
+                df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
                 df = self.comparator.convert_old_to_new_format(df)
                 
                 # Check for the crucial 'Status' column as requested.
@@ -2665,8 +3401,7 @@ class InsuranceValidationApp:
             except Exception as ex:
                 self.offline_file_info.controls.append(ft.Text(f"❌ Error loading {file.name}: {ex}", color=ft.Colors.RED_700))
                 logger.error(f"Error loading offline file {file.name}: {traceback.format_exc()}")
-            self.progress_bar.value = (idx + 1) / total_files
-            self.page.update()
+        self.page.update()
 
         if dfs:
             self.progress_text.value = "Merging offline files..."
@@ -2678,6 +3413,7 @@ class InsuranceValidationApp:
             self.page.update()
             original_count = len(self.offline_df)
             self.offline_df = self.comparator.handle_offline_duplicates(self.offline_df)
+            self.offline_df = self.comparator.convert_categorical_columns(_downcast_integer_columns(self.offline_df))
             duplicate_count = original_count - len(self.offline_df)
             
             self.offline_file_info.controls.append(ft.Text(f"Total offline records: {len(self.offline_df):,}", weight=ft.FontWeight.BOLD, color=ft.Colors.ORANGE_800))
@@ -2690,29 +3426,35 @@ class InsuranceValidationApp:
         self.page.update()
 
     def handle_mis_files(self, e: ft.FilePickerResultEvent):
-        """Handle MIS files upload with insurer-specific sheet detection and preprocessing."""
-        if not e.files:
-            return
+        """Handle MIS files upload; parsing runs off the UI thread"""
+        if not e.files: return
+        self._start_data_thread(self.handle_mis_files_thread, e.files)
+
+    def handle_mis_files_thread(self, files):
+        """Load MIS files in a separate thread with insurer-specific sheet detection and preprocessing."""
         self.mis_file_info.controls.clear()
         loading_text = ft.Text("Loading and preprocessing MIS files...", color=ft.Colors.BLUE_700)
         self.mis_file_info.controls.append(loading_text)
         self.page.update()
         
-        for file in e.files:
-            insurer = None
-            filename_upper = file.name.upper()
-            insurer_patterns = {
-                'DIGIT': ['DIGIT'], 'LIBERTY': ['LIBERTY'], 'MAGMA': ['MAGMA'], 'NATIONAL': ['NATIONAL'],
-                'UNITED': ['UNITED'], 'SHRIRAM': ['SHRIRAM'], 'ICICI': ['ICICI'], 'IFFCO': ['IFFCO'],
-                'BAJAJ': ['BAJAJ'], 'SBI': ['SBI'], 'RELIANCE': ['RELIANCE'], 'TATA': ['TATA'], 'HDFC': ['HDFC'],
-                'KOTAK': ['KOTAK'], 'ROYAL': ['ROYAL'], 'CHOLA': ['CHOLA'],
-                'FGI': ['FGI'], 'ZUNO': ['ZUNO'], 'UNIVERSAL': ['UNIVERSAL', 'SOMPO'],
-                'NEW_INDIA': ['NEW_INDIA', 'NEWINDIA'], 'ORIENTAL': ['ORIENTAL'], 'RAHEJA': ['RAHEJA']
-            }
-            for ins_key, patterns in insurer_patterns.items():
-                if any(pattern in filename_upper for pattern in patterns):
-                    insurer = ins_key
-                    break
+        file_insurers = {file.path: _detect_filename_insurer(file.name) for file in files}
+
+        def read_file(file):
+            insurer = file_insurers[file.path]
+            if insurer is None:
+                return None
+            if file.name.endswith('.csv'):
+                return _read_cached_source(
+                    file.path, 'mis-csv',
+                    lambda: _read_csv(file.path, encoding_errors='replace'))
+            return self.comparator.read_excel_with_sheet_detection(file.path, insurer)
+
+        # Files are read concurrently; preprocessing stays in upload order because it
+        # updates the comparator's resolved mapping for the insurer
+        loaded = self._read_uploaded_files(files, read_file)
+        new_frames = {}
+        for file, (df, error) in zip(files, loaded):
+            insurer = file_insurers[file.path]
             
             if not insurer:
                 self.mis_file_info.controls.append(
@@ -2721,22 +3463,17 @@ class InsuranceValidationApp:
                 continue
 
             try:
-                if file.name.endswith('.csv'):
-                    df = pd.read_csv(file.path, low_memory=False, on_bad_lines='skip', encoding='utf-8', errors='replace')
-                else:
-                    df = self.comparator.read_excel_with_sheet_detection(file.path, insurer)
+                if error is not None:
+                    raise error
                 
                 if df is None:
                     raise Exception("Failed to read file.")
 
-                df.columns = df.columns.str.strip()
+                df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
                 
                 df = self.comparator.preprocess_mis_df(insurer, df)
                 
-                if insurer in self.mis_dfs:
-                    self.mis_dfs[insurer] = pd.concat([self.mis_dfs[insurer], df], ignore_index=True, sort=False)
-                else:
-                    self.mis_dfs[insurer] = df
+                new_frames.setdefault(insurer, []).append(df)
                 
                 info_text = f"✓ {insurer}: Loaded {len(df):,} records"
                 if insurer in self.comparator.insurer_filters:
@@ -2748,11 +3485,24 @@ class InsuranceValidationApp:
                 self.mis_file_info.controls.append(ft.Text(error_msg, color=ft.Colors.RED_700))
                 logger.error(f"Error loading {file.name}: {traceback.format_exc()}")
 
+        # One concat per insurer (including any frame already loaded) rather than one per file
+        for insurer, frames in new_frames.items():
+            if insurer in self.mis_dfs:
+                frames.insert(0, self.mis_dfs[insurer])
+            self.mis_dfs[insurer] = _downcast_integer_columns(
+                pd.concat(frames, ignore_index=True, sort=False) if len(frames) > 1 else frames[0])
+
         if loading_text in self.mis_file_info.controls:
             self.mis_file_info.controls.remove(loading_text)
             
-        self.insurer_dropdown.options = [ft.dropdown.Option(ins) for ins in sorted(self.mis_dfs.keys())]
-        if self.insurer_dropdown.options:
+        # Insert options only for newly loaded insurers, keeping the list sorted; the current
+        # selection (and its field checkboxes) is kept unless there is no valid one yet
+        known_insurers = [option.key for option in self.insurer_dropdown.options]
+        for insurer in sorted(self.mis_dfs.keys() - set(known_insurers)):
+            position = bisect.bisect_left(known_insurers, insurer)
+            known_insurers.insert(position, insurer)
+            self.insurer_dropdown.options.insert(position, ft.dropdown.Option(insurer))
+        if self.insurer_dropdown.options and self.insurer_dropdown.value not in self.mis_dfs:
             self.insurer_dropdown.value = self.insurer_dropdown.options[0].key
             self.update_field_options(None)
             
@@ -2959,9 +3709,8 @@ class InsuranceValidationApp:
         self.page.update()
 
     def check_enable_run_button(self):
-        """Check if run button should be enabled"""
+        """Check if run button should be enabled; the caller flushes the page"""
         self.run_button.disabled = not (self.internal_df is not None and self.mis_dfs and self.insurer_dropdown.value)
-        self.page.update()
 
     def run_comparison(self, e):
         """Run the comparison"""
@@ -2976,7 +3725,23 @@ class InsuranceValidationApp:
         self.progress_bar.value = 0
         self.run_button.disabled = True
         self.page.update()
-        threading.Thread(target=self.run_comparison_thread, args=(self.insurer_dropdown.value, selected_fields)).start()
+        self._start_data_thread(self.run_comparison_thread, self.insurer_dropdown.value, selected_fields)
+
+    def _internal_date_index(self, date_col):
+        """Parsed internal dates for the date filter with their sort order and sorted values,
+        kept until a new internal dataset is loaded. The order is None when the parsed
+        column is not naive datetime64 (e.g. mixed time zones).
+        """
+        cached = self._internal_date_cache
+        if cached is None or cached[0] != date_col:
+            parsed_dates = pd.to_datetime(self.internal_df[date_col], errors='coerce')
+            date_order = sorted_dates = None
+            if parsed_dates.dtype.kind == 'M' and getattr(parsed_dates.dtype, 'tz', None) is None:
+                values = parsed_dates.to_numpy()
+                date_order = np.argsort(values, kind='stable')
+                sorted_dates = values[date_order]
+            cached = self._internal_date_cache = (date_col, parsed_dates, date_order, sorted_dates)
+        return cached[1:]
 
     def run_comparison_thread(self, insurer, selected_fields):
         """Run comparison in separate thread - uses resolved mappings."""
@@ -2990,17 +3755,23 @@ class InsuranceValidationApp:
             if self.date_filter_switch.value:
                 date_col = self.comparator.internal_columns['policy_start_date']
                 if date_col in internal_df_to_compare.columns:
-                    internal_df_to_compare = internal_df_to_compare.copy()
-                    internal_df_to_compare[date_col] = pd.to_datetime(internal_df_to_compare[date_col], errors='coerce')
-                    start_date = self.start_date_picker.value
-                    end_date = self.end_date_picker.value
-                    mask = (internal_df_to_compare[date_col] >= pd.Timestamp(start_date)) & (internal_df_to_compare[date_col] <= pd.Timestamp(end_date))
-                    internal_df_to_compare = internal_df_to_compare[mask].copy()
+                    parsed_dates, date_order, sorted_dates = self._internal_date_index(date_col)
+                    start_date = pd.Timestamp(self.start_date_picker.value)
+                    end_date = pd.Timestamp(self.end_date_picker.value)
+                    if date_order is not None:
+                        # Binary-search the window in the sorted dates (NaT sorts last and never
+                        # falls inside), then restore the original row order
+                        lo = np.searchsorted(sorted_dates, start_date.to_datetime64(), side='left')
+                        hi = np.searchsorted(sorted_dates, end_date.to_datetime64(), side='right')
+                        rows = np.sort(date_order[lo:hi])
+                    else:
+                        rows = np.flatnonzero((parsed_dates >= start_date) & (parsed_dates <= end_date))
+                    internal_df_to_compare = self.internal_df.iloc[rows].assign(**{date_col: parsed_dates.to_numpy()[rows]})
 
             def progress_callback(progress, message):
                 self.progress_text.value = message
                 self.progress_bar.value = progress
-                self.page.update()
+                self.update_progress()
 
             results_df, context_dfs = self.comparator.compare_datasets_async(
                 internal_df_to_compare, self.mis_dfs[insurer], insurer, selected_fields, progress_callback
@@ -3033,7 +3804,7 @@ class InsuranceValidationApp:
         self.progress_bar.value = 0
         self.page.update()
 
-        threading.Thread(target=self.run_full_report_thread).start()
+        self._start_data_thread(self.run_full_report_thread)
 
     def run_full_report_thread(self):
         """Generates the summary data for all insurers using the correct 3-bucket logic with proper priority handling."""
@@ -3048,9 +3819,9 @@ class InsuranceValidationApp:
             
             # Prepare internal data
             if 'cleaned_policy' not in self.internal_df.columns:
-                self.internal_df['cleaned_policy'] = self.internal_df[internal_policy_col].apply(self.comparator.clean_string)
+                self.internal_df['cleaned_policy'] = self.comparator.clean_string_series(self.internal_df[internal_policy_col])
             if 'Detected_Insurer' not in self.internal_df.columns:
-                self.internal_df['Detected_Insurer'] = self.internal_df[insurance_col].apply(self.comparator.get_insurer_from_company_name)
+                self.internal_df['Detected_Insurer'] = self.comparator.detect_insurer_series(self.internal_df[insurance_col])
 
             # Prepare offline data with proper duplicate handling
             offline_status_col = 'Status'
@@ -3060,53 +3831,47 @@ class InsuranceValidationApp:
 
             # Clean and prepare offline data
             if 'cleaned_policy' not in self.offline_df.columns:
-                self.offline_df['cleaned_policy'] = self.offline_df[internal_policy_col].apply(self.comparator.clean_string)
+                self.offline_df['cleaned_policy'] = self.comparator.clean_string_series(self.offline_df[internal_policy_col])
             if 'Detected_Insurer' not in self.offline_df.columns:
-                self.offline_df['Detected_Insurer'] = self.offline_df[insurance_col].apply(self.comparator.get_insurer_from_company_name)
+                self.offline_df['Detected_Insurer'] = self.comparator.detect_insurer_series(self.offline_df[insurance_col])
 
             # Standardize status column
             self.offline_df[offline_status_col] = self.offline_df[offline_status_col].astype(str).str.strip().str.lower()
 
             # --- Step 2: Handle Offline Data Duplicates with Priority Logic ---
-            def get_status_priority(status):
-                """Return priority for status (lower number = higher priority)"""
-                status = str(status).lower().strip()
-                if 'booked' in status:
-                    return 1  # Highest priority
-                elif status in ['new', 'ticket closed duplicate']:
-                    return 2  # Pending priority
-                else:
-                    return 3  # Unbooked priority
+            # Partition internal rows by insurer once instead of re-scanning per insurer
+            internal_by_insurer = dict(tuple(self.internal_df.groupby('Detected_Insurer', sort=False)))
 
             # Group offline data by policy and insurer, keep highest priority status
-            offline_deduplicated = []
-            for insurer in self.mis_dfs.keys():
-                offline_insurer = self.offline_df[self.offline_df['Detected_Insurer'] == insurer].copy()
-                if offline_insurer.empty:
-                    continue
-                
-                # Group by policy and keep the record with highest priority status
-                for policy, group in offline_insurer.groupby('cleaned_policy'):
-                    if len(group) > 1:
-                        # Multiple records for same policy - prioritize by status
-                        group['status_priority'] = group[offline_status_col].apply(get_status_priority)
-                        best_record = group.loc[group['status_priority'].idxmin()]
-                    else:
-                        best_record = group.iloc[0]
-                    offline_deduplicated.append(best_record)
-
-            offline_deduplicated_df = pd.DataFrame(offline_deduplicated)
+            # (lower number = higher priority: 1 booked, 2 pending, 3 unbooked). A stable sort
+            # by (insurer, policy, priority) puts each policy's first best-status record first;
+            # insurers follow the MIS order and policies are sorted within each insurer.
+            offline_status = self.offline_df[offline_status_col]
+            status_priority = np.select(
+                [offline_status.str.contains('booked', regex=False).to_numpy(),
+                 offline_status.isin(['new', 'ticket closed duplicate']).to_numpy()],
+                [1, 2], default=3)
+            insurer_rank = pd.Index(list(self.mis_dfs.keys())).get_indexer(self.offline_df['Detected_Insurer'].to_numpy(dtype=object))
+            in_scope = np.flatnonzero(insurer_rank >= 0)
+            ranked = pd.DataFrame({
+                'insurer': insurer_rank[in_scope],
+                'policy': self.offline_df['cleaned_policy'].to_numpy(dtype=object)[in_scope],
+                'priority': status_priority[in_scope],
+            })
+            best_rows = ranked.sort_values(['insurer', 'policy', 'priority'], kind='stable').drop_duplicates(['insurer', 'policy']).index
+            offline_deduplicated_df = self.offline_df.iloc[in_scope[best_rows]]
+            offline_dedup_by_insurer = dict(tuple(offline_deduplicated_df.groupby('Detected_Insurer', sort=False))) if not offline_deduplicated_df.empty else {}
 
             # --- Step 3: Main loop for each insurer ---
             for i, insurer in enumerate(self.mis_dfs.keys()):
                 self.progress_text.value = f"Processing {insurer} ({i+1}/{total_insurers})..."
                 self.progress_bar.value = (i + 1) / total_insurers
-                self.page.update()
+                self.update_progress()
 
                 # Get insurer-specific data
-                internal_insurer_df = self.internal_df[self.internal_df['Detected_Insurer'] == insurer].copy()
+                internal_insurer_df = internal_by_insurer.get(insurer, self.internal_df.iloc[0:0]).copy()
                 mis_insurer_df = self.mis_dfs[insurer].copy()
-                offline_insurer_df = offline_deduplicated_df[offline_deduplicated_df['Detected_Insurer'] == insurer].copy() if not offline_deduplicated_df.empty else pd.DataFrame()
+                offline_insurer_df = offline_dedup_by_insurer.get(insurer, offline_deduplicated_df.iloc[0:0]).copy() if not offline_deduplicated_df.empty else pd.DataFrame()
 
                 logger.info(f"Raw MIS data for {insurer}: {len(mis_insurer_df)} records")
 
@@ -3117,7 +3882,7 @@ class InsuranceValidationApp:
                     continue
                 
                 # Clean policy numbers but keep all records
-                mis_insurer_df['cleaned_policy'] = mis_insurer_df[mis_policy_col].apply(self.comparator.clean_string)
+                mis_insurer_df['cleaned_policy'] = self.comparator.clean_string_series(mis_insurer_df[mis_policy_col])
                 
                 # Count records with valid policy numbers
                 valid_policy_records = mis_insurer_df[mis_insurer_df['cleaned_policy'].notna() & (mis_insurer_df['cleaned_policy'] != '')]
@@ -3810,9 +4575,8 @@ class InsuranceValidationApp:
             # Differentiate between report (xlsx) and detailed results (csv)
             if e.path.endswith(".xlsx"):
                 # Make column names more Excel-friendly
-                df_to_save = self.df_to_export.copy()
-                df_to_save.columns = [col.replace(' (Cr)', '_Cr') for col in df_to_save.columns]
-                df_to_save.to_excel(e.path, index=False)
+                df_to_save = self.df_to_export.rename(columns=lambda col: col.replace(' (Cr)', '_Cr'))
+                df_to_save.to_excel(e.path, index=False, engine=_EXCEL_WRITER_ENGINE)
                 self.show_success(f"Report exported successfully!\nSaved to:\n{e.path}")
                 logger.info(f"Summary export successful: {e.path}")
             else:
@@ -4434,8 +5198,7 @@ class InsuranceValidationApp:
         
         # If no exact match, try partial matching
         field_lower = field.lower().replace('_', '')
-        for col in internal_row.index:
-            col_lower = str(col).lower().replace(' ', '').replace('_', '')
+        for col_lower, col in _normalized_columns(tuple(internal_row.index)):
             if field_lower in col_lower or col_lower in field_lower:
                 logger.info(f"Found partial match for {field}: {col}")
                 return col
@@ -4459,8 +5222,8 @@ class InsuranceValidationApp:
             
             # Also refresh the selectable fields for the currently selected insurer
             if self.insurer_dropdown.value:
-                self.update_field_options(None)
                 self.check_enable_run_button()
+                self.update_field_options(None)
             
         except Exception as ex:
             logger.error(f"Error applying changes with visual feedback: {str(ex)}")
@@ -4560,16 +5323,16 @@ class InsuranceValidationApp:
                 else:
                     self.comparator.column_mappings[insurer] = mappings
             
-            # Clear resolved mappings to force re-resolution
-            self.comparator.resolved_mappings.clear()
+            # Clear resolved mappings and the alias index to force re-resolution
+            self.comparator.invalidate_mappings()
             
             self.show_success("Column mappings applied to current session!")
             logger.info(f"Applied mappings for {len(updated_mappings)} insurers")
             
             # Immediately refresh the selectable fields to include any new custom fields
             if self.insurer_dropdown.value:
-                self.update_field_options(None)
                 self.check_enable_run_button()
+                self.update_field_options(None)
             
         except Exception as ex:
             logger.error(f"Error applying mapping changes: {str(ex)}")
@@ -4593,16 +5356,16 @@ class InsuranceValidationApp:
                     self.comparator.column_mappings[insurer] = {}
                     logger.info(f"Cleared {insurer} mappings (not in original defaults)")
             
-            # Clear resolved mappings to force re-resolution
-            self.comparator.resolved_mappings.clear()
+            # Clear resolved mappings and the alias index to force re-resolution
+            self.comparator.invalidate_mappings()
             
             # Refresh dialog in place
             self.refresh_mapping_dialog()
             
             # Refresh selectable fields as well
             if self.insurer_dropdown.value:
-                self.update_field_options(None)
                 self.check_enable_run_button()
+                self.update_field_options(None)
             
             self.show_success("Mappings reset to original hardcoded backend defaults!")
             logger.info("All mappings reset to original hardcoded state - extra fields removed")
@@ -4613,514 +5376,7 @@ class InsuranceValidationApp:
 
     def get_comprehensive_default_mappings(self):
         """Get the exact original hardcoded mappings from self.column_mappings (true backend defaults)"""
-        return {
-            'SHRIRAM': {
-                'policy_number': 'S_POLICYNO',
-                'customer_name': 'S_INSUREDNAME',
-                'policy_start_date': 'S_DOI',
-                'policy_end_date': 'S_DOE',
-                'registration_number': 'S_VEH_REG_NO',
-                'engine_number': 'S_ENGNO',
-                'chassis_number': 'S_CHNO',
-                'total_premium': 'S_NET',
-                'tp_premium': 'S_TP_TOTAL',
-                'previous_policy_number': 'S_PREVIOUS_POL_NO',
-                'broker_name': 'S_SOURCENAME',
-                'broker_code': None,
-                'sum_insured': None,
-                'vehicle_make': 'S_MAKE_DESC',
-                'vehicle_model': 'S_VEH_MODEL',
-                'fuel_type': 'S_VEHFUEL_DESC',
-                'gvw': 'S_GVW',
-                'seating_capacity': 'S_VEH_SC',
-                'ncb_percentage': 'S_NCB_PERCENTAGE',
-                'manufacturing_year': None,
-                'engine_cubic_capacity': 'S_VEH_CC',
-            },
-            'RELIANCE': {
-                'policy_number': 'PolicyNo',
-                'customer_name': 'CustomerName',
-                'policy_start_date': 'PolicyStartDate',
-                'policy_end_date': 'PolicyEndDate',
-                'registration_number': 'VechileNo',
-                'engine_number': 'EngineNo',
-                'chassis_number': 'ChassisNo',
-                'total_premium': 'GrossPremium',
-                'tp_premium': 'TpPremium',
-                'previous_policy_number': 'Previous Policy No',
-                'broker_name': 'IMDName',
-                'broker_code': 'IMDCode',
-                'sum_insured': 'SumInsured',
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'FuelType',
-                'gvw': 'GVW',
-                'seating_capacity': 'SeatingCapacity',
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'YearOfManufacture',
-                'engine_cubic_capacity': 'CC',
-            },
-            'ROYAL': {
-                'policy_number': 'Policy No',
-                'customer_name': 'Client Full Name',
-                'policy_start_date': 'Inception Date',
-                'policy_end_date': 'Expiry Date',
-                'registration_number': 'Reg No',
-                'engine_number': 'Engine No',
-                'chassis_number': 'Chasis No',
-                'total_premium': 'Client Premium',
-                'tp_premium': 'TP Premium',
-                'previous_policy_number': 'Previous Policy No',
-                'broker_name': 'Agent Name',
-                'broker_code': 'Agent Code',
-                'sum_insured': 'Incremental SI',
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Mfr_Model_GWP',
-                'fuel_type': 'Fuel_Type',
-                'gvw': 'GVW_Ton',
-                'seating_capacity': 'SeatingCapacity',
-                'ncb_percentage': 'NCB_Rate',
-                'manufacturing_year': 'Year of Manufacturing',
-                'engine_cubic_capacity': 'Cubic_Capcity',
-            },
-            'SBI': {
-                'policy_number': ['PolicyNo'],
-                'customer_name': 'CustomerName',
-                'policy_start_date': 'PolicyStartDate',
-                'policy_end_date': 'PolicyEndDate',
-                'registration_number': None,
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': ['FinalPremium', 'GWP LACS', 'GWP Lacs','Gross Written Premium'],
-                'tp_premium': None,
-                'previous_policy_number': None,
-                'broker_name': ['IMD name', 'IMDName', 'Channel_Name'],
-                'broker_code': 'IMDCode',
-                'sum_insured': None,
-                'vehicle_make': 'MakeModel',
-                'vehicle_model': ['Product_Name', 'ProductName'],
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None
-            },
-            'ICICI': {
-                'policy_number': 'POL_NUM_TXT',
-                'customer_name': 'CUSTOMER_NAME',
-                'policy_start_date': 'POL_START_DATE',
-                'policy_end_date': 'POL_END_DATE',
-                'registration_number': 'MOTOR_REGISTRATION_NUM',
-                'engine_number': 'VEH_ENGINENO',
-                'chassis_number': 'VEH_CHASSISNO',
-                'total_premium': 'TOTAL_GROSS_PREMIUM',
-                'tp_premium': 'MOTOR_TP_PREMIUM_AMT',
-                'previous_policy_number': 'XC_PREV_POL_NO',
-                'broker_name': 'AGENT_NAME',
-                'broker_code': 'CHILD_ID',
-                'sum_insured': 'POL_TOT_SUM_INSURED_AMT',
-                'vehicle_make': 'MANUFACTURER_NAME',
-                'vehicle_model': 'MODEL_NAME',
-                'fuel_type': 'XC_FUEL_TYPE',
-                'gvw': 'POL_GVW',
-                'seating_capacity': 'XC_POL_SEATING_CAPACITY',
-                'ncb_percentage': 'XC_POL_NCB_PCT',
-                'manufacturing_year': 'MOTOR_MANUFACTURER_YEAR',
-                'engine_cubic_capacity': 'MOTOR_ENGINE_CC',
-            },
-            'NATIONAL': {
-                'policy_number': ['Policy Number', 'policy No'],
-                'customer_name': 'Customer Name',
-                'policy_start_date': 'Policy Effective Date',
-                'policy_end_date': 'Policy Expiry Date',
-                'registration_number': 'Vehicle Registration Number',
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'Premium',
-                'tp_premium': None,
-                'previous_policy_number': None,
-                'broker_name': 'POSP Name',
-                'broker_code': 'POSP Code',
-                'sum_insured': None,
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'Fuel Type',
-                'gvw': 'Gross Vehicle Weight',
-                'seating_capacity': 'Seating Capacity',
-                'ncb_percentage': 'NCB Percentage',
-                'manufacturing_year': 'Manufacturing Year',
-                'engine_cubic_capacity': 'Engine Cubic Capacity',
-            },
-            'DIGIT': {
-                'policy_number': ['POLICY_NUMBER','Policy_Number'],
-                'customer_name': 'INSURED_PERSON',
-                'policy_start_date': 'RISK_INC_DATE',
-                'policy_end_date': 'RISK_EXP_DATE',
-                'registration_number': 'VEH_REG_NO',
-                'engine_number': 'ENGINE_NO',
-                'chassis_number': 'CHASSIS_NO',
-                'total_premium': 'GROSS_PREMIUM',
-                'tp_premium': 'TP_PREMIUM',
-                'previous_policy_number': 'PREV_POLICY_NO',
-                'broker_name': 'IMD_NAME',
-                'broker_code': None,
-                'sum_insured': 'SUM_INSURED',
-                'vehicle_make': 'VEHICLE_MAKE',
-                'vehicle_model': 'VEHICLE_MODEL',
-                'fuel_type': 'FUEL_TYPE',
-                'gvw': 'VEH_GVW',
-                'seating_capacity': 'VEH_SEATING',
-                'ncb_percentage': 'CURR_NCB',
-                'manufacturing_year': 'VEHICLE_MANF_YEAR',
-                'engine_cubic_capacity': 'VEH_CC',
-            },
-            'MAGMA': {
-                'policy_number': 'PolicyNo',
-                'customer_name': 'CustomerName',
-                'policy_start_date': 'RiskStartDate',
-                'policy_end_date': 'RiskEndDate',
-                'registration_number': 'RegistrationNumber',
-                'engine_number': 'EngineNumber',
-                'chassis_number': 'ChassisNumber',
-                'total_premium': 'PremiumAmount',
-                'tp_premium': None,
-                'previous_policy_number': 'PreviousYearPolicyNumber',
-                'broker_name': 'AgentName',
-                'broker_code': 'AgentCode',
-                'sum_insured': None,
-                'vehicle_make': None,
-                'vehicle_model': 'ProductDesc',
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-            'UNIVERSAL': {
-                'policy_number': ['POLICY NO CHAR', 'USGIpos Policy Number','POLICY NO'],
-                'customer_name': 'INSURED NAME',
-                'policy_start_date': 'START DATE',
-                'policy_end_date': 'EXPIRY DATE',
-                'registration_number': 'MTOR Registration No',
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'GROSS PREMIUM',
-                'tp_premium': 'TOTAL TP PREMIUM',
-                'previous_policy_number': 'Previous Yr Policy',
-                'broker_name': 'INTERMEDIARY',
-                'broker_code': 'INTERMEDIARY CODE',
-                'sum_insured': 'TOTAL SUM INSURED',
-                'vehicle_make': 'MAKE',
-                'vehicle_model': 'MODEL',
-                'fuel_type': None,
-                'gvw': 'Gvw',
-                'seating_capacity': 'Vehicle Seating Capacity',
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'YEAR OF MANUFACTURING',
-                'engine_cubic_capacity': None,
-            },
-            'UNITED': {
-                'policy_number': 'Policy Number',
-                'customer_name': 'Insured Name',
-                'policy_start_date': 'Effect Date',
-                'policy_end_date': 'Expiry Date',
-                'registration_number': 'Registration Number',
-                'engine_number': 'Engine Number',
-                'chassis_number': 'Chassis Number',
-                'total_premium': 'company_wise_own_share_premium_total',
-                'tp_premium': 'TP Premium',
-                'previous_policy_number': None,
-                'broker_name': None,
-                'broker_code': 'Agent/Br.Cd',
-                'sum_insured': 'Sum Insured',
-                'vehicle_make': None,
-                'vehicle_model': None,
-                'fuel_type': None,
-                'gvw': 'NUM_GVW',
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-            'FGI': {
-                'policy_number': 'Policy Number',
-                'customer_name': 'Customer Name',
-                'policy_start_date': 'Transaction',
-                'policy_end_date': 'Policy Expiry Date',
-                'registration_number': 'Registration Number',
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'Final Premium',
-                'tp_premium': None,
-                'previous_policy_number': None,
-                'broker_name': None,
-                'broker_code': 'Agent Code',
-                'sum_insured': None,
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'Fueal Type',
-                'gvw': 'GVW',
-                'seating_capacity': 'Seating Capacity',
-                'ncb_percentage': None,
-                'manufacturing_year': 'Year Of Manufacturing',
-                'engine_cubic_capacity': 'Cubic Capacity',
-            },
-            'SOMPO': {
-                'policy_number': ['NUM_POLCIY_NO', 'POLICY_NO_CHAR', 'ILPOS_POLICY_NUMBER'],
-                'customer_name': 'INSURED_NAME',
-                'policy_start_date': 'START_DATE',
-                'policy_end_date': 'EXPIRY_DATE',
-                'registration_number': 'MOTOR_REGISTRATION_NO',
-                'engine_number': 'ENGINE_NO',
-                'chassis_number': 'CHASSIS_NO',
-                'total_premium': 'GROSS_PREMIUM',
-                'tp_premium': 'TOTAL_TP_PREMIUM',
-                'previous_policy_number': 'PREVIOUS_POLICY_NUMBER',
-                'broker_name': 'INTERMEDIARY',
-                'broker_code': 'INTERMEDIARY_CODE',
-                'sum_insured': 'TOTAL_SI',
-                'vehicle_make': 'MAKE',
-                'vehicle_model': 'MODEL',
-                'fuel_type': 'FUEL_TYPE',
-                'gvw': 'GVW',
-                'seating_capacity': 'VEHICLE_SEATING_CAPACITY',
-                'ncb_percentage': 'NCB_PERCENTAGE',
-                'manufacturing_year': 'YR_OF_MANUFACTURING',
-                'engine_cubic_capacity': 'CUBIC_CAPACITY',
-            },
-            'BAJAJ': {
-                'policy_number': ['PolicyNo','P Policy Number'],
-                'customer_name': ['CustomerName', 'Partner Desc'],
-                'policy_start_date': 'Risk Start Date',
-                'policy_end_date': 'Risk End Date',
-                'registration_number': 'RegistrationNumber',
-                'engine_number': 'EngineNumber',
-                'chassis_number': 'ChassisNumber',
-                'total_premium': ['R Rnwd Gross Prem', 'Gross Premium'],
-                'tp_premium': 'R Rnwd Tp Prem',
-                'previous_policy_number': 'Previous Year Policy Number',
-                'broker_name': 'AgentName',
-                'broker_code': 'AgentCode',
-                'sum_insured': 'R Rnwd Sum Insured',
-                'vehicle_make': None,
-                'vehicle_model': 'Product Desc',
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-            'CHOLA': {
-                'policy_number': 'Policy No',
-                'customer_name': 'Customer name',
-                'policy_start_date': 'RSD',
-                'policy_end_date': 'RED',
-                'registration_number': 'Regist_NO',
-                'engine_number': 'Engine No',
-                'chassis_number': 'Chassis No',
-                'total_premium': 'Gross Premium',
-                'tp_premium': 'Third Party liability',
-                'previous_policy_number': 'PREVIOUS_POLICY_NUMBER',
-                'broker_name': 'Agent Name',
-                'broker_code': 'Agent Code',
-                'sum_insured': 'Total IDV',
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'Fuel Type',
-                'gvw': 'GROSS_VEHICLE_WEIGHT',
-                'seating_capacity': 'TOTAL_SEATING_CAPACITY',
-                'ncb_percentage': 'NCB_PERCENT',
-                'manufacturing_year': 'MFG Year',
-                'engine_cubic_capacity': 'CUBIC_CAPACITY',
-            },
-            'HDFC': {
-                'policy_number': 'Policy No',
-                'customer_name': 'Customer Name',
-                'policy_start_date': 'Start Date',
-                'policy_end_date': 'End Date',
-                'registration_number': 'POL_MOT_VEH_REGISTRATION_NUM',
-                'engine_number': 'ENGINE NUM',
-                'chassis_number': 'CHASSIS NUM',
-                'total_premium': 'Total GWP',
-                'tp_premium': 'TP',
-                'previous_policy_number': 'Previous Policy No',
-                'broker_name': 'Agent Name',
-                'broker_code': 'Agent Code',
-                'sum_insured': 'Sum Insured',
-                'vehicle_make': 'POL_MOT_MANUFACTURER_NAME',
-                'vehicle_model': 'POL_MOT_MODEL_NAME',
-                'fuel_type': 'POL_FUEL_TYPE',
-                'gvw': 'POL_GROSS_VEH_WT',
-                'seating_capacity': None,
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'POL_MOT_MANUFACTURER_YEAR',
-                'engine_cubic_capacity': None,
-            },
-            'IFFCO': {
-                'policy_number': 'P400 policy',
-                'customer_name': ['First Name', 'Last Name'],
-                'policy_start_date': 'Inceptiondate',
-                'policy_end_date': 'Expirydate',
-                'registration_number': 'Registration No',
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'Total Premium after discount/loading',
-                'tp_premium': 'TP Gross Premium',
-                'previous_policy_number': 'PreviousInsurerPolicy Number',
-                'broker_name': None,
-                'broker_code': 'AgentNo',
-                'sum_insured': 'Total Sum Insured',
-                'vehicle_make': 'Make',
-                'vehicle_model': 'Model',
-                'fuel_type': 'Fuel Type',
-                'gvw': 'GVW',
-                'seating_capacity': 'Carrying Capacity',
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'Year',
-                'engine_cubic_capacity': 'Cubic Capacity',
-            },
-            'KOTAK': {
-                'policy_number': 'POLICY NO',
-                'customer_name': 'CUSTOMER NAME',
-                'policy_start_date': 'POLICY INCEPTION DATE',
-                'policy_end_date': 'POLICY EXPIRY DATE',
-                'registration_number': 'Registration Number',
-                'engine_number': 'Engine Number',
-                'chassis_number': 'Chassis Number',
-                'total_premium': 'GWP',
-                'tp_premium': 'ALL OTHER TP COVER PREMIUM',
-                'previous_policy_number': None,
-                'broker_name': 'IMD NAME',
-                'broker_code': 'IMD CODE',
-                'sum_insured': 'SYSTEMIDV',
-                'vehicle_make': 'VehicleMake',
-                'vehicle_model': 'VehicleModel',
-                'fuel_type': 'FuelType',
-                'gvw': 'VehicleWeight',
-                'seating_capacity': None,
-                'ncb_percentage': 'NCB',
-                'manufacturing_year': 'ManufacturerYear',
-                'engine_cubic_capacity': 'VehicleCC',
-            },
-            'RAHEJA': {
-                'policy_number': 'P400 Pol No.',
-                'customer_name': 'CompanyName',
-                'policy_start_date': 'policy_start_date',
-                'policy_end_date': 'Expiry date',
-                'registration_number': 'reg_no',
-                'engine_number': 'engine_no',
-                'chassis_number': 'chasis_no',
-                'total_premium': 'final_premium',
-                'tp_premium': 'TP Premium',
-                'previous_policy_number': None,
-                'broker_name': 'IMD Name',
-                'broker_code': 'IMD Code',
-                'sum_insured': None,
-                'vehicle_make': None,
-                'vehicle_model': 'Sub_Product',
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-            'TATA': {
-                'policy_number': 'policy_no',
-                'customer_name': 'clientname',
-                'policy_start_date': 'pol_incept_date',
-                'policy_end_date': 'pol_exp_date',
-                'registration_number': 'registration_no',
-                'engine_number': 'veh_engine_no',
-                'chassis_number': 'veh_chassis_no',
-                'total_premium': 'total_premium',
-                'tp_premium': 'basictp',
-                'previous_policy_number': None,
-                'broker_name': 'producername',
-                'broker_code': 'producer_cd',
-                'sum_insured': 'vehicleidv',
-                'vehicle_make': 'veh_make',
-                'vehicle_model': 'veh_model',
-                'fuel_type': 'fuel_type',
-                'gvw': 'veh_gr_wgt_cnt',
-                'seating_capacity': 'seat_cap_cnt',
-                'ncb_percentage': 'ncb_perctg',
-                'manufacturing_year': 'mfg_year',
-                'engine_cubic_capacity': 'kw_cc_no',
-            },
-            'ZUNO': {
-                'policy_number': 'Policy_Number',
-                'customer_name': 'Policy_Holder_Name',
-                'policy_start_date': 'Policy_Start_Date',
-                'policy_end_date': 'Policy_End_Date',
-                'registration_number': 'Registration No',
-                'engine_number': 'Engine No',
-                'chassis_number': 'chasis No',
-                'total_premium': 'Gross_Premium_Total',
-                'tp_premium': 'Motor TP Premium',
-                'previous_policy_number': 'Previous_Policy_No',
-                'broker_name': 'Intermediary_Name',
-                'broker_code': 'Intermediary_Code',
-                'sum_insured': 'NUM_IDV',
-                'vehicle_make': 'Make Code',
-                'vehicle_model': 'Model Code',
-                'fuel_type': 'Type of Fuel',
-                'gvw': 'GVW',
-                'seating_capacity': 'Capacity Type',
-                'ncb_percentage': 'NCB_Percentage',
-                'manufacturing_year': 'Manufacturing Year',
-                'engine_cubic_capacity': 'Num_PCC CC',
-            },
-            'LIBERTY': {
-                'policy_number': 'Policy No.',
-                'customer_name': 'Insured Name',
-                'policy_start_date': 'Policy Start Date',
-                'policy_end_date': 'Policy End Date',
-                'registration_number': 'Veh Reg No',
-                'engine_number': 'Engine NO',
-                'chassis_number': 'Chassis NO',
-                'total_premium': 'Net Premium',
-                'tp_premium': 'Net TP Premium / War & SRCC',
-                'previous_policy_number': 'Previous Policy No.',
-                'broker_name': 'Agent/ Broker Name',
-                'broker_code': 'Agent/ Broker Code',
-                'sum_insured': 'Sum Insured',
-                'vehicle_make': 'Make Name',
-                'vehicle_model': 'Model Name',
-                'fuel_type': 'Fuel Type',
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': 'Current Year NCB (%)',
-                'manufacturing_year': None,
-                'engine_cubic_capacity': 'Cubic Capacity',
-            },
-            'ORIENTAL': {
-                'policy_number': 'POLICY NO',
-                'customer_name': None,
-                'policy_start_date': None,
-                'policy_end_date': None,
-                'registration_number': None,
-                'engine_number': None,
-                'chassis_number': None,
-                'total_premium': 'PREMIUM',
-                'tp_premium': None,
-                'previous_policy_number': None,
-                'broker_name': None,
-                'broker_code': None,
-                'sum_insured': None,
-                'vehicle_make': None,
-                'vehicle_model': None,
-                'fuel_type': None,
-                'gvw': None,
-                'seating_capacity': None,
-                'ncb_percentage': None,
-                'manufacturing_year': None,
-                'engine_cubic_capacity': None,
-            },
-        }
+        return {insurer: dict(fields) for insurer, fields in _COLUMN_MAPPINGS.items()}
 
     def save_mappings_to_config(self, e):
         """Save current mappings to a config file"""
@@ -5178,8 +5434,8 @@ class InsuranceValidationApp:
                 else:
                     self.comparator.column_mappings[insurer] = mappings
             
-            # Clear resolved mappings to force re-resolution
-            self.comparator.resolved_mappings.clear()
+            # Clear resolved mappings and the alias index to force re-resolution
+            self.comparator.invalidate_mappings()
             
             # Close and reopen dialog to refresh display
             self.close_mapping_dialog(e)
@@ -5191,8 +5447,8 @@ class InsuranceValidationApp:
             
             # Refresh selectable fields for the current insurer
             if self.insurer_dropdown.value:
-                self.update_field_options(None)
                 self.check_enable_run_button()
+                self.update_field_options(None)
             
         except Exception as ex:
             logger.error(f"Error loading mappings from config: {str(ex)}")
@@ -5282,6 +5538,10 @@ class InsuranceValidationApp:
 
 def main(page: ft.Page):
     """Main entry point for the Flet app"""
+    # Copy-on-write lets derived frames (e.g. the dashboard's working copy of the results)
+    # share column data until a column is reassigned; pandas 3 makes this the default
+    if int(pd.__version__.split('.')[0]) == 2:
+        pd.set_option('mode.copy_on_write', True)
     page.window_width = 1600
     page.window_height = 900
     app = InsuranceValidationApp(page)
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from idreconfinalfinal import InsuranceDataComparator
+
+
+class MissingPremiumColumnTest(unittest.TestCase):
+    """MIS files without the insurer's premium column still get a reverse check"""
+
+    def compare(self, insurer, mis_df):
+        internal_df = pd.DataFrame({
+            'Policy Number': ['P1'],
+            'Insurance Company': [insurer],
+            'Detected_Insurer': [insurer],
+        })
+        with InsuranceDataComparator() as comparator:
+            policy_col = comparator.column_mappings[insurer]['policy_number']
+            if isinstance(policy_col, list):
+                policy_col = policy_col[0]
+            mis_df = mis_df.rename(columns={'policy': policy_col})
+            results_df, _ = comparator.compare_datasets_async(internal_df, mis_df, insurer)
+        return results_df[results_df['Match Status'] == 'Not Found in Internal']
+
+    def test_missing_premium_column_gives_nan_premium(self):
+        for insurer in ('LIBERTY', 'NATIONAL', 'KOTAK', 'RAHEJA'):
+            with self.subTest(insurer=insurer):
+                unmatched = self.compare(insurer, pd.DataFrame({'policy': ['P1', 'P2', 'P3']}))
+                self.assertEqual(unmatched['Policy Number'].tolist(), ['P2', 'P3'])
+                self.assertTrue(np.isnan(unmatched['MIS Premium'].to_numpy(dtype=float)).all())
+
+    def test_present_premium_column_is_used(self):
+        premium_col = InsuranceDataComparator().column_mappings['LIBERTY']['total_premium']
+        mis_df = pd.DataFrame({'policy': ['P1', 'P2'], premium_col: ['100', '250.5']})
+        unmatched = self.compare('LIBERTY', mis_df)
+        self.assertEqual(unmatched['MIS Premium'].tolist(), [250.5])
+
+
+if __name__ == '__main__':
+    unittest.main()